@@ -14,17 +14,22 @@ import customtkinter
 import json
 import uuid
 import socket
-import pymongo
 from dotenv import load_dotenv
 import os
-from script.gesture_control import GestureControl
+import importlib
 import threading
 from script.modules.GestureAnimation import GestureAnimation
+from script.modules.config_store import ConfigStore, mongo_collection_factory
+from script.modules.config_service import CONFIG_PATH
 from PIL import Image, ImageTk
-import cv2
 
 load_dotenv()
 
+# The engine (MediaPipe, hand tracking) is imported in the background while the window is built;
+# the first ON toggle waits for it only if it hasn't finished yet
+threading.Thread(target=importlib.import_module, args=("script.gesture_control",), name="engine-preload", daemon=True).start()
+
+
 def get_unique_id():
     mac = uuid.UUID(int=uuid.getnode()).hex[-12:]
     hostname = socket.gethostname()
@@ -33,13 +38,16 @@ def get_unique_id():
 unique_id = get_unique_id()
 print(unique_id)
 
-client = pymongo.MongoClient(os.getenv("MONGODB.URI"))
-
-db = client["hci"]
-
-collection = db["user-config"]
-
-customGestureJson = collection.find_one({"_id": unique_id})
+# Config loads from the local file right away; MongoDB is reconciled in the background
+mongodb_uri = os.getenv("MONGODB.URI")
+config_store = ConfigStore(
+    CONFIG_PATH,
+    unique_id,
+    name=socket.gethostname(),
+    collection_factory=mongo_collection_factory(mongodb_uri) if mongodb_uri else None,
+)
+customGestureJson = config_store.load()
+config_store.start()
 
 f = open("resources\\appList.json", "r")
 data = json.load(f)
@@ -47,26 +55,6 @@ data = json.load(f)
 f = open("resources\\anim_data.json", "r")
 anim_data = json.load(f)
 
-if customGestureJson == None:
-    collection.insert_one(
-        {
-            "_id": unique_id,
-            "name": socket.gethostname(),
-            "userDefinedControls": {
-                "index": "null",
-                "index and middle": "null",
-                "index, middle and ring": "null",
-                "index, middle, ring and little": "null",
-                "thumb": "null",
-            },
-        }
-    )
-
-    customGestureJson = collection.find_one({"_id": unique_id})
-
-    with open("./script/modules/user_defined_data.json", "w") as f:
-        json.dump(customGestureJson, f)
-
 app = customtkinter.CTk()
 app.title("Smart Gesture-Controlled HCI System")
 app.geometry("1100x600")
@@ -137,47 +125,62 @@ video_update_id = None
 show_video_feed = False  # Track if video feed should be displayed
 
 
+preview_photo = None  # One PhotoImage for the whole session; new previews are pasted into it
+preview_unsubscribe = None  # Ends the video panel's preview subscription (None = not subscribed)
+preview_seq = 0  # Last preview shown, so an unchanged preview isn't pasted again
+state_version = None  # Engine state version the mode/action labels show
+
+
+def stopPreview():
+    global preview_unsubscribe, preview_seq
+    if preview_unsubscribe is not None:
+        preview_unsubscribe()
+        preview_unsubscribe = None
+    preview_seq = 0
+
+
 # Function to update video frame in GUI
 def update_video_frame():
-    global ges_con, is_running, video_update_id, show_video_feed
+    global ges_con, is_running, video_update_id, show_video_feed, preview_photo, preview_unsubscribe, preview_seq, state_version
     
-    if is_running and ges_con and hasattr(ges_con, 'current_frame') and ges_con.current_frame is not None:
+    if is_running and ges_con:
         try:
             # Only update video display if show_video_feed is True
             if show_video_feed:
-                # Get the processed frame from gesture control
-                frame = ges_con.current_frame.copy()
+                # The engine only produces previews while someone is subscribed
+                if preview_unsubscribe is None:
+                    preview_unsubscribe = ges_con.preview.subscribe()
                 
-                # Resize for display
-                frame = cv2.resize(frame, (480, 320))
-                
-                # Convert to RGB for tkinter
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                img = Image.fromarray(frame_rgb)
-                imgtk = ImageTk.PhotoImage(image=img)
-                
-                # Update label
-                video_label.configure(image=imgtk, text="")
-                video_label.image = imgtk
+                # Downscaled RGB frame published by the vision thread
+                preview = ges_con.preview.latest
+                if preview is not None and preview.seq != preview_seq:
+                    preview_seq = preview.seq
+                    if preview_photo is None:
+                        preview_photo = ImageTk.PhotoImage("RGB", ges_con.preview.size)
+                    preview_photo.paste(Image.fromarray(preview.image))
+                    if video_label.image is not preview_photo:
+                        video_label.configure(image=preview_photo, text="")
+                        video_label.image = preview_photo
             else:
+                stopPreview()
                 # Show message when video feed is off
                 video_label.configure(image="", text="Camera Feed OFF\n(Running in background)")
                 video_label.image = None
             
-            # Always update mode and action labels
-            if hasattr(ges_con, 'current_mode'):
-                mode_label.configure(text=ges_con.current_mode)
-            if hasattr(ges_con, 'current_action'):
-                action_label.configure(text=ges_con.current_action)
+            # Mode and action labels are only reconfigured when the engine published a new state
+            state = ges_con.state.changed_since(state_version)
+            if state is not None:
+                state_version = state.version
+                mode_label.configure(text=state.mode)
+                action_label.configure(text=state.action)
         except Exception as e:
             print(f"Error updating video frame: {e}")
         
         # Schedule next update (33ms for ~30 FPS)
         video_update_id = app.after(33, update_video_frame)
-    elif is_running:
-        # Still starting up, keep trying
-        video_update_id = app.after(100, update_video_frame)
     else:
+        stopPreview()
+        state_version = None
         # Reset video label when stopped
         video_label.configure(image="", text="Camera Feed\\n(Activate to start)")
         video_label.image = None
@@ -196,6 +199,7 @@ def launchGestureControl():
         return
     
     # Create new GestureControl instance and thread
+    from script.gesture_control import GestureControl
     ges_con = GestureControl(True)
     ges_con_thread = threading.Thread(target=ges_con.run)
     ges_con_thread.daemon = True  # Allow program to exit even if thread is running
@@ -205,11 +209,12 @@ def launchGestureControl():
 
 # Function to toggle gesture control
 def toggleGestureControl():
-    global is_running, ges_con, ges_con_thread, video_update_id
+    global is_running, ges_con, ges_con_thread, video_update_id, state_version
     
     if not is_running:
         # Start gesture control
         if not ges_con_thread or not ges_con_thread.is_alive():
+            from script.gesture_control import GestureControl
             ges_con = GestureControl(True)
             ges_con_thread = threading.Thread(target=ges_con.run)
             ges_con_thread.daemon = True
@@ -219,7 +224,8 @@ def toggleGestureControl():
             status_label.configure(text="● SYSTEM ACTIVE", text_color="#28a745")
             print("✓ Gesture control ACTIVATED")
             
-            # Start video frame updates
+            # Start video frame updates (labels follow the new engine's state versions)
+            state_version = None
             update_video_frame()
     else:
         # Stop gesture control
@@ -233,21 +239,18 @@ def toggleGestureControl():
                 video_update_id = None
             
             # Reset video display immediately
+            stopPreview()
             video_label.configure(image="", text="Camera Feed\n(Activate to start)")
             video_label.image = None
             
-            # Release camera
-            if hasattr(ges_con, 'cap') and ges_con.cap is not None:
-                ges_con.cap.release()
-                print("✓ Camera released")
+            # Stop the capture thread and release camera
+            ges_con.stop()
+            print("✓ Camera released")
             
             # Update UI
             toggle_switch.configure(text="OFF", fg_color="#dc3545", progress_color="#dc3545")
             status_label.configure(text="● SYSTEM INACTIVE", text_color="#dc3545")
             print("✗ Gesture control DEACTIVATED")
-            
-            # Clear the frame reference
-            ges_con.current_frame = None
 
 # Function to switch back to the first screen
 def backToMenuFrame():
@@ -289,17 +292,16 @@ def saveGestures(data):
             if not found:
                 userDefinedControls[gesture_name] = "null"
     
-    # Update database and JSON file
+    # Save to the local JSON file now; changed gestures are pushed to the database in the background
     if customGestureJson is not None:
         customGestureJson["userDefinedControls"] = userDefinedControls
-        collection.update_one({"_id": unique_id}, {"$set": customGestureJson})
-        
-        # Save to local JSON file
-        with open("./script/modules/user_defined_data.json", "w") as f:
-            json.dump(customGestureJson, f, indent=2)
+        changed = config_store.update_controls(userDefinedControls)
+        # A running engine picks up the new file right away instead of at its next poll
+        if changed and ges_con is not None:
+            ges_con.config.check()
         
         print(f"[DEBUG] Gestures saved successfully")
-        print(f"[DEBUG] Saved config: {userDefinedControls}")
+        print(f"[DEBUG] Changed gestures: {changed}")
 
 
 ############################################################################################################
@@ -629,6 +631,33 @@ if customGestureJson is not None:
             gesture5_dropdown.set(i["displayName"])
 gesture5_frame.pack_configure(anchor="center")
 
+gesture_dropdowns = {
+    "index": gesture1_dropdown,
+    "index and middle": gesture2_dropdown,
+    "index, middle and ring": gesture3_dropdown,
+    "index, middle, ring and little": gesture4_dropdown,
+    "thumb": gesture5_dropdown,
+}
+config_revision_shown = 0
+
+
+def pollRemoteConfig():
+    """Refresh the dropdowns when the background sync brought newer config from the database"""
+    global customGestureJson, config_revision_shown
+    if config_store.remote_revision != config_revision_shown:
+        config_revision_shown = config_store.remote_revision
+        customGestureJson = config_store.document
+        for gesture_name, dropdown in gesture_dropdowns.items():
+            selected = "Select"
+            for i in data:
+                if i["shellName"] == customGestureJson["userDefinedControls"].get(gesture_name):
+                    selected = i["displayName"]
+            dropdown.set(selected)
+    app.after(1000, pollRemoteConfig)
+
+
+pollRemoteConfig()
+
 
 # button to save gestures
 saveButton = customtkinter.CTkButton(
@@ -704,17 +733,28 @@ description_label.pack(pady=5, padx=20)
 
 
 # Function to update the GIFs based on the selected option
+def preloadNeighbourGifs(option):
+    """Decode the GIFs of the entries next to `option` in the dropdown in the background"""
+    index = options.index(option)
+    neighbours = [options[i] for i in (index - 1, index + 1) if 0 <= i < len(options)]
+    left_gif_label.preload([anim_data[name][side] for name in neighbours for side in ("left", "right")])
+
+
 def update_gifs(*_):
     try:
         option = selected_option.get()
         description_label.configure(text=anim_data[option]["description"])
         left_gif_label.update_gif(anim_data[option]["left"])
         right_gif_label.update_gif(anim_data[option]["right"])
+        preloadNeighbourGifs(option)
     except Exception as e:
         pass
 
 # Bind the update_gifs function to the dropdown selection
 selected_option.trace_add("write", update_gifs)
+# The selected entry and its neighbours are decoded before the tutorial is first opened
+left_gif_label.preload([anim_data[options[0]]["left"], anim_data[options[0]]["right"]])
+preloadNeighbourGifs(options[0])
 
 # Create a button to go back to the main menu
 back_button = customtkinter.CTkButton(
@@ -797,8 +837,8 @@ app.mainloop()
 
 # To be executed when the app is closed
 if ges_con and hasattr(ges_con, 'runFlag'):
-    ges_con.runFlag = False
+    ges_con.stop()
 if ges_con_thread and ges_con_thread.is_alive():
     ges_con_thread.join()
 
-client.close()
+config_store.stop()  # One last push of unsynced edits
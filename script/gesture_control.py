@@ -7,363 +7,354 @@ Email: rohanrony8431@gmail.com
 """
 
 import cv2
-import json
+import time
 from script.modules.tracker import HandTracker
-from script.modules.media_and_brightness_control import MediaControl
-from script.modules.app_control import AppControl
-from script.modules.browser_control import BrowserControl
-from script.modules.user_def_controls import UserDefControls
-from script.modules.mouse_control import MouseControl
-from script.modules.game_control import GameControl
-from script.modules.virtual_keyboard import VirtualKeyboard
+from script.modules.capture import FrameCapture, open_camera
+from script.modules.actuator import ActionDispatcher
+from script.modules.mode_registry import ModeRegistry
+from script.modules.gesture_tables import GESTURE_MASKS, GESTURE_NAMES, MODE_BY_MASK, mask_to_fingers
+from script.modules.idle_power import IdlePolicy, IdlePowerManager
+from script.modules.scheduler import Scheduler
+from script.modules.landmark_recording import LandmarkRecorder
+from script.modules.instrumentation import PipelineMetrics
+from script.modules.logger import log
+from script.modules.lazy_import import LazyImporter, ModePreloader
+from script.modules.config_service import ConfigService
+from script.modules.preview import PreviewPublisher
+from script.modules.engine_state import StatePublisher
+
+# Mode handlers (and the pyautogui / pynput / keyboard / win32 backends they import) are loaded when
+# their mode is first activated, or by the background preloader once the first frame is processed
+MODE_HANDLERS = {
+    "thumb": ("script.modules.media_and_brightness_control", "MediaControl"),
+    "thumb and index": ("script.modules.media_and_brightness_control", "MediaControl"),
+    "thumb, index and middle": ("script.modules.media_and_brightness_control", "MediaControl"),
+    "index": ("script.modules.app_control", "AppControl"),
+    "index and middle": ("script.modules.browser_control", "BrowserControl"),
+    "index, middle and ring": ("script.modules.mouse_control", "MouseControl"),
+    "index and little": ("script.modules.game_control", "GameControl"),
+    "all": ("script.modules.user_def_controls", "UserDefControls"),
+}
+KEYBOARD_GESTURE = "index, middle, ring and little"
+VIRTUAL_KEYBOARD = ("script.modules.virtual_keyboard", "VirtualKeyboard")
 
 
 class GestureControl:
-    def __init__(self, runFlag=True):
+    def __init__(self, runFlag=True, frame_source=None, idle_policy=None, dispatcher=None, clock=time.monotonic, record_path=None,
+                 instrument=True, metrics_port=None, show_keyboard=True, config=None, backends=None, crop_inference=False):
         self.prev_gesture = None
-        self.current_gesture = None
+        self.current_gesture = None  # Name of the confirmed left-hand gesture (display only)
+        self.current_mask = None  # Finger mask of the confirmed left-hand gesture
         self.mouse_control_active = False
         self.runFlag = runFlag
-        self.last_action_key = None  # Track last action performed
-        self.action_cooldown = 0  # Short cooldown between same actions
-        self.gesture_stability_counter = 0  # Counter for gesture stability
-        self.gesture_stability_threshold = 2  # Reduced to 2 frames for faster response
+        # Per-stage latency histograms and counters (no-op timers when instrument=False)
+        self.metrics = PipelineMetrics(enabled=instrument)
+        # Frame clock for every time budget below, ticked once per frame
+        self.scheduler = Scheduler(clock)
+        # Short cooldown between repeats of the same action (keyed by (mode, right-hand mask))
+        self.action_cooldown = self.scheduler.cooldown(650)
+        # Left-hand gesture must hold across two consecutive classifications (~100 ms apart)
+        self.gesture_stability = self.scheduler.stability(80)
         self.last_right_hand_gesture = None  # Track right hand gesture for stability
-        self.temp_gesture = None  # Track temporary detected gesture
-        self.media_control_instance = None  # Persistent media control instance
-        self.current_frame = None  # Store current frame for GUI display
+        # Downscaled RGB frames for the GUI video panel, produced only while the panel subscribes
+        self.preview = PreviewPublisher()
         self.current_mode = "Standby"  # Current mode name
         self.current_action = "Waiting for gesture..."  # Current action description
-        self.virtual_keyboard = None  # Virtual keyboard instance
+        # Immutable, versioned copy of the fields above for the GUI and other threads
+        self.state = StatePublisher()
+        self.virtual_keyboard = None  # Virtual keyboard instance, built when keyboard mode is first selected
+        self.imports = LazyImporter()  # Lazily imported mode modules and what each import cost
+        self.preloader = None  # Imports the remaining mode modules in the background after the first frame
+        self.modes = None  # ModeRegistry: one persistent handler per left-hand mode
+        self.active_spec = None  # ModeSpec of the confirmed left-hand gesture (None = no mode)
+        self.active_handler = None  # Handler of the active mode, built once by the registry
+        self.frame_source = frame_source  # Injectable camera source (anything with read()), defaults to the webcam
+        self.cap = None  # Camera source in use
+        self.capture = None  # Latest-frame capture stage
+        # Actuator worker for OS side effects (keys, mouse, app launches); replay passes a RecordingDispatcher
+        self.dispatcher = dispatcher if dispatcher is not None else ActionDispatcher(metrics=self.metrics)
+        # Low-rate, low-resolution probing while no hands are in view (IdlePolicy or a config dict)
+        if not isinstance(idle_policy, IdlePolicy):
+            idle_policy = IdlePolicy.from_dict(idle_policy)
+        self.idle_power = IdlePowerManager(idle_policy)
+        self.hands_detected = False  # Hands were in view on the last processed frame
+        self.record_path = record_path  # Record per-frame landmarks to this file while running (LandmarkRecorder)
+        # Opt-in localhost Prometheus/JSON endpoint, served while run() is active
+        self.exporter = None
+        if metrics_port is not None:
+            from script.modules.metrics_exporter import MetricsExporter  # http.server is only imported when asked for
 
-    def detect_gesture(self, raised_fingers):
-        gestures = {
-            (0, 0, 0, 0, 1): "thumb",
-            (1, 0, 0, 0, 0): "little",
-            (0, 0, 0, 1, 1): "thumb and index",
-            (0, 0, 1, 1, 1): "thumb, index and middle",
-            (0, 1, 1, 1, 1): "thumb, index, middle and ring",
-            (0, 0, 0, 1, 0): "index",
-            (0, 0, 1, 1, 0): "index and middle",
-            (0, 1, 1, 1, 0): "index, middle and ring",
-            (1, 1, 1, 1, 0): "index, middle, ring and little",
-            (1, 0, 0, 1, 0): "index and little",  # Fixed: [little, ring, middle, index, thumb]
-            (1, 1, 1, 1, 1): "all",
-        }
-        return gestures.get(tuple(raised_fingers))
+            self.exporter = MetricsExporter(self, port=metrics_port)
+        self.show_keyboard = show_keyboard  # False for headless runs: no OpenCV windows at all
+        # Parsed once and shared by every handler; run() watches the file and swaps in new snapshots
+        self.config = config if config is not None else ConfigService()
+        self.config.subscribe(self.on_config_change)
+        # OS input libraries handed to every mode handler; None = the real ones, replay passes StubBackends
+        self.backends = backends
+        self.crop_inference = crop_inference  # Opt-in ROI-cropped hand inference (HandTracker crop_inference)
+
+    def select_mode(self, mask):
+        """Confirm a stable left-hand finger mask and switch to its mode (if it has one)"""
+        self.current_mask = mask
+        self.current_gesture = GESTURE_NAMES[mask]
+        log.info("mode", "✓ [STABLE] Left hand gesture confirmed: %s", self.current_gesture)
+        self.action_cooldown.reset()  # Reset when gesture changes
+        # Run deactivate/activate hooks (e.g. close keyboard, reset mouse smoothing)
+        self.active_handler = self.modes.activate(mask)
+        self.active_spec = MODE_BY_MASK[mask]
+        
+        # Update mode immediately when left hand gesture is confirmed
+        if self.active_spec is not None:
+            self.current_mode = self.active_spec.label
+            self.current_action = self.active_spec.default_action
     
     def get_keyboard_target_app(self):
-        """Load the target app name for keyboard gesture from user_defined_data.json"""
-        try:
-            with open("./script/modules/user_defined_data.json", "r") as file:
-                data = json.load(file)
-                # Get the app configured for "index, middle, ring and little" gesture (keyboard)
-                keyboard_gesture_config = data.get("userDefinedControls", {}).get("index, middle, ring and little")
-                
-                if keyboard_gesture_config and keyboard_gesture_config != "null":
-                    # keyboard_gesture_config is a shellName array like ["notepad.exe"]
-                    # Extract display name from the first shell command
-                    if isinstance(keyboard_gesture_config, list) and len(keyboard_gesture_config) > 0:
-                        shell_name = keyboard_gesture_config[0]
-                        # Extract app name from shell command (e.g., "notepad.exe" -> "notepad")
-                        # or from path like "C:\\...\\app.exe" -> "app"
-                        if "\\" in shell_name or "/" in shell_name:
-                            app_name = shell_name.split("\\")[-1].split("/")[-1]
-                        else:
-                            app_name = shell_name
-                        
-                        # Remove .exe extension if present
-                        if app_name.lower().endswith(".exe"):
-                            app_name = app_name[:-4]
-                        
-                        print(f"✓ Keyboard will focus app: {app_name}")
-                        return app_name
-                    
-                print("⚠ No app configured for keyboard gesture")
-                return None
-        except Exception as e:
-            print(f"⚠ Error loading keyboard target app: {e}")
-            return None
-    
+        """Target app name for the keyboard gesture, from the cached config snapshot"""
+        app_name = self.config.snapshot.keyboard_target_app
+        if app_name:
+            log.info("keyboard", "✓ Keyboard will focus app: %s", app_name)
+        else:
+            log.warning("keyboard", "⚠ No app configured for keyboard gesture")
+        return app_name
 
-    def run(self):
-        self.cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)  # CAP_DSHOW for faster Windows camera init
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-        self.cap.set(cv2.CAP_PROP_FPS, 30)  # Set FPS for better performance
-        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Reduce buffer for lower latency
-        self.hand_tracker = HandTracker()
-        self.media_control_instance = MediaControl(self.hand_tracker)  # Create persistent instance
-        
+    def on_config_change(self, old, new):
+        """Config subscriber: point an already built keyboard at the newly configured app"""
+        if self.virtual_keyboard is not None and new.keyboard_target_app != old.keyboard_target_app:
+            self.virtual_keyboard.set_target_app(new.keyboard_target_app)
+
+    def capture_stats(self):
+        """Captured / consumed / dropped frame counters of the capture stage"""
+        if self.capture is None:
+            return {"frames_captured": 0, "frames_consumed": 0, "frames_dropped": 0}
+        return self.capture.stats()
+
+    def metrics_snapshot(self):
+        """Stage latency histograms, pipeline counters, capture drops and actuator metrics"""
+        snapshot = self.metrics.snapshot()
+        snapshot["capture"] = self.capture_stats()
+        snapshot["actuator"] = self.dispatcher.metrics()
+        return snapshot
+
+    def idle_stats(self):
+        """Time in active/idle state, CPU time per state and inference work saved"""
+        return self.idle_power.stats()
+
+    def stop(self):
+        """Stop the engine loop and release the camera"""
+        self.runFlag = False
+        self.config.stop()
+        if self.exporter is not None:
+            self.exporter.stop()
+        if self.capture is not None:
+            self.capture.stop()
+        self.dispatcher.stop(drain=False)
+
+    def handler_factory(self, module_name, class_name, **kwargs):
+        """Factory importing the handler's module on first use"""
+        return lambda: self.imports.attribute(module_name, class_name)(self.hand_tracker, self.dispatcher, **kwargs)
+
+    def build_virtual_keyboard(self):
         # Get target app for keyboard and initialize virtual keyboard with it
         keyboard_target_app = self.get_keyboard_target_app()
-        self.virtual_keyboard = VirtualKeyboard(self.hand_tracker, keyboard_target_app)  # Initialize virtual keyboard with target app
-        print("✓ Camera initialized - Show your hands to the camera")
-        hands_detected = False
-        
-        while True:
-            success, frame = self.cap.read()
-            if not success or not self.runFlag:
-                exit(0)
-            frame = cv2.flip(frame, 1)
-            
-            # Store frame for GUI display
-            self.current_frame = frame.copy()
-            
-            results = self.hand_tracker.hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-            if results.multi_hand_landmarks:
-                if not hands_detected:
-                    print("✓ Hands detected! Processing gestures...")
-                    hands_detected = True
-                    
-                # Decrease action cooldown counter
-                if self.action_cooldown > 0:
-                    self.action_cooldown -= 1
-                
-                for idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
-                    # Get correct handedness for each hand
-                    handedness = results.multi_handedness[idx].classification[0].label
-                    raised_fingers = self.hand_tracker.detect_raised_fingers(
-                        hand_landmarks, handedness.lower(), self.mouse_control_active
-                    )
-                    
-                    # LEFT HAND: Gesture detection (stable)
-                    if handedness.lower() == "left" and raised_fingers is not None:
-                        detected_gesture = self.detect_gesture(raised_fingers)
-                        
-                        # Debug: Show what's detected
-                        if detected_gesture:
-                            print(f"[DETECT] Left hand: {raised_fingers} → {detected_gesture}")
-                        
-                        # Check if gesture changed
-                        if detected_gesture != self.temp_gesture:
-                            self.temp_gesture = detected_gesture
-                            self.gesture_stability_counter = 1  # Start counting for stability
-                        else:
-                            self.gesture_stability_counter += 1
-                        
-                        # Only update current gesture if stable for threshold frames
-                        if self.gesture_stability_counter >= self.gesture_stability_threshold:
-                            if detected_gesture and detected_gesture != self.current_gesture:
-                                self.current_gesture = detected_gesture
-                                print(f"✓ [STABLE] Left hand gesture confirmed: {self.current_gesture}")
-                                self.last_action_key = None  # Reset when gesture changes
-                                self.action_cooldown = 0
-                                
-                                # Update mode immediately when left hand gesture is confirmed
-                                if self.current_gesture == "thumb":
-                                    self.current_mode = "Volume Control"
-                                    self.current_action = "Pinch: Decrease | Expand: Increase"
-                                elif self.current_gesture == "thumb and index":
-                                    self.current_mode = "Brightness Control"
-                                    self.current_action = "Pinch: Decrease | Expand: Increase"
-                                elif self.current_gesture == "thumb, index and middle":
-                                    self.current_mode = "Media Control"
-                                    self.current_action = "Thumb: Previous | Little: Next | All: Play/Pause"
-                                elif self.current_gesture == "index":
-                                    self.current_mode = "Window Control"
-                                    self.current_action = "Little: Next | Thumb: Previous | All: Desktop"
-                                elif self.current_gesture == "index and middle":
-                                    self.current_mode = "Browser Control"
-                                    self.current_action = "Thumb: Previous | Little: Next | All: Close"
-                                elif self.current_gesture == "index, middle and ring":
-                                    self.current_mode = "Mouse Control"
-                                    self.current_action = "Index+Middle: Move | Index: Click"
-                                elif self.current_gesture == "index and little":
-                                    self.current_mode = "Game Control"
-                                    self.current_action = "Index: Jump | Thumb: Left | Little: Right"
-                                elif self.current_gesture == "index, middle, ring and little":
-                                    self.current_mode = "Virtual Keyboard"
-                                    self.current_action = "Point & Pinch to Type"
-                                elif self.current_gesture == "all":
-                                    self.current_mode = "Custom App Launch"
-                                    self.current_action = "Index: App1 | Index+Middle: App2 | etc."
+        keyboard_class = self.imports.attribute(*VIRTUAL_KEYBOARD)
+        self.virtual_keyboard = keyboard_class(
+            self.hand_tracker, keyboard_target_app, self.dispatcher, show_window=self.show_keyboard, backends=self.backends
+        )
+        return self.virtual_keyboard
 
-                    # RIGHT HAND: Execute controls based on left hand gesture
-                    if handedness.lower() == "right" and raised_fingers is not None:
-                        # Debug output
-                        if self.current_gesture:
-                            print(f"[RIGHT] Fingers: {raised_fingers} | Mode: {self.current_gesture}")
-                        
-                        # Also stabilize right hand gesture
-                        right_hand_gesture = str(raised_fingers)
-                        if right_hand_gesture != self.last_right_hand_gesture:
-                            self.last_right_hand_gesture = right_hand_gesture
-                        
-                        action_key = f"{self.current_gesture}_{raised_fingers}"
-                        
-                        # Check if we should execute (different action OR cooldown expired)
-                        can_execute = (action_key != self.last_action_key) or (self.action_cooldown == 0)
-                        
-                        # volume control, left gesture: thumb (continuous, no cooldown)
-                        if self.current_gesture == "thumb":
-                            self.current_mode = "Volume Control"
-                            self.current_action = "Pinch: Decrease | Expand: Increase"
-                            volume_control = MediaControl(self.hand_tracker)
-                            volume_control.control_volume(frame)
+    def build_mode_registry(self):
+        """Handler factories keyed by left-hand finger mask; each handler is built once, on first use"""
+        factories = {
+            GESTURE_MASKS[gesture]: self.handler_factory(*handler, backends=self.backends) for gesture, handler in MODE_HANDLERS.items()
+        }
+        factories[GESTURE_MASKS["all"]] = self.handler_factory(*MODE_HANDLERS["all"], config=self.config)
+        factories[GESTURE_MASKS[KEYBOARD_GESTURE]] = self.build_virtual_keyboard
+        return ModeRegistry(factories)
 
-                        # brightness control, left gesture: thumb and index (continuous, no cooldown)
-                        elif self.current_gesture == "thumb and index":
-                            self.current_mode = "Brightness Control"
-                            self.current_action = "Pinch: Decrease | Expand: Increase"
-                            brightness_control = MediaControl(self.hand_tracker)
-                            brightness_control.control_brightness(frame)
+    def preload_modes(self):
+        """Import every mode module on a background thread (started once the first frame is processed)"""
+        if self.preloader is None:
+            modules = dict.fromkeys([module for module, _ in MODE_HANDLERS.values()] + [VIRTUAL_KEYBOARD[0]])
+            self.preloader = ModePreloader(self.imports, modules)
+            self.preloader.start()
+        return self.preloader
 
-                        # media control, left gesture: thumb, index and middle (no can_execute check - needs continuous calls for buffering)
-                        elif self.current_gesture == "thumb, index and middle":
-                            self.current_mode = "Media Control"
-                            # Update action based on right hand gesture
-                            if raised_fingers == [1, 0, 0, 0, 0]:
-                                self.current_action = "Previous Track"
-                            elif raised_fingers == [0, 0, 0, 0, 1]:
-                                self.current_action = "Next Track"
-                            elif raised_fingers == [1, 1, 1, 1, 1]:
-                                self.current_action = "Play/Pause"
-                            elif raised_fingers == [0, 1, 1, 1, 0]:
-                                self.current_action = "Mute/Unmute"
-                            else:
-                                self.current_action = "Thumb: Previous | Little: Next | All: Play/Pause"
-                            self.media_control_instance.control_media(raised_fingers)
-                            # Note: media_control handles its own cooldown/repeat prevention internally
-                        
-                        # Virtual keyboard, left gesture: index, middle, ring and little
-                        elif self.current_gesture == "index, middle, ring and little":
-                            self.current_mode = "Virtual Keyboard"
-                            self.current_action = "Point & Pinch to Type"
-                            # Process keyboard with right hand - pass results for hand detection
-                            frame = self.virtual_keyboard.process(frame, results)
+    def import_stats(self):
+        """Cumulative import time and module count of every lazily imported mode module"""
+        return self.imports.stats()
 
-                        # app control (window switching), left gesture: index
-                        elif self.current_gesture == "index" and can_execute:
-                            self.current_mode = "Window Control"
-                            # Update action based on right hand gesture
-                            if raised_fingers == [0, 0, 0, 0, 1]:
-                                self.current_action = "Switch Window Forward"
-                            elif raised_fingers == [1, 0, 0, 0, 0]:
-                                self.current_action = "Switch Window Backward"
-                            elif raised_fingers == [1, 1, 1, 1, 1]:
-                                self.current_action = "Show Desktop"
-                            elif raised_fingers == [0, 0, 0, 1, 1]:
-                                self.current_action = "Close Window (Alt+F4)"
-                            elif raised_fingers == [0, 1, 0, 0, 1]:
-                                self.current_action = "Switch Within App"
-                            elif raised_fingers == [0, 1, 1, 1, 1]:
-                                self.current_action = "Close Current Tab (Ctrl+W)"
-                            else:
-                                self.current_action = "Little: Next | Thumb: Previous | All: Desktop"
-                            app_control = AppControl(self.hand_tracker)
-                            app_control.window_nav(raised_fingers)
-                            self.last_action_key = action_key
-                            self.action_cooldown = 20  # Short cooldown
+    def setup(self, hand_tracker=None, show_keyboard=None):
+        """Build the hand tracker and mode registry (shared by run() and landmark replay)"""
+        self.hand_tracker = hand_tracker if hand_tracker is not None else HandTracker(
+            crop_inference=self.crop_inference, scheduler=self.scheduler, metrics=self.metrics
+        )
+        if show_keyboard is not None:
+            self.show_keyboard = show_keyboard
+        self.config.check()
+        self.modes = self.build_mode_registry()
 
-                        # browser control, left gesture: index and middle
-                        elif self.current_gesture == "index and middle" and can_execute:
-                            self.current_mode = "Browser Control"
-                            # Update action based on right hand gesture
-                            if raised_fingers == [1, 0, 0, 0, 0]:
-                                self.current_action = "Previous Tab"
-                            elif raised_fingers == [0, 0, 0, 0, 1]:
-                                self.current_action = "Next Tab"
-                            elif raised_fingers == [1, 1, 1, 1, 1]:
-                                self.current_action = "Close Tab"
-                            elif raised_fingers == [0, 0, 0, 1, 1]:
-                                self.current_action = "New Tab"
-                            elif raised_fingers == [0, 1, 0, 0, 1]:
-                                self.current_action = "Reopen Last Tab"
-                            elif raised_fingers == [0, 1, 1, 1, 1]:
-                                self.current_action = "New Window"
-                            else:
-                                self.current_action = "Thumb: Previous | Little: Next | All: Close"
-                            browser_control = BrowserControl(self.hand_tracker)
-                            browser_control.tab_nav(raised_fingers)
-                            self.last_action_key = action_key
-                            self.action_cooldown = 20  # Short cooldown to prevent accidental repeats
+    def process_observation(self, observation, frame):
+        """Gesture classification and mode dispatch for one inferred frame.
 
-                        # mouse control, left gesture: index, middle and ring
-                        elif self.current_gesture == "index, middle and ring":
-                            self.current_mode = "Mouse Control"
-                            # Update action based on right hand gesture
-                            if raised_fingers == [0, 1, 1, 0, 0]:
-                                self.current_action = "Moving Cursor"
-                            elif raised_fingers == [0, 0, 0, 1, 0]:
-                                self.current_action = "Left Click"
-                            elif raised_fingers == [0, 1, 0, 0, 0]:
-                                self.current_action = "Right Click"
-                            elif raised_fingers == [1, 1, 1, 1, 1]:
-                                self.current_action = "Scroll Down"
-                            elif raised_fingers == [0, 1, 1, 1, 1]:
-                                self.current_action = "Scroll Up"
-                            else:
-                                self.current_action = "Index+Middle: Move | Index: Click"
-                            self.mouse_control_active = True
-                            mouse_control = MouseControl(self.hand_tracker)
-                            mouse_control.control_mouse(raised_fingers, frame)
-
-                        # game control, left gesture: index and little (instant, no cooldown like game-simulator-lite)
-                        elif self.current_gesture == "index and little":
-                            self.current_mode = "Game Control"
-                            # Update action based on right hand gesture
-                            if raised_fingers == [0, 1, 0, 0, 0]:
-                                self.current_action = "Jump/Forward (↑)"
-                            elif raised_fingers == [0, 1, 1, 0, 0]:
-                                self.current_action = "Slide/Down (↓)"
-                            elif raised_fingers == [1, 0, 0, 0, 0]:
-                                self.current_action = "Move Left (←)"
-                            elif raised_fingers == [0, 0, 0, 0, 1]:
-                                self.current_action = "Move Right (→)"
-                            elif raised_fingers == [1, 1, 0, 0, 0]:
-                                self.current_action = "Action (Space)"
-                            else:
-                                self.current_action = "Index: Jump | Thumb: Left | Little: Right"
-                            game_control = GameControl(self.hand_tracker)
-                            game_control.game_nav(raised_fingers)
+        The scheduler must already be ticked for this frame. Returns the frame
+        (annotated by the virtual keyboard when it is active).
+        """
+        metrics = self.metrics
+        if observation:
+            metrics.count("frames_with_hands")
+            metrics.count("hands_detected", len(observation.hands))
+            if not self.hands_detected:
+                log.info("hands", "✓ Hands detected! Processing gestures...")
+                self.hands_detected = True
+                
+            # Both hands are classified together on the (N, 21, 3) landmark batch
+            with metrics.timer("classify"):
+                all_masks = self.hand_tracker.classify_hands(observation, self.mouse_control_active)
+            for hand, mask in zip(observation.hands, all_masks):
+                handedness = hand.handedness
+                
+                # LEFT HAND: Gesture detection (stable)
+                if handedness == "left" and mask is not None:
+                    # The mask indexes the gesture tables directly; unmapped masks all count as "no gesture"
+                    detected = mask if GESTURE_NAMES[mask] else None
+                    
+                    # Debug: Show what's detected (at most twice a second)
+                    if detected is not None:
+                        log.debug("detect", "[DETECT] Left hand: %s → %s", format(mask, "05b"), GESTURE_NAMES[detected], every=0.5)
+                    
+                    # Only update current gesture once it has held for the stability window
+                    if self.gesture_stability.update(detected):
+                        if detected is not None and detected != self.current_mask:
+                            self.select_mode(detected)
 
-                        # user defined controls, left gesture: all
-                        elif self.current_gesture == "all" and can_execute:
-                            self.current_mode = "Custom App Launch"
-                            # Update action based on right hand gesture
-                            if raised_fingers == [0, 1, 0, 0, 0]:
-                                self.current_action = "Launch App 1"
-                            elif raised_fingers == [0, 1, 1, 0, 0]:
-                                self.current_action = "Launch App 2"
-                            elif raised_fingers == [0, 1, 1, 1, 0]:
-                                self.current_action = "Launch App 3"
-                            elif raised_fingers == [0, 1, 1, 1, 1]:
-                                self.current_action = "Launch App 4"
-                            elif raised_fingers == [1, 0, 0, 0, 0]:
-                                self.current_action = "Launch App 5"
-                            else:
-                                self.current_action = "Index: App1 | Index+Middle: App2 | etc."
-                            user_def_controls = UserDefControls(self.hand_tracker)
-                            user_def_controls.user_controls(raised_fingers)
-                            self.last_action_key = action_key
-                            self.action_cooldown = 20  # Short cooldown
+                # RIGHT HAND: Execute controls based on left hand gesture
+                if handedness == "right" and mask is not None:
+                    # Debug output
+                    if self.current_gesture:
+                        log.debug("right", "[RIGHT] Fingers: %s | Mode: %s", format(mask, "05b"), self.current_gesture, every=0.5)
+                    
+                    spec = self.active_spec
+                    if spec is not None:
+                        right_mask = mask
+                        action_key = (spec.mask, right_mask)
                         
+                        # Check if we should execute (different action OR cooldown expired)
+                        can_execute = self.action_cooldown.ready(action_key)
+                        
+                        if can_execute or not spec.needs_cooldown:
+                            self.current_mode = spec.label
+                            self.current_action = spec.action_labels[right_mask]
+                            self.mouse_control_active = spec.mouse_mode
+                            submitted = self.dispatcher.submitted
+                            with metrics.timer("dispatch"):
+                                # Handlers still take the finger list; it is only built for the hand that acts
+                                result = spec.invoke(self.active_handler, mask_to_fingers(right_mask), frame, observation)
+                            metrics.count_actions(spec.label, self.dispatcher.submitted - submitted)
+                            if spec.returns_frame:
+                                frame = result
+                            if spec.needs_cooldown:
+                                self.action_cooldown.start(action_key)  # Short cooldown to prevent accidental repeats
+                    else:
                         # Reset mouse control for other gestures
-                        if self.current_gesture != "index, middle and ring":
-                            self.mouse_control_active = False
-                
-                # Close keyboard when switching away from keyboard mode
-                if self.current_gesture != "index, middle, ring and little" and self.virtual_keyboard.window_created:
-                    self.virtual_keyboard.close_keyboard_window()
-            else:
-                # Reset when no hands detected
-                if hands_detected:
-                    hands_detected = False
-                    print("⚠ No hands detected - show hands to camera")
-                self.mouse_control_active = False
-                # Don't reset mode - it should persist until user selects a different mode
-                # Only show action hint when hands are not detected
-                if self.current_mode != "Standby":
-                    self.current_action = "Show hands to continue..."
+                        self.mouse_control_active = False
+        else:
+            # Reset when no hands detected
+            if self.hands_detected:
+                self.hands_detected = False
+                log.info("hands", "⚠ No hands detected - show hands to camera")
+            self.mouse_control_active = False
+            # Don't reset mode - it should persist until user selects a different mode
+            # Only show action hint when hands are not detected
+            if self.current_mode != "Standby":
+                self.current_action = "Show hands to continue..."
+
+        self.publish_state()
+        return frame
 
-            if not self.mouse_control_active:
-                self.hand_tracker.frame_counter += 1
+    def publish_state(self):
+        """Publish a new engine state version if anything the GUI shows changed"""
+        return self.state.publish(
+            mode=self.current_mode,
+            action=self.current_action,
+            gesture=self.current_gesture,
+            hands_detected=self.hands_detected,
+            idle=self.idle_power.idle,
+        )
+
+    def run(self):
+        self.cap = self.frame_source if self.frame_source is not None else open_camera()
+        self.capture = FrameCapture(self.cap)
+        self.capture.start()
+        self.dispatcher.start()
+        self.setup()
+        self.config.start()
+        if self.exporter is not None:
+            self.exporter.start()
+        recorder = None
+        print("✓ Camera initialized - Show your hands to the camera")
+        
+        last_seq = 0
+        metrics = self.metrics
+        
+        while self.runFlag:
+            # While idle, only probe at the idle rate; frames in between are left to the capture thread
+            delay = self.idle_power.probe_delay()
+            if delay > 0:
+                time.sleep(delay)
+            
+            # Always take the freshest frame; stale ones are dropped by the capture thread
+            with metrics.timer("capture_wait"):
+                captured = self.capture.read(timeout=1.0)
+            if captured is None:
+                if self.capture.ended or not self.runFlag:
+                    break
+                continue
+            if self.idle_power.idle:
+                self.idle_power.skip(captured.seq - last_seq - 1)
+            last_seq = captured.seq
+            self.scheduler.tick()
+            frame_start = metrics.clock()
+            metrics.record("frame_age", time.monotonic() - captured.timestamp)  # camera read -> processing
+            metrics.count("frames")
+            with metrics.timer("flip"):
+                frame = cv2.flip(captured.frame, 1)
+            
+            # Preview for the GUI (a no-op unless the video panel is subscribed)
+            with metrics.timer("preview"):
+                self.preview.publish(frame)
+            
+            # Landmarks are only used on classification frames (every frame in mouse mode),
+            # so frames in between skip inference instead of discarding its result
+            if not self.hand_tracker.classification_due(self.mouse_control_active):
+                continue
+            
+            # Single landmark inference per frame, shared by every mode handler
+            observation = self.hand_tracker.observe(frame, self.idle_power.inference_scale)
+            # A probe that finds a hand switches back to full rate and resolution for the next frame
+            self.idle_power.update(bool(observation))
+            if self.record_path:
+                if recorder is None:
+                    recorder = LandmarkRecorder(self.record_path, frame.shape[1], frame.shape[0])
+                recorder.record(observation, captured.timestamp)
+            frame = self.process_observation(observation, frame)
+            if self.preloader is None:
+                self.preload_modes()  # The camera and model are warm - load the other modes off the frame loop
+            metrics.count("frames_inferred")
+            metrics.record("frame", metrics.clock() - frame_start)
 
             # No longer display cv2 window - GUI will handle display
             # cv2.imshow("Frame", frame)
-            if cv2.waitKey(1) & 0xFF == ord("q"):
+            # waitKey pumps the keyboard window's events; headless runs have no window to pump
+            if self.show_keyboard and cv2.waitKey(1) & 0xFF == ord("q"):
                 break
 
-        self.cap.release()
+        self.modes.deactivate_all()
+        if recorder is not None:
+            recorder.close()
+            print(f"✓ Recorded {recorder.frames_recorded} frames to {self.record_path}")
+        self.capture.stop()
+        self.dispatcher.stop()
+        self.config.stop()
+        if self.exporter is not None:
+            self.exporter.stop()
         # cv2.destroyAllWindows()  # Not needed since we don't create windows
\ No newline at end of file
@@ -0,0 +1,191 @@
+"""
+Headless Engine - Run the gesture engine as a service, without the GUI
+
+main.py builds the customtkinter UI, connects to MongoDB and loads the
+tutorial GIFs before the engine processes a single frame. This entry point
+only imports the engine. It runs GestureControl straight from the camera,
+or runs recorded landmark sessions through it, with no windows open.
+
+Settings come from an optional JSON config file. Command-line options
+override it:
+
+    {
+        "camera": 0,
+        "duration": null,
+        "log_level": "info",
+        "metrics_port": 9464,
+        "metrics_out": "metrics.json",
+        "record_path": null,
+        "instrument": true,
+        "crop_inference": false,
+        "idle": {"enabled": true, "idle_after": 5, "idle_fps": 5, "idle_scale": 0.5}
+    }
+
+Usage (from the repository root):
+    python -m script.headless --camera 0 --metrics-port 9464
+    python -m script.headless --config kiosk.json --duration 3600 --metrics-out metrics.json
+    python -m script.headless --replay recordings/*.gclm --metrics-out metrics.json
+"""
+
+import time
+
+_STARTED = time.perf_counter()  # Startup time includes importing the engine
+
+import argparse
+import json
+import signal
+import sys
+import threading
+
+from script.gesture_control import GestureControl
+from script.modules.idle_power import IdlePolicy
+from script.modules.logger import log
+
+DEFAULTS = {
+    "camera": 0,
+    "duration": None,  # Seconds to run (recorded seconds per session for replays); None = until stopped
+    "log_level": "info",
+    "metrics_port": None,  # Serve /metrics on localhost:PORT while running
+    "metrics_out": None,  # Write the final metrics snapshot (JSON) to this file
+    "record_path": None,
+    "instrument": True,
+    "crop_inference": False,  # Opt-in ROI-cropped inference; slower on the benchmark clip so far
+    "idle": {},
+}
+
+
+def load_config(path=None, overrides=None):
+    """DEFAULTS, updated from the JSON config file at path, then from overrides (None values are ignored)"""
+    config = dict(DEFAULTS)
+    if path:
+        with open(path, "r") as file:
+            data = json.load(file)
+        if not isinstance(data, dict):
+            raise ValueError(f"{path}: the config must be a JSON object")
+        unknown = sorted(set(data) - set(DEFAULTS))
+        if unknown:
+            log.warning("config", "⚠ Ignoring unknown config keys in %s: %s", path, ", ".join(unknown))
+        config.update((key, value) for key, value in data.items() if key in DEFAULTS)
+    for key, value in (overrides or {}).items():
+        if value is not None:
+            config[key] = value
+    return config
+
+
+def write_metrics(path, snapshot):
+    with open(path, "w") as file:
+        json.dump(snapshot, file, indent=2)
+    log.info("metrics_out", "✓ Metrics written to %s", path)
+
+
+def run_camera(config):
+    """Run the live engine until the duration ends, SIGINT/SIGTERM, or the camera stops"""
+    from script.modules.capture import open_camera
+
+    engine = GestureControl(
+        frame_source=open_camera(config["camera"]),
+        idle_policy=IdlePolicy.from_dict(config["idle"]),
+        record_path=config["record_path"],
+        instrument=config["instrument"],
+        metrics_port=config["metrics_port"],
+        show_keyboard=False,
+        crop_inference=config["crop_inference"],
+    )
+
+    def request_stop(*_):
+        engine.runFlag = False  # The loop notices within one capture timeout
+
+    signal.signal(signal.SIGINT, request_stop)
+    if hasattr(signal, "SIGTERM"):
+        signal.signal(signal.SIGTERM, request_stop)
+    timer = None
+    if config["duration"] is not None:
+        timer = threading.Timer(config["duration"], request_stop)
+        timer.daemon = True
+        timer.start()
+
+    started = time.monotonic()
+    try:
+        engine.run()
+    finally:
+        if timer is not None:
+            timer.cancel()
+        if engine.exporter is not None:
+            engine.exporter.stop()
+    log.info("headless", "✓ Engine stopped after %.1fs", time.monotonic() - started)
+
+    snapshot = engine.metrics_snapshot()
+    snapshot["idle"] = engine.idle_stats()
+    snapshot["imports"] = engine.import_stats()
+    return snapshot
+
+
+def run_replay(config, paths):
+    """Replay recorded sessions (no actions are performed); returns the last session's metrics"""
+    from script.replay import replay, serve_metrics
+
+    snapshot = {}
+    result = None
+    for path in paths:
+        result = replay(path, max_seconds=config["duration"])
+        summary = result.summary()
+        log.info(
+            "headless", "%s: %d frames, %d actions %s, mode: %s",
+            summary["path"], summary["frames"], summary["actions"], summary["action_counts"], summary["final_mode"],
+        )
+        snapshot = result.engine.metrics_snapshot()
+        snapshot["idle"] = result.engine.idle_stats()
+        snapshot["imports"] = result.engine.import_stats()
+        snapshot["replay"] = summary
+    if result is not None and config["metrics_port"] is not None:
+        log.flush()
+        serve_metrics(result.engine, config["metrics_port"])
+    return snapshot
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--camera", type=int, metavar="INDEX", help="camera index (default 0)")
+    source.add_argument("--replay", nargs="+", metavar="RECORDING", help="replay landmark recordings instead of the camera")
+    parser.add_argument("--config", metavar="FILE", help="JSON config file")
+    parser.add_argument("--duration", type=float, metavar="SECONDS", help="stop after this many seconds")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT", help="serve metrics on localhost:PORT")
+    parser.add_argument("--metrics-out", metavar="FILE", help="write the final metrics snapshot as JSON")
+    parser.add_argument("--record", dest="record_path", metavar="FILE", help="record landmarks (camera source only)")
+    parser.add_argument("--log-level", choices=["debug", "info", "warning", "error"])
+    parser.add_argument("--crop-inference", action="store_true", default=None,
+                        help="infer on a crop around tracked hands (experimental, off by default)")
+    args = parser.parse_args(argv)
+    if args.replay and args.record_path:
+        parser.error("--record only works with the camera source, not with --replay")
+
+    try:
+        config = load_config(args.config, {
+            "camera": args.camera,
+            "duration": args.duration,
+            "metrics_port": args.metrics_port,
+            "metrics_out": args.metrics_out,
+            "record_path": args.record_path,
+            "log_level": args.log_level,
+            "crop_inference": args.crop_inference,
+        })
+        log.set_level(config["log_level"])
+        IdlePolicy.from_dict(config["idle"])  # Validate before opening the camera
+    except (OSError, ValueError) as e:
+        print(f"✗ Invalid configuration: {e}", file=sys.stderr)
+        return 2
+
+    log.info("headless", "✓ Headless engine ready in %.0f ms", (time.perf_counter() - _STARTED) * 1000)
+    if args.replay:
+        snapshot = run_replay(config, args.replay)
+    else:
+        snapshot = run_camera(config)
+    if config["metrics_out"]:
+        write_metrics(config["metrics_out"], snapshot)
+    log.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,21 @@
-from PIL import Image, ImageTk
 import customtkinter
 
+from .frame_cache import GifFrameCache
+
 class GestureAnimation:
-    def __init__(self, root, anchor, gif_path):
+    # Decoded frames shared by every animation on the tutorial screen (LRU, memory capped)
+    cache = GifFrameCache()
+
+    def __init__(self, root, anchor, gif_path, cache=None):
         self.root = root
         self.gif_path = gif_path
         self.anchor = anchor
+        if cache is not None:
+            self.cache = cache
 
-        # Load the GIF
-        self.gif = Image.open(gif_path)
-        self.frames = []
-        self.load_frames()
+        # Bumped on every GIF switch so the previous playback loop stops instead of running alongside the new one
+        self.generation = 0
+        self.entry = self.cache.get(gif_path)
         self.runFlag = True
 
         # Create a label to display the GIF
@@ -25,36 +30,37 @@ class GestureAnimation:
 
     def update_gif(self, gif_path):
         try:
-            # Remove old frames
-            self.runFlag = False
-            self.frames.clear()
-
-            # Load the new GIF
-            self.gif = Image.open(gif_path)
-            self.load_frames()
+            # First frame is decoded right away; the rest arrive from the background decoder while playing
+            self.gif_path = gif_path
+            self.entry = self.cache.get(gif_path)
             self.runFlag = True
             self.display_frames()
         except Exception as e:
             pass
 
-    def load_frames(self):
-        try:
-            while True:
-                self.frames.append(ImageTk.PhotoImage(self.gif.copy()))
-                self.gif.seek(len(self.frames))
-        except EOFError:
-            pass
+    def preload(self, gif_paths):
+        """Decode GIFs that are likely to be shown next (e.g. neighbouring dropdown entries) in the background"""
+        self.cache.preload(gif_paths)
 
     def display_frames(self):
-        try:
-            def update_frame(idx):
-                if self.runFlag:
-                    try:
-                        frame = self.frames[idx]
-                        self.label.configure(image=frame)
-                        self.root.after(50, update_frame, (idx + 1) % len(self.frames))
-                    except Exception as e:
-                        pass
-            update_frame(0)
-        except Exception as e:
-            pass
+        self.generation += 1
+        generation = self.generation
+        entry = self.entry
+
+        def update_frame(idx):
+            if not self.runFlag or generation != self.generation:
+                return
+            try:
+                available = len(entry.frames)
+                if available:
+                    idx = min(idx, available - 1)
+                    self.label.configure(image=entry.photo(idx))
+                    # Loop once every frame is decoded; until then hold the newest frame available
+                    next_idx = idx + 1 if idx + 1 < available or not entry.done else 0
+                    self.root.after(50, update_frame, next_idx)
+                elif not entry.done:
+                    self.root.after(50, update_frame, 0)
+            except Exception as e:
+                pass
+
+        update_frame(0)
@@ -0,0 +1,199 @@
+"""
+Actuator Module - Asynchronous dispatcher for OS side effects
+
+Mode handlers never press keys, move the mouse or launch apps on the vision
+thread. They wrap the side effect in an Action and emit it into a bounded
+queue; a dedicated actuator worker drains the queue, so sleeps and slow OS
+calls no longer stall frame processing.
+"""
+
+import collections
+import threading
+import time
+import traceback
+
+from .instrumentation import DISABLED
+from .logger import log
+
+
+class Action:
+    __slots__ = ("name", "fn", "args", "coalesce_key", "timeout", "created")
+
+    def __init__(self, name, fn, args=(), coalesce_key=None, timeout=None):
+        self.name = name  # Short label used in metrics and logs, e.g. "volume" or "tab_nav"
+        self.fn = fn
+        self.args = args
+        # Pending actions with the same key are superseded by the newest one
+        # (use for absolute targets such as cursor position or brightness level)
+        self.coalesce_key = coalesce_key
+        # Seconds the action may wait in the queue before it is considered stale and skipped
+        self.timeout = timeout
+        self.created = None
+
+    def run(self):
+        return self.fn(*self.args)
+
+
+def emit(dispatcher, action):
+    """Queue an action on the dispatcher, or run it inline when no dispatcher is attached"""
+    if dispatcher is None:
+        action.run()
+        return True
+    return dispatcher.submit(action)
+
+
+class ActionDispatcher:
+    def __init__(self, maxsize=32, clock=time.monotonic, metrics=None):
+        self.maxsize = maxsize
+        self.clock = clock
+        self.stage_metrics = metrics if metrics is not None else DISABLED  # "actuator_wait" / "actuator" stage timings
+        self._queue = collections.deque()
+        self._pending_by_key = {}
+        self._cond = threading.Condition()
+        self._running = False
+        self._busy = False
+        self._thread = None
+
+        # Metrics
+        self.submitted = 0
+        self.executed = 0
+        self.coalesced = 0  # pending actions replaced by a newer one with the same key
+        self.dropped = 0  # oldest actions evicted because the queue was full
+        self.expired = 0  # actions skipped because they waited longer than their timeout
+        self.failed = 0  # actions whose callable raised
+        self.max_depth = 0
+        self.last_latency = 0.0  # seconds between submit and start of execution for the last action
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, name="actuator", daemon=True)
+        self._thread.start()
+
+    def stop(self, drain=True, timeout=2.0):
+        """Stop the worker; with drain=True pending actions are executed first"""
+        with self._cond:
+            if not drain:
+                self._queue.clear()
+                self._pending_by_key.clear()
+            self._running = False
+            self._cond.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def submit(self, action):
+        action.created = self.clock()
+        with self._cond:
+            self.submitted += 1
+            key = action.coalesce_key
+            if key is not None and key in self._pending_by_key:
+                old = self._pending_by_key[key]
+                self._queue[self._queue.index(old)] = action
+                self._pending_by_key[key] = action
+                self.coalesced += 1
+                return True
+
+            if len(self._queue) >= self.maxsize:
+                evicted = self._queue.popleft()
+                if evicted.coalesce_key is not None:
+                    self._pending_by_key.pop(evicted.coalesce_key, None)
+                self.dropped += 1
+
+            self._queue.append(action)
+            if key is not None:
+                self._pending_by_key[key] = action
+            self.max_depth = max(self.max_depth, len(self._queue))
+            self._cond.notify()
+        return True
+
+    def depth(self):
+        return len(self._queue)
+
+    def wait_idle(self, timeout=None):
+        """Block until the queue is empty and the worker is not executing anything"""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and not self._busy, timeout)
+
+    def metrics(self):
+        return {
+            "depth": len(self._queue),
+            "max_depth": self.max_depth,
+            "submitted": self.submitted,
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "expired": self.expired,
+            "failed": self.failed,
+            "last_latency_ms": self.last_latency * 1000,
+        }
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+                self._cond.wait_for(lambda: self._queue or not self._running)
+                if not self._queue:
+                    return
+                action = self._queue.popleft()
+                if action.coalesce_key is not None and self._pending_by_key.get(action.coalesce_key) is action:
+                    del self._pending_by_key[action.coalesce_key]
+                self._busy = True
+
+            waited = self.clock() - action.created
+            if action.timeout is not None and waited > action.timeout:
+                self.expired += 1
+                continue
+
+            self.last_latency = waited
+            self.stage_metrics.record("actuator_wait", waited)
+            try:
+                with self.stage_metrics.timer("actuator"):
+                    action.run()
+                self.executed += 1
+            except Exception as e:
+                self.failed += 1
+                log.error("action_failed", "⚠ Action '%s' failed: %s", action.name, e, every=1.0)
+                traceback.print_exc()
+
+
+class RecordingDispatcher:
+    """Stand-in for ActionDispatcher that records actions instead of running them.
+
+    Used by landmark replay and tests: no keys are pressed, no mouse moves and
+    no apps launch. Each entry is (timestamp, name, args).
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.actions = []
+
+    def start(self):
+        pass
+
+    def stop(self, drain=True, timeout=2.0):
+        pass
+
+    def submit(self, action):
+        action.created = self.clock()
+        self.actions.append((action.created, action.name, action.args))
+        return True
+
+    @property
+    def submitted(self):
+        return len(self.actions)
+
+    def depth(self):
+        return 0
+
+    def wait_idle(self, timeout=None):
+        return True
+
+    def counts(self):
+        """Number of recorded actions per name"""
+        return dict(collections.Counter(name for _, name, _ in self.actions))
+
+    def metrics(self):
+        return {"submitted": len(self.actions), "executed": 0, "depth": 0}
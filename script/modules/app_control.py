@@ -1,90 +1,88 @@
 import platform
-import pyautogui
 import time
 
-# Use keyboard library for better Windows hotkey support
-if platform.system() == "Windows":
-    import keyboard
-    import win32gui
-    import win32con
-    import win32process
+from .actuator import Action, emit
+from .backends import OS_BACKENDS
+from .logger import DEBUG, log
 
 
 class AppControl:
-    def __init__(self, hand_tracker):
+    def __init__(self, hand_tracker, dispatcher=None, backends=None):
         self.hand_tracker = hand_tracker
+        self.dispatcher = dispatcher  # ActionDispatcher for hotkeys and window switching, None = run inline
+        self.backends = backends if backends is not None else OS_BACKENDS  # OS input libraries, imported on first use (StubBackends in replay)
         self.window_list = []
         self.current_window_index = 0
 
     def window_nav(self, raised_fingers):
         if raised_fingers is not None and raised_fingers != [0, 0, 0, 0, 0]:
-            print(f"\n=== WINDOW CONTROL ===")
-            print(f"Right hand fingers: {raised_fingers}")
+            # Window switching enumerates windows and sleeps - run it on the actuator worker
+            emit(self.dispatcher, Action("window_nav", self._window_nav, (list(raised_fingers),), timeout=1.0))
+
+    def _window_nav(self, raised_fingers):
+        if raised_fingers is not None and raised_fingers != [0, 0, 0, 0, 0]:
+            log.debug("window", "=== WINDOW CONTROL === right hand fingers: %s", raised_fingers)
             
             if raised_fingers == [0, 0, 0, 0, 1]:
                 # switch window forward, gesture: little
-                print("Action: Switching to next window")
+                log.info("window", "Action: Switching to next window")
                 if platform.system() == "Darwin":
-                    pyautogui.hotkey("command", "tab")
+                    self.backends.pyautogui.hotkey("command", "tab")
                 elif platform.system() == "Windows":
                     self._switch_window_forward()
                 time.sleep(0.1)
-                print("✓ Window switched")
                 
             elif raised_fingers == [1, 0, 0, 0, 0]:
                 # switch window backward, gesture: thumb
-                print("Action: Switching to previous window")
+                log.info("window", "Action: Switching to previous window")
                 if platform.system() == "Darwin":
-                    pyautogui.hotkey("command", "shift", "tab")
+                    self.backends.pyautogui.hotkey("command", "shift", "tab")
                 elif platform.system() == "Windows":
                     self._switch_window_backward()
                 time.sleep(0.1)
-                print("✓ Window switched")
                 
             elif raised_fingers == [1, 1, 1, 1, 1]:
                 # minimize window, gesture: all
-                print("Action: Show desktop (Win+D)")
+                log.info("window", "Action: Show desktop (Win+D)")
                 if platform.system() == "Darwin":
-                    pyautogui.hotkey("command", "m")
+                    self.backends.pyautogui.hotkey("command", "m")
                 elif platform.system() == "Windows":
-                    keyboard.send("win+d")
+                    self.backends.keyboard.send("win+d")
                 time.sleep(0.1)
-                print("✓ Command sent")
                 
             elif raised_fingers == [0, 0, 0, 1, 1]:
                 # close window, gesture: ring and little
-                print("Action: Closing window (Alt+F4)")
+                log.info("window", "Action: Closing window (Alt+F4)")
                 if platform.system() == "Darwin":
-                    pyautogui.hotkey("command", "w")
+                    self.backends.pyautogui.hotkey("command", "w")
                 elif platform.system() == "Windows":
-                    keyboard.send("alt+f4")
+                    self.backends.keyboard.send("alt+f4")
                 time.sleep(0.1)
-                print("✓ Command sent")
                 
             elif raised_fingers == [0, 1, 0, 0, 1]:
                 # switch window(same application different windows) forward, gesture: index and little
-                print("Action: Switching within same app (Ctrl+Tab)")
+                log.info("window", "Action: Switching within same app (Ctrl+Tab)")
                 if platform.system() == "Darwin":
-                    pyautogui.hotkey("command", "`")
+                    self.backends.pyautogui.hotkey("command", "`")
                 elif platform.system() == "Windows":
-                    keyboard.send("ctrl+tab")
+                    self.backends.keyboard.send("ctrl+tab")
                 time.sleep(0.1)
-                print("✓ Command sent")
                 
             elif raised_fingers == [0, 1, 1, 1, 1]:
                 # close a window of the application, gesture: index, middle, ring and little
-                print("Action: Closing current window/tab (Ctrl+W)")
+                log.info("window", "Action: Closing current window/tab (Ctrl+W)")
                 if platform.system() == "Darwin":
-                    pyautogui.hotkey("command", "w")
+                    self.backends.pyautogui.hotkey("command", "w")
                 elif platform.system() == "Windows":
-                    keyboard.send("ctrl+w")
+                    self.backends.keyboard.send("ctrl+w")
                 time.sleep(0.1)
-                print("✓ Command sent")
             else:
-                print(f"⚠ Unknown finger pattern for window control")
+                log.warning("window", "⚠ Unknown finger pattern for window control")
     
     def _get_visible_windows(self):
         """Get list of visible windows (excluding hidden and minimized)"""
+        win32gui, win32con = self.backends.win32gui, self.backends.win32con
+
         def enum_callback(hwnd, results):
             try:
                 if win32gui.IsWindowVisible(hwnd):
@@ -130,6 +128,7 @@ class AppControl:
     
     def _switch_window_forward(self):
         """Switch to the next window in the list"""
+        win32gui, win32con = self.backends.win32gui, self.backends.win32con
         try:
             # Get current foreground window
             current_hwnd = win32gui.GetForegroundWindow()
@@ -138,13 +137,13 @@ class AppControl:
             windows = self._get_visible_windows()
             
             if len(windows) <= 1:
-                print("⚠ No other windows to switch to")
+                log.info("window", "⚠ No other windows to switch to")
                 return
             
-            print(f"\nFound {len(windows)} windows:")
-            for hwnd, title in windows:
-                marker = " <- CURRENT" if hwnd == current_hwnd else ""
-                print(f"  - {title}{marker}")
+            # The full window list is only built when debugging
+            if log.enabled(DEBUG):
+                listing = "".join(f"\n  - {title}{' <- CURRENT' if hwnd == current_hwnd else ''}" for hwnd, title in windows)
+                log.debug("window_list", "Found %d windows:%s", len(windows), listing)
             
             # Find current window index
             current_index = -1
@@ -157,10 +156,10 @@ class AppControl:
             next_index = (current_index + 1) % len(windows)
             next_hwnd, next_title = windows[next_index]
             
-            print(f"\n✓ Switching to: {next_title}")
+            log.info("window", "✓ Switching to: %s", next_title)
             
             # Force window to foreground with multiple attempts
-            import win32process
+            win32process = self.backends.win32process
             
             # Get the thread IDs
             current_thread = win32process.GetCurrentThreadId()
@@ -180,14 +179,15 @@ class AppControl:
                 win32process.AttachThreadInput(current_thread, target_thread, False)
             
         except Exception as e:
-            print(f"⚠ Error switching window: {e}")
+            log.error("window", "⚠ Error switching window: %s", e)
             import traceback
             traceback.print_exc()
             # Fallback to alt+tab
-            keyboard.send("alt+tab")
+            self.backends.keyboard.send("alt+tab")
     
     def _switch_window_backward(self):
         """Switch to the previous window in the list"""
+        win32gui, win32con = self.backends.win32gui, self.backends.win32con
         try:
             # Get current foreground window
             current_hwnd = win32gui.GetForegroundWindow()
@@ -196,13 +196,13 @@ class AppControl:
             windows = self._get_visible_windows()
             
             if len(windows) <= 1:
-                print("⚠ No other windows to switch to")
+                log.info("window", "⚠ No other windows to switch to")
                 return
             
-            print(f"\nFound {len(windows)} windows:")
-            for hwnd, title in windows:
-                marker = " <- CURRENT" if hwnd == current_hwnd else ""
-                print(f"  - {title}{marker}")
+            # The full window list is only built when debugging
+            if log.enabled(DEBUG):
+                listing = "".join(f"\n  - {title}{' <- CURRENT' if hwnd == current_hwnd else ''}" for hwnd, title in windows)
+                log.debug("window_list", "Found %d windows:%s", len(windows), listing)
             
             # Find current window index
             current_index = -1
@@ -215,10 +215,10 @@ class AppControl:
             prev_index = (current_index - 1) % len(windows)
             prev_hwnd, prev_title = windows[prev_index]
             
-            print(f"\n✓ Switching to: {prev_title}")
+            log.info("window", "✓ Switching to: %s", prev_title)
             
             # Force window to foreground with multiple attempts
-            import win32process
+            win32process = self.backends.win32process
             
             # Get the thread IDs
             current_thread = win32process.GetCurrentThreadId()
@@ -238,10 +238,8 @@ class AppControl:
                 win32process.AttachThreadInput(current_thread, target_thread, False)
             
         except Exception as e:
-            print(f"⚠ Error switching window: {e}")
+            log.error("window", "⚠ Error switching window: %s", e)
             import traceback
             traceback.print_exc()
             # Fallback to alt+shift+tab
-            keyboard.send("alt+shift+tab")
-            
-            print("======================\n")
+            self.backends.keyboard.send("alt+shift+tab")
@@ -0,0 +1,115 @@
+"""
+Backends Module - OS input libraries for the mode handlers, imported on first use
+
+Mode handlers press keys, switch windows and move the mouse through
+pyautogui, pygetwindow, keyboard, pynput, the win32 bindings and
+screen_brightness_control. Importing those connects to the display server,
+and keyboard needs root on Linux. So handlers don't import them at module
+level. The engine's mode factories hand every handler a backends object
+instead:
+
+- OSBackends holds a LazyModule per library, which imports it the first
+  time one of its attributes is used. Handlers only call into them from
+  actions, so for most modes that happens on the actuator worker.
+- StubBackends answers every call with a no-op. Landmark replay and tests
+  pass it, so the handlers build and run without a desktop.
+"""
+
+import importlib
+
+from .focus_service import FakeWindowSystem
+
+# Attribute name on a backends object -> module it stands for
+BACKEND_MODULES = {
+    "pyautogui": "pyautogui",
+    "pygetwindow": "pygetwindow",
+    "keyboard": "keyboard",
+    "pynput_keyboard": "pynput.keyboard",
+    "mouse": "mouse",  # Windows
+    "macmouse": "macmouse",  # macOS
+    "win32gui": "win32gui",
+    "win32con": "win32con",
+    "win32process": "win32process",
+    "screen_brightness_control": "screen_brightness_control",  # Windows
+}
+
+
+class LazyModule:
+    """Stands in for a module and imports it the first time one of its attributes is used"""
+
+    def __init__(self, name):
+        self.__name__ = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            # import_module is thread-safe; a racing second load just gets the same module back
+            self._module = importlib.import_module(self.__name__)
+        return self._module
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __repr__(self):
+        return f"<LazyModule {self.__name__} ({'loaded' if self._module is not None else 'not loaded'})>"
+
+
+class OSBackends:
+    """The real libraries, each imported the first time it is used"""
+
+    def __init__(self):
+        for name, module_name in BACKEND_MODULES.items():
+            setattr(self, name, LazyModule(module_name))
+
+    def available(self, name):
+        """Import one backend now; False if it isn't installed"""
+        try:
+            getattr(self, name)._load()
+            return True
+        except ImportError:
+            return False
+
+    def window_system(self):
+        """Window backend for FocusService; None lets FocusService pick the platform default"""
+        return None
+
+
+class Stub:
+    """Does nothing: every attribute is another Stub and every call returns one"""
+
+    def __init__(self, name, **attributes):
+        self.__name__ = name
+        self.__dict__.update(attributes)
+
+    def __getattr__(self, attribute):
+        return Stub(f"{self.__name__}.{attribute}")
+
+    def __call__(self, *args, **kwargs):
+        return Stub(f"{self.__name__}()")
+
+    def __iter__(self):
+        return iter(())
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return f"<Stub {self.__name__}>"
+
+
+class StubBackends:
+    """No-op backends for landmark replay and tests: nothing is pressed, moved, focused or launched"""
+
+    def __init__(self, screen_size=(1920, 1080)):
+        for name in BACKEND_MODULES:
+            setattr(self, name, Stub(name))
+        self.pyautogui = Stub("pyautogui", size=lambda: screen_size)
+
+    def available(self, name):
+        return True
+
+    def window_system(self):
+        return FakeWindowSystem()
+
+
+OS_BACKENDS = OSBackends()  # Shared by every handler built without explicit backends
@@ -1,19 +1,23 @@
 import platform
-import pyautogui
 import time
-import pygetwindow as gw
 
-# Use keyboard library for better Windows hotkey support
-if platform.system() == "Windows":
-    import keyboard
+from .actuator import Action, emit
+from .backends import OS_BACKENDS
+from .logger import log
 
 
 class BrowserControl:
-    def __init__(self, hand_tracker):
+    def __init__(self, hand_tracker, dispatcher=None, backends=None):
         self.hand_tracker = hand_tracker
+        self.dispatcher = dispatcher  # ActionDispatcher for focus + hotkeys, None = run inline
+        self.backends = backends if backends is not None else OS_BACKENDS  # OS input libraries, imported on first use (StubBackends in replay)
         self.browser_names = ['Chrome', 'Firefox', 'Edge', 'Opera', 'Brave', 'Safari', 'Vivaldi']
         self.browser_focused = False  # Track if browser is already focused
     
+    def activate(self):
+        """New browser control session - focus the browser again on the first command"""
+        self.browser_focused = False
+
     def focus_browser(self, force=False):
         """Find and focus a browser window only if not already focused"""
         # Skip if already focused (unless forced)
@@ -21,106 +25,102 @@ class BrowserControl:
             return True
             
         try:
-            all_windows = gw.getAllTitles()
+            all_windows = self.backends.pygetwindow.getAllTitles()
             for window_title in all_windows:
                 for browser in self.browser_names:
                     if browser.lower() in window_title.lower() and window_title:
                         try:
-                            browser_window = gw.getWindowsWithTitle(window_title)[0]
+                            browser_window = self.backends.pygetwindow.getWindowsWithTitle(window_title)[0]
                             if browser_window.isMinimized:
                                 browser_window.restore()
                             browser_window.activate()
                             time.sleep(0.15)  # Increased wait for proper focus
                             self.browser_focused = True
-                            print(f"  ✓ Focused browser: {window_title[:50]}")
+                            log.info("browser", "  ✓ Focused browser: %s", window_title[:50])
                             return True
                         except Exception as e:
                             continue
-            print("  ⚠ No browser window found - command may not work")
+            log.warning("browser", "  ⚠ No browser window found - command may not work")
             self.browser_focused = False
             return False
         except Exception as e:
-            print(f"  ⚠ Error focusing browser: {e}")
+            log.error("browser", "  ⚠ Error focusing browser: %s", e)
             self.browser_focused = False
             return False
 
     def tab_nav(self, raised_fingers):
         if raised_fingers is not None and raised_fingers != [0, 0, 0, 0, 0]:
-            print(f"\n=== BROWSER CONTROL ===")
-            print(f"Right hand fingers: {raised_fingers}")
+            # Focusing the browser and sending the hotkey sleeps - run it on the actuator worker
+            emit(self.dispatcher, Action("tab_nav", self._tab_nav, (list(raised_fingers),), timeout=1.0))
+
+    def _tab_nav(self, raised_fingers):
+        if raised_fingers is not None and raised_fingers != [0, 0, 0, 0, 0]:
+            log.debug("browser", "=== BROWSER CONTROL === right hand fingers: %s", raised_fingers)
             
             # Focus browser ONCE at the start of control session
             browser_ready = self.focus_browser()
             
             if not browser_ready:
-                print("⚠ Cannot execute - no browser window found")
-                print("======================\n")
+                log.warning("browser", "⚠ Cannot execute - no browser window found")
                 return
             
             if raised_fingers == [1, 0, 0, 0, 0]:
                 # switch tab backward, gesture: thumb
-                print("Action: Switching to previous tab (Ctrl+Shift+Tab)")
+                log.info("browser", "Action: Switching to previous tab (Ctrl+Shift+Tab)")
                 if platform.system() == "Darwin":
-                    pyautogui.hotkey("command", "shift", "[")
+                    self.backends.pyautogui.hotkey("command", "shift", "[")
                 elif platform.system() == "Windows":
-                    keyboard.send("ctrl+shift+tab")
+                    self.backends.keyboard.send("ctrl+shift+tab")
                 time.sleep(0.05)
-                print("✓ Command sent")
                 
             elif raised_fingers == [0, 0, 0, 0, 1]:
                 # switch tab forward, gesture: little
-                print("Action: Switching to next tab (Ctrl+Tab)")
+                log.info("browser", "Action: Switching to next tab (Ctrl+Tab)")
                 if platform.system() == "Darwin":
-                    pyautogui.hotkey("command", "shift", "]")
+                    self.backends.pyautogui.hotkey("command", "shift", "]")
                 elif platform.system() == "Windows":
-                    keyboard.send("ctrl+tab")
+                    self.backends.keyboard.send("ctrl+tab")
                 time.sleep(0.05)
-                print("✓ Command sent")
                 
             elif raised_fingers == [1, 1, 1, 1, 1]:
                 # close tab, gesture: all
-                print("Action: Closing tab (Ctrl+W)")
+                log.info("browser", "Action: Closing tab (Ctrl+W)")
                 if platform.system() == "Darwin":
-                    pyautogui.hotkey("command", "w")
+                    self.backends.pyautogui.hotkey("command", "w")
                 elif platform.system() == "Windows":
-                    keyboard.send("ctrl+w")
+                    self.backends.keyboard.send("ctrl+w")
                 time.sleep(0.05)
-                print("✓ Command sent")
                 
             elif raised_fingers == [0, 0, 0, 1, 1]:
                 # new tab, gesture: ring and little
-                print("Action: Opening new tab (Ctrl+T)")
+                log.info("browser", "Action: Opening new tab (Ctrl+T)")
                 if platform.system() == "Darwin":
-                    pyautogui.hotkey("command", "t")
+                    self.backends.pyautogui.hotkey("command", "t")
                 elif platform.system() == "Windows":
-                    keyboard.send("ctrl+t")
+                    self.backends.keyboard.send("ctrl+t")
                 time.sleep(0.05)
-                print("✓ Command sent")
                 
             elif raised_fingers == [0, 1, 0, 0, 1]:
                 # reopen closed tab, gesture: index and little
-                print("Action: Reopening closed tab (Ctrl+Shift+T)")
+                log.info("browser", "Action: Reopening closed tab (Ctrl+Shift+T)")
                 if platform.system() == "Darwin":
-                    pyautogui.hotkey("command", "shift", "t")
+                    self.backends.pyautogui.hotkey("command", "shift", "t")
                 elif platform.system() == "Windows":
-                    keyboard.send("ctrl+shift+t")
+                    self.backends.keyboard.send("ctrl+shift+t")
                 time.sleep(0.05)
-                print("✓ Command sent")
                 
             elif raised_fingers == [0, 1, 1, 1, 1]:
                 # new window, gesture: index, middle, ring and little
-                print("Action: Opening new window (Ctrl+N)")
+                log.info("browser", "Action: Opening new window (Ctrl+N)")
                 # Only open new window if no browser was focused initially
                 if not self.browser_focused:
-                    print("⚠ No browser running - skipping new window command")
+                    log.warning("browser", "⚠ No browser running - skipping new window command")
                 else:
                     if platform.system() == "Darwin":
-                        pyautogui.hotkey("command", "n")
+                        self.backends.pyautogui.hotkey("command", "n")
                     elif platform.system() == "Windows":
-                        keyboard.send("ctrl+n")
+                        self.backends.keyboard.send("ctrl+n")
                     time.sleep(0.05)
-                    print("✓ Command sent")
             else:
-                print(f"⚠ Unknown finger pattern for browser control")
+                log.warning("browser", "⚠ Unknown finger pattern for browser control")
             
-            print("======================\n")
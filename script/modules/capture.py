@@ -0,0 +1,129 @@
+"""
+Frame Capture Module - Threaded latest-frame camera capture
+
+A background thread reads the camera as fast as the driver delivers frames
+and keeps only the newest one in a single slot. The inference loop always
+takes the freshest frame; frames it never got to are counted as dropped
+instead of piling up in the driver buffer.
+"""
+
+import threading
+import time
+
+
+class CapturedFrame:
+    __slots__ = ("frame", "seq", "timestamp")
+
+    def __init__(self, frame, seq, timestamp):
+        self.frame = frame
+        self.seq = seq  # 1-based sequence number assigned by the capture thread
+        self.timestamp = timestamp  # time.monotonic() when the frame was read
+
+
+class IterableSource:
+    """Adapts any iterable of frames (e.g. a synthetic generator) to the cv2.VideoCapture read() interface"""
+
+    def __init__(self, frames, fps=None):
+        self._frames = iter(frames)
+        self._interval = 1.0 / fps if fps else 0
+
+    def read(self):
+        if self._interval:
+            time.sleep(self._interval)
+        try:
+            return True, next(self._frames)
+        except StopIteration:
+            return False, None
+
+    def release(self):
+        pass
+
+
+def open_camera(index=0, width=640, height=480, fps=30):
+    """Open the default webcam with the engine's capture settings"""
+    import cv2
+
+    cap = cv2.VideoCapture(index, cv2.CAP_DSHOW)  # CAP_DSHOW for faster Windows camera init
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    cap.set(cv2.CAP_PROP_FPS, fps)  # Set FPS for better performance
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Reduce buffer for lower latency
+    return cap
+
+
+class FrameCapture:
+    def __init__(self, source, clock=time.monotonic):
+        self.source = source  # anything with read() -> (success, frame), e.g. cv2.VideoCapture
+        self.clock = clock
+        self.frames_captured = 0  # frames read from the source
+        self.frames_consumed = 0  # frames handed to the inference loop
+        self.frames_dropped = 0  # frames overwritten before the inference loop took them
+        self.ended = False  # source reported failure / end of stream
+        self._latest = None
+        self._last_consumed_seq = 0
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._capture_loop, name="frame-capture", daemon=True)
+        self._thread.start()
+
+    def stop(self, release=True):
+        """Stop the capture thread and (by default) release the source"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._thread = None
+        if release and hasattr(self.source, "release"):
+            self.source.release()
+
+    def _capture_loop(self):
+        while self._running:
+            success, frame = self.source.read()
+            if not success:
+                with self._cond:
+                    self.ended = True
+                    self._cond.notify_all()
+                return
+            timestamp = self.clock()
+            with self._cond:
+                self.frames_captured += 1
+                if self._latest is not None and self._latest.seq > self._last_consumed_seq:
+                    self.frames_dropped += 1
+                self._latest = CapturedFrame(frame, self.frames_captured, timestamp)
+                self._cond.notify_all()
+
+    def read(self, timeout=None):
+        """Return the newest frame not yet consumed, waiting up to timeout seconds.
+
+        Returns None on timeout, when stopped, or once the source has ended.
+        """
+        with self._cond:
+            if not self._cond.wait_for(self._has_new_frame, timeout):
+                return None
+            latest = self._latest
+            if latest is None or latest.seq <= self._last_consumed_seq:
+                return None  # woke up because of stop() / end of stream
+            self._last_consumed_seq = latest.seq
+            self.frames_consumed += 1
+            return latest
+
+    def _has_new_frame(self):
+        return (
+            not self._running
+            or self.ended
+            or (self._latest is not None and self._latest.seq > self._last_consumed_seq)
+        )
+
+    def stats(self):
+        return {
+            "frames_captured": self.frames_captured,
+            "frames_consumed": self.frames_consumed,
+            "frames_dropped": self.frames_dropped,
+        }
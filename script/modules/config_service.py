@@ -0,0 +1,153 @@
+"""
+Config Service Module - One cached, hot-reloaded view of user_defined_data.json
+
+The engine's handlers used to open and parse user_defined_data.json
+themselves, using a path relative to the working directory, and missed
+saved changes until they were rebuilt. ConfigService parses the file once
+into an immutable ConfigSnapshot. Readers take service.snapshot, which is a
+single attribute read with no file I/O.
+
+A daemon thread checks the file's mtime and size every poll_interval
+seconds. When they change, it parses the file, swaps in the new snapshot
+and calls subscribers with (old, new). A file that fails to parse (for
+example half-written by another tool) keeps the previous snapshot.
+Callers that have just written the file can call check() to pick it up
+immediately. With path=None there is no file: the config stays empty,
+which landmark replay uses to stay independent of this machine's gestures.
+"""
+
+import json
+import os
+import threading
+from types import MappingProxyType
+
+from .logger import log
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "user_defined_data.json")
+
+# The right-hand gesture whose app the virtual keyboard types into
+KEYBOARD_TARGET_GESTURE = "index, middle, ring and little"
+
+
+def freeze(value):
+    """Read-only copy of parsed JSON: dicts become mapping proxies, lists become tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def app_name_from_command(command):
+    """'C:\\...\\notepad.exe' or 'notepad.exe' -> 'notepad'"""
+    name = command.split("\\")[-1].split("/")[-1]
+    if name.lower().endswith(".exe"):
+        name = name[:-4]
+    return name
+
+
+class ConfigSnapshot:
+    __slots__ = ("document", "version", "mtime")
+
+    def __init__(self, document, version=0, mtime=None):
+        self.document = freeze(document or {})
+        self.version = version  # Increments with every reload that changed the content
+        self.mtime = mtime
+
+    @property
+    def controls(self):
+        return self.document.get("userDefinedControls", MappingProxyType({}))
+
+    def apps_for(self, gesture):
+        """Commands configured for a gesture, without "null"/empty entries (a bare string counts as one)"""
+        config = self.controls.get(gesture)
+        if isinstance(config, str):
+            config = (config,)
+        if not isinstance(config, tuple):
+            return ()
+        return tuple(app for app in config if app and app != "null")
+
+    @property
+    def keyboard_target_app(self):
+        """App the virtual keyboard focuses before typing (None if not configured)"""
+        apps = self.apps_for(KEYBOARD_TARGET_GESTURE)
+        return app_name_from_command(apps[0]) if apps else None
+
+
+class ConfigService:
+    def __init__(self, path=CONFIG_PATH, poll_interval=1.0):
+        self.path = os.path.abspath(path) if path is not None else None  # None = fixed empty config
+        self.poll_interval = poll_interval
+        self.snapshot = ConfigSnapshot({})
+        self.reloads = 0
+        self._signature = None  # (mtime_ns, size) of the file behind the current snapshot
+        self._subscribers = []
+        self._lock = threading.Lock()  # Serializes reloads (poll thread vs explicit check())
+        self._stop = threading.Event()
+        self._thread = None
+
+    def subscribe(self, callback):
+        """Call callback(old_snapshot, new_snapshot) after every content change; returns an unsubscribe function"""
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback) if callback in self._subscribers else None
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def check(self):
+        """Reload if the file changed since the last load; returns True if the snapshot was replaced"""
+        if self.path is None:
+            return False
+        with self._lock:
+            signature = self._stat()
+            if signature == self._signature:
+                return False
+            try:
+                with open(self.path, "r") as file:
+                    document = json.load(file)
+            except FileNotFoundError:
+                document = {}
+            except (OSError, ValueError) as e:
+                log.warning("config_reload", "⚠ Keeping previous config - could not parse %s: %s", self.path, e, every=10.0)
+                return False
+            self._signature = signature
+            old = self.snapshot
+            frozen = freeze(document)
+            if frozen == old.document:
+                return False  # Touched but not changed
+            new = ConfigSnapshot(document, old.version + 1, signature[0] / 1e9 if signature else None)
+            self.snapshot = new  # One reference assignment: readers see the old or the new snapshot, never a mix
+            self.reloads += 1
+
+        if old.version:
+            log.info("config_reload", "✓ Reloaded %s", os.path.basename(self.path))
+        for callback in list(self._subscribers):
+            try:
+                callback(old, new)
+            except Exception as e:
+                log.error("config_subscriber", "⚠ Config subscriber failed: %s", e)
+        return True
+
+    def start(self):
+        """Load now and keep watching the file on a daemon thread"""
+        self.check()
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="config-watch", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.poll_interval):
+            self.check()
+
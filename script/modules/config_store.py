@@ -0,0 +1,311 @@
+"""
+Config Store Module - Offline-first user configuration with background MongoDB sync
+
+The gesture configuration used to come from MongoDB at import time, so a
+slow or unreachable Atlas cluster held up startup for the whole server
+selection timeout. ConfigStore now loads the local user_defined_data.json
+right away, creating a default document if the file is missing. A file
+written for another machine's id is backed up and its gestures are kept
+under this machine's id. It then reconciles with MongoDB on a daemon
+thread:
+
+- At connect, gestures edited locally while offline are pushed first.
+  Otherwise the remote document wins and is written to the local file.
+  Unpushed gestures are listed under UNSYNCED_KEY in the local file, so
+  edits made offline survive a restart and are still pushed first.
+- update_controls() writes the local file at once and queues the changed
+  gestures. The worker pushes them as a single $set of just those fields
+  once edits have been quiet for `debounce` seconds.
+- Failures (unreachable cluster, timeouts) are retried with exponential
+  backoff. Pending edits are kept and merged with newer ones.
+
+The collection comes from a factory, so tests can pass a mongomock
+collection or one on a throwaway local mongod.
+"""
+
+import copy
+import json
+import os
+import shutil
+import threading
+import time
+
+from .logger import log
+
+DEFAULT_GESTURES = ("index", "index and middle", "index, middle and ring", "index, middle, ring and little", "thumb")
+
+OFFLINE = "offline"  # No successful contact with MongoDB yet
+SYNCED = "synced"
+PENDING = "pending"  # Local edits waiting to be pushed
+ERROR = "error"  # Last attempt failed, retrying with backoff
+
+UNSYNCED_KEY = "_unsynced"  # Local file only: gestures edited here that MongoDB hasn't got yet
+
+
+def default_document(document_id, name=None):
+    return {
+        "_id": document_id,
+        "name": name,
+        "userDefinedControls": {gesture: "null" for gesture in DEFAULT_GESTURES},
+    }
+
+
+def mongo_collection_factory(uri, database="hci", collection="user-config", timeout_ms=5000):
+    """Factory connecting to the user-config collection (pymongo is imported on the sync thread)"""
+
+    def connect():
+        import pymongo
+
+        client = pymongo.MongoClient(uri, serverSelectionTimeoutMS=timeout_ms, connectTimeoutMS=timeout_ms)
+        return client[database][collection]
+
+    return connect
+
+
+class ConfigStore:
+    def __init__(self, local_path, document_id, name=None, collection_factory=None, debounce=1.0,
+                 retry_initial=1.0, retry_max=60.0, on_remote_change=None):
+        self.local_path = local_path
+        self.document_id = document_id
+        self.name = name
+        self.collection_factory = collection_factory  # None = local only
+        self.debounce = debounce
+        self.retry_initial = retry_initial
+        self.retry_max = retry_max
+        self.on_remote_change = on_remote_change  # Called on the sync thread with the new document
+        self.status = OFFLINE
+        self.pushes = 0
+        self.failures = 0
+        self.last_error = None
+        self.last_sync = None  # time.time() of the last successful reconcile or push
+        self.remote_revision = 0  # Bumped whenever config from MongoDB replaces the local document (for UI polling)
+        self._document = None
+        self._pending = {}  # gesture -> value not yet pushed
+        self._last_edit = 0.0
+        self._reconciled = False
+        self._collection = None
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread = None
+
+    # Local side
+
+    def load(self):
+        """Read the local file (or create the default document); never touches the network"""
+        document = None
+        try:
+            with open(self.local_path, "r") as file:
+                document = json.load(file)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            log.warning("config", "⚠ Could not read %s (%s) - using defaults", self.local_path, e)
+        if not isinstance(document, dict):
+            document = default_document(self.document_id, self.name)
+            self._write_local(document)
+        elif document.get("_id") != self.document_id:
+            document = self._adopt_foreign(document)
+        document.setdefault("userDefinedControls", {})
+        unsynced = document.pop(UNSYNCED_KEY, None) or []
+        with self._cond:
+            self._document = document
+            # Edits saved by an earlier run that closed before they reached the cloud
+            controls = document["userDefinedControls"]
+            self._pending = {gesture: controls[gesture] for gesture in unsynced if gesture in controls}
+            if self._pending:
+                self.status = PENDING
+                log.info("config", "⚠ %d gesture(s) edited offline will be synced", len(self._pending))
+        return self.document
+
+    def _adopt_foreign(self, foreign):
+        """A file left behind by another machine (or bundled with the app): back it up, keep its gestures"""
+        foreign_id = str(foreign.get("_id"))
+        suffix = "".join(c if c.isalnum() or c in "-_" else "_" for c in foreign_id)
+        backup_path = f"{self.local_path}.{suffix}.bak"
+        try:
+            shutil.copyfile(self.local_path, backup_path)
+        except OSError as e:
+            log.warning("config", "⚠ Could not back up %s: %s", self.local_path, e)
+            backup_path = None
+        document = default_document(self.document_id, self.name)
+        controls = foreign.get("userDefinedControls")
+        if isinstance(controls, dict):
+            document["userDefinedControls"].update(controls)
+        self._write_local(document)
+        log.warning("config", "⚠ %s belonged to '%s' - kept its gestures for '%s' (original saved as %s)",
+                    self.local_path, foreign_id, self.document_id, backup_path)
+        return document
+
+    @property
+    def document(self):
+        with self._cond:
+            return copy.deepcopy(self._document)
+
+    @property
+    def controls(self):
+        return self.document["userDefinedControls"]
+
+    def update_controls(self, controls):
+        """Save gesture -> app mappings locally now and queue the changed ones for MongoDB"""
+        with self._cond:
+            current = self._document["userDefinedControls"]
+            changed = {gesture: value for gesture, value in controls.items() if current.get(gesture) != value}
+            if not changed:
+                return {}
+            current.update(changed)
+            self._pending.update(changed)
+            self._write_local(self._document)
+            self._last_edit = time.monotonic()
+            if self.status != ERROR:
+                self.status = PENDING
+            self._cond.notify_all()
+        return changed
+
+    def _write_local(self, document):
+        # Write-then-rename, so a crash mid-write never leaves a truncated config behind
+        if self._pending:
+            document = dict(document, **{UNSYNCED_KEY: sorted(self._pending)})
+        temp_path = f"{self.local_path}.tmp"
+        with open(temp_path, "w") as file:
+            json.dump(document, file, indent=2)
+        os.replace(temp_path, self.local_path)
+
+    # Sync side
+
+    def start(self):
+        if self.collection_factory is None or self._thread is not None:
+            return
+        if self._document is None:
+            self.load()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="config-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self, flush=True, timeout=5.0):
+        """Stop the sync thread; with flush=True pending edits get one last push attempt"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if flush and self._pending and self.collection_factory is not None:
+            try:
+                self.sync_once()
+            except Exception as e:
+                self._record_failure(e)
+
+    def sync_once(self):
+        """One reconcile-or-push step; raises on failure (the worker retries with backoff)"""
+        if self._collection is None:
+            self._collection = self.collection_factory()
+        if not self._reconciled:
+            self._reconcile()
+            self._reconciled = True
+        self._push()
+
+    def _reconcile(self):
+        remote = self._collection.find_one({"_id": self.document_id})
+        if remote is None:
+            with self._cond:
+                local = copy.deepcopy(self._document)
+                inserted = dict(self._pending)
+            self._collection.insert_one(local)
+            # The inserted document already carries these edits
+            self._clear_pending(inserted)
+            log.info("config", "✓ Created cloud config for %s", self.document_id)
+        else:
+            if self._pending:
+                # Offline edits go to the cloud before the cloud version is adopted
+                self._push()
+                remote = self._collection.find_one({"_id": self.document_id}) or remote
+            remote.setdefault("userDefinedControls", {})
+            with self._cond:
+                # Remote wins, except for gestures edited locally that haven't been pushed yet
+                merged = copy.deepcopy(remote)
+                merged["userDefinedControls"].update(self._pending)
+                changed = merged != self._document
+                if changed:
+                    self._document = merged
+                    self._write_local(merged)
+                    self.remote_revision += 1
+            if changed:
+                log.info("config", "✓ Loaded newer config from the cloud")
+                if self.on_remote_change is not None:
+                    self.on_remote_change(copy.deepcopy(merged))
+        self._mark_synced()
+
+    def _push(self):
+        with self._cond:
+            delta = dict(self._pending)
+        if not delta:
+            return
+        update = {f"userDefinedControls.{gesture}": value for gesture, value in delta.items()}
+        self._collection.update_one({"_id": self.document_id}, {"$set": update}, upsert=True)
+        self._clear_pending(delta)
+        self.pushes += 1
+        log.info("config", "✓ Synced %d gesture(s) to the cloud", len(delta))
+        self._mark_synced()
+
+    def _clear_pending(self, pushed):
+        """Drop pushed gestures from the pending set and the local file's unsynced list"""
+        with self._cond:
+            # Keep anything edited again while the push was in flight
+            for gesture, value in pushed.items():
+                if self._pending.get(gesture) == value:
+                    del self._pending[gesture]
+            if pushed:
+                self._write_local(self._document)
+
+    def _mark_synced(self):
+        with self._cond:
+            self.status = PENDING if self._pending else SYNCED
+        self.last_sync = time.time()
+        self.last_error = None
+
+    def _record_failure(self, error):
+        self.failures += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+        self.status = ERROR
+        self._collection = None  # Reconnect on the next attempt
+
+    def _run(self):
+        delay = self.retry_initial
+        while True:
+            try:
+                self.sync_once()
+                delay = self.retry_initial
+            except Exception as e:
+                self._record_failure(e)
+                log.warning("config_sync", "⚠ Cloud config sync failed (%s) - retrying in %.1fs", e, delay, every=30.0)
+                with self._cond:
+                    self._cond.wait_for(lambda: not self._running, timeout=delay)
+                    if not self._running:
+                        return
+                delay = min(delay * 2, self.retry_max)
+                continue
+
+            with self._cond:
+                # Sleep until there is something to push and edits have been quiet for the debounce window
+                while self._running:
+                    if self._pending:
+                        quiet_for = time.monotonic() - self._last_edit
+                        if quiet_for >= self.debounce:
+                            break
+                        self._cond.wait(self.debounce - quiet_for)
+                    else:
+                        self._cond.wait()
+                if not self._running:
+                    return
+
+    def stats(self):
+        with self._cond:
+            pending = len(self._pending)
+        return {
+            "status": self.status,
+            "pending": pending,
+            "pushes": self.pushes,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "last_sync": self.last_sync,
+        }
@@ -0,0 +1,85 @@
+"""
+Engine State Module - Versioned, immutable engine state for other threads
+
+The GUI used to read current_mode / current_action straight off the engine
+object while the engine thread kept reassigning them. It also reconfigured
+its labels on every tick whether anything had changed or not.
+StatePublisher keeps the latest EngineState. This is an immutable value
+with a version number, and the engine publishes it once per processed
+frame. A new version is only created when a field actually changes. It is
+handed over by swapping one reference, so readers on any thread get a
+consistent state without locks and can skip work when `version` is the
+one they last saw.
+
+Consumers on their own thread (the Tk GUI) poll `latest` or
+`changed_since(version)`. Consumers that are fine running on the engine
+thread (overlay, metrics, IPC) can subscribe(callback) instead. Callbacks
+must not block, because they run inside the frame loop.
+"""
+
+import time
+
+from .logger import log
+
+
+class EngineState:
+    __slots__ = ("version", "mode", "action", "gesture", "hands_detected", "idle", "timestamp")
+
+    FIELDS = ("mode", "action", "gesture", "hands_detected", "idle")
+
+    def __init__(self, version=0, mode="Standby", action="Waiting for gesture...", gesture=None,
+                 hands_detected=False, idle=False, timestamp=None):
+        set_field = object.__setattr__
+        set_field(self, "version", version)
+        set_field(self, "mode", mode)  # Mode label shown in the GUI
+        set_field(self, "action", action)  # Last action / hint shown in the GUI
+        set_field(self, "gesture", gesture)  # Confirmed left-hand gesture (None = no mode selected)
+        set_field(self, "hands_detected", hands_detected)
+        set_field(self, "idle", idle)  # Engine is probing at the idle rate
+        set_field(self, "timestamp", timestamp)  # time.monotonic() when this version was published
+
+    def __setattr__(self, name, value):
+        raise AttributeError("EngineState is immutable")
+
+    def __repr__(self):
+        return f"EngineState(v{self.version}, mode={self.mode!r}, action={self.action!r})"
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class StatePublisher:
+    def __init__(self, initial=None, clock=time.monotonic):
+        self.clock = clock
+        self.latest = initial if initial is not None else EngineState()
+        self._subscribers = []
+
+    @property
+    def version(self):
+        return self.latest.version
+
+    def publish(self, **fields):
+        """Called by the engine thread; returns the new state, or None if nothing changed"""
+        current = self.latest
+        if all(getattr(current, name) == value for name, value in fields.items()):
+            return None
+        values = {name: getattr(current, name) for name in EngineState.FIELDS}
+        values.update(fields)
+        state = EngineState(current.version + 1, timestamp=self.clock(), **values)
+        self.latest = state  # One reference assignment: readers see the old or the new state, never a mix
+        for callback in list(self._subscribers):
+            try:
+                callback(state)
+            except Exception as e:
+                log.error("state_subscriber", "⚠ Engine state subscriber failed: %s", e, every=5.0)
+        return state
+
+    def changed_since(self, version):
+        """The latest state if it is newer than `version`, else None"""
+        state = self.latest
+        return state if state.version != version else None
+
+    def subscribe(self, callback):
+        """Call callback(state) on the engine thread for every new version; returns an unsubscribe function"""
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback) if callback in self._subscribers else None
@@ -0,0 +1,320 @@
+"""
+Focus Service Module - Cached target-window lookup for the virtual keyboard
+
+Before each typed key, the virtual keyboard used to walk every process
+(psutil.process_iter) and every top-level window (EnumWindows) to find the
+target app, then sleep 200 ms after focusing it. It also called FindWindow
+for its own window on every frame. FocusService caches the target's
+PID -> window map and only rebuilds it when the cached handle stops being
+a visible window of the same process (the app was closed or restarted).
+While the app isn't running, rescans are throttled to `retry_interval`.
+The keyboard window's handle is resolved once. After a focus switch the
+service waits only until the window is actually in the foreground (up to
+`settle_timeout`) instead of sleeping for a fixed time.
+
+The target window is looked up and focused on the actuator worker, while
+the vision thread reads it every frame in restore_focus(). So the (pid,
+hwnd) pair is published as one immutable tuple and replaced with a single
+reference swap. A reader never sees the hwnd of one window with the pid of
+another.
+
+The window system is a backend object. Win32Backend is the real one
+(psutil + pywin32), used on Windows when both are installed.
+FakeWindowSystem is an in-memory desktop with the same interface, so the
+logic can be tested and benchmarked anywhere.
+"""
+
+import platform
+import time
+
+from .logger import log
+
+
+def process_matches(app_name, process_name):
+    """Same rule the keyboard always used: substring of the process name, or exactly '<name>.exe'"""
+    app_name = app_name.lower()
+    process_name = process_name.lower()
+    return app_name in process_name or f"{app_name}.exe" == process_name
+
+
+class Win32Backend:
+    def __init__(self):
+        import psutil
+        import win32con
+        import win32gui
+        import win32process
+
+        self.psutil = psutil
+        self.win32con = win32con
+        self.win32gui = win32gui
+        self.win32process = win32process
+
+    def process_ids(self, app_name):
+        pids = []
+        for proc in self.psutil.process_iter(['pid', 'name']):
+            try:
+                if process_matches(app_name, proc.info['name'] or ""):
+                    pids.append(proc.info['pid'])
+            except (self.psutil.NoSuchProcess, self.psutil.AccessDenied):
+                continue
+        return pids
+
+    def windows(self):
+        """(hwnd, pid, title) of every visible top-level window with a title"""
+        results = []
+
+        def enum_callback(hwnd, _):
+            if self.win32gui.IsWindowVisible(hwnd):
+                title = self.win32gui.GetWindowText(hwnd)
+                if title:
+                    results.append((hwnd, self.window_pid(hwnd), title))
+            return True
+
+        self.win32gui.EnumWindows(enum_callback, None)
+        return results
+
+    def is_window(self, hwnd):
+        return bool(self.win32gui.IsWindow(hwnd) and self.win32gui.IsWindowVisible(hwnd))
+
+    def window_pid(self, hwnd):
+        return self.win32process.GetWindowThreadProcessId(hwnd)[1]
+
+    def find_window(self, title):
+        return self.win32gui.FindWindow(None, title) or None
+
+    def foreground(self):
+        return self.win32gui.GetForegroundWindow()
+
+    def set_foreground(self, hwnd):
+        self.win32gui.SetForegroundWindow(hwnd)
+
+    def focus(self, hwnd):
+        """Restore and raise a window, attaching to its input thread so Windows allows the switch"""
+        current_thread = self.win32process.GetCurrentThreadId()
+        target_thread, _ = self.win32process.GetWindowThreadProcessId(hwnd)
+        attached = False
+        if current_thread != target_thread:
+            try:
+                self.win32process.AttachThreadInput(current_thread, target_thread, True)
+                attached = True
+            except Exception:
+                pass  # May fail if already attached
+        try:
+            self.win32gui.ShowWindow(hwnd, self.win32con.SW_RESTORE)
+            self.win32gui.SetForegroundWindow(hwnd)
+            self.win32gui.BringWindowToTop(hwnd)
+        finally:
+            if attached:
+                try:
+                    self.win32process.AttachThreadInput(current_thread, target_thread, False)
+                except Exception:
+                    pass
+
+
+class FakeWindowSystem:
+    """In-memory desktop implementing the backend interface; counts every expensive call"""
+
+    def __init__(self):
+        self.processes = {}  # pid -> process name
+        self.window_table = {}  # hwnd -> [pid, title, visible]
+        self.foreground_hwnd = None
+        self.next_hwnd = 0x1000
+        self.process_scans = 0
+        self.window_scans = 0
+        self.find_window_calls = 0
+        self.focus_calls = 0
+
+    def start_process(self, pid, name, titles=()):
+        self.processes[pid] = name
+        return [self.open_window(pid, title) for title in titles]
+
+    def open_window(self, pid, title, visible=True):
+        self.next_hwnd += 4
+        self.window_table[self.next_hwnd] = [pid, title, visible]
+        return self.next_hwnd
+
+    def close_window(self, hwnd):
+        self.window_table.pop(hwnd, None)
+        if self.foreground_hwnd == hwnd:
+            self.foreground_hwnd = None
+
+    def kill_process(self, pid):
+        self.processes.pop(pid, None)
+        for hwnd in [hwnd for hwnd, window in self.window_table.items() if window[0] == pid]:
+            self.close_window(hwnd)
+
+    def process_ids(self, app_name):
+        self.process_scans += 1
+        return [pid for pid, name in self.processes.items() if process_matches(app_name, name)]
+
+    def windows(self):
+        self.window_scans += 1
+        return [(hwnd, pid, title) for hwnd, (pid, title, visible) in self.window_table.items() if visible and title]
+
+    def is_window(self, hwnd):
+        window = self.window_table.get(hwnd)
+        return window is not None and window[2]
+
+    def window_pid(self, hwnd):
+        window = self.window_table.get(hwnd)
+        return window[0] if window else 0
+
+    def find_window(self, title):
+        self.find_window_calls += 1
+        for hwnd, (_, window_title, _) in self.window_table.items():
+            if window_title == title:
+                return hwnd
+        return None
+
+    def foreground(self):
+        return self.foreground_hwnd
+
+    def set_foreground(self, hwnd):
+        self.foreground_hwnd = hwnd
+
+    def focus(self, hwnd):
+        self.focus_calls += 1
+        self.foreground_hwnd = hwnd
+
+
+def default_backend():
+    """Win32Backend on Windows with psutil and pywin32 installed, else None (focusing disabled)"""
+    if platform.system() != "Windows":
+        return None
+    try:
+        return Win32Backend()
+    except ImportError:
+        log.warning("focus", "⚠ psutil or pywin32 not installed - the keyboard can't focus its target app")
+        return None
+
+
+class FocusService:
+    def __init__(self, app_name=None, backend=None, retry_interval=0.5, settle_timeout=0.2, clock=time.monotonic):
+        self.backend = backend if backend is not None else default_backend()
+        self.retry_interval = retry_interval  # Minimum time between rescans while the target isn't found
+        self.settle_timeout = settle_timeout  # Longest wait for a focus switch to take effect
+        self.clock = clock
+        self.rebuilds = 0  # Process/window scans done so far
+        self.focus_switches = 0
+        self.keyboard_hwnd = None
+        self.set_target(app_name)
+
+    def set_target(self, app_name):
+        """Focus a different app from now on (drops the cached window map)"""
+        self.app_name = app_name
+        self.windows_by_pid = {}  # pid -> [(hwnd, title)] of the target app's windows
+        self._target = None  # (pid, hwnd) of the window keys are typed into; only ever swapped whole
+        self._last_scan = None
+        self._warned = False
+
+    @property
+    def enabled(self):
+        return bool(self.app_name) and self.backend is not None
+
+    @property
+    def hwnd(self):
+        target = self._target
+        return target[1] if target is not None else None
+
+    @property
+    def pid(self):
+        target = self._target
+        return target[0] if target is not None else None
+
+    def _valid(self, target):
+        # A closed window's handle can be reused by another process, so the owner must match too
+        if target is None:
+            return False
+        pid, hwnd = target
+        return self.backend.is_window(hwnd) and self.backend.window_pid(hwnd) == pid
+
+    def rebuild(self):
+        """Rescan processes and windows for the target app; returns the window to focus or None"""
+        self.rebuilds += 1
+        self._last_scan = self.clock()
+        pids = set(self.backend.process_ids(self.app_name))
+        windows_by_pid = {}
+        if pids:
+            for hwnd, pid, title in self.backend.windows():
+                if pid in pids:
+                    windows_by_pid.setdefault(pid, []).append((hwnd, title))
+        self.windows_by_pid = windows_by_pid
+        target = None
+
+        if not pids:
+            if not self._warned:
+                log.warning("focus", "⚠ Process '%s' not running. Please open the application first.", self.app_name)
+                self._warned = True
+        elif not windows_by_pid:
+            if not self._warned:
+                log.warning("focus", "⚠ No visible windows found for '%s'", self.app_name)
+                self._warned = True
+        else:
+            count = sum(len(windows) for windows in windows_by_pid.values())
+            log.info("focus", "✓ Found %d windows for '%s'", count, self.app_name)
+            for pid, windows in windows_by_pid.items():
+                for hwnd, title in windows:
+                    log.debug("focus_window", "  - PID %d: %s", pid, title)
+            pid, windows = next(iter(windows_by_pid.items()))
+            target = (pid, windows[0][0])
+            self._warned = False
+        self._target = target
+        return target[1] if target is not None else None
+
+    def target_window(self):
+        """Cached target window, rebuilt only when the cached handle went invalid"""
+        if not self.enabled:
+            return None
+        target = self._target
+        if self._valid(target):
+            return target[1]
+        if self._last_scan is not None and target is None and self.clock() - self._last_scan < self.retry_interval:
+            return None  # Not found a moment ago; don't rescan on every key
+        return self.rebuild()
+
+    def focus_target(self):
+        """Bring the target app to the foreground before typing; returns True if it is there"""
+        hwnd = self.target_window()
+        if hwnd is None:
+            return False
+        if self.backend.foreground() == hwnd:
+            return True
+        try:
+            self.backend.focus(hwnd)
+        except Exception as e:
+            log.error("focus", "⚠ Error focusing window: %s", e, every=1.0)
+            return False
+        self.focus_switches += 1
+        log.debug("focus_switch", "🎯 Focused PID %s", self.pid)
+        # Wait for the switch to land (usually immediate) rather than a fixed sleep
+        deadline = self.clock() + self.settle_timeout
+        while self.backend.foreground() != hwnd and self.clock() < deadline:
+            time.sleep(0.005)
+        return True
+
+    def keyboard_window(self, title):
+        """Handle of the keyboard's own window, looked up once and again only if it was recreated"""
+        if self.backend is None:
+            return None
+        if self.keyboard_hwnd is None or not self.backend.is_window(self.keyboard_hwnd):
+            self.keyboard_hwnd = self.backend.find_window(title)
+        return self.keyboard_hwnd
+
+    def forget_keyboard_window(self):
+        self.keyboard_hwnd = None
+
+    def restore_focus(self, keyboard_title):
+        """Per frame: if the keyboard window took the foreground, hand it back to the cached target (no scans)"""
+        target = self._target
+        if target is None or self.backend is None:
+            return False
+        try:
+            if self.backend.foreground() == self.keyboard_window(keyboard_title):
+                self.backend.set_foreground(target[1])
+                return True
+        except Exception:
+            pass  # Silently fail if there's an issue
+        return False
+
+    def stats(self):
+        return {"target": self.app_name, "hwnd": self.hwnd, "rebuilds": self.rebuilds, "focus_switches": self.focus_switches}
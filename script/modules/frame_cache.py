@@ -0,0 +1,200 @@
+"""
+Frame Cache Module - Shared LRU cache of decoded GIF frames for the tutorial
+
+The tutorial screen used to reopen both GIFs and convert every frame to a
+PhotoImage each time the dropdown changed. GifFrameCache decodes each GIF
+once and shares the frames between every GestureAnimation:
+
+- get(path) decodes the first frame right away, so something is on screen
+  immediately. The rest of the frames are decoded on a background thread
+  and appended as they become ready.
+- preload(paths) queues GIFs (for example the neighbouring dropdown
+  entries) behind anything requested with get().
+- Entries are kept in least-recently-used order. Once the estimated size of
+  decoded frames plus the PhotoImages built from them goes over max_bytes,
+  the least recently used entries are dropped.
+
+Tk objects must only be touched on the Tk thread. The worker therefore
+only produces PIL images, while PhotoImages are created and evicted on the
+thread that calls get() / preload() / DecodedGif.photo().
+"""
+
+import threading
+from collections import OrderedDict, deque
+
+from PIL import Image, ImageSequence
+
+from .logger import log
+
+
+class DecodedGif:
+    def __init__(self, path):
+        self.path = path
+        self.frames = []  # RGBA PIL images; the decoder appends, readers only take len() and index
+        self.durations = []  # Per-frame display time in ms (from the GIF, 50 ms if missing)
+        self.photos = {}  # frame index -> PhotoImage, created on the Tk thread on first display
+        self.done = False  # Every frame has been decoded (or decoding failed)
+        self.error = None
+        self.frame_bytes = 0  # Estimated size of one decoded frame (RGBA)
+        self.started = False
+        self._image = None  # Open image between the first frame and the background decode
+        self._lock = threading.Lock()  # Held while decoding, so the Tk thread and the worker never share the file
+
+    @property
+    def nbytes(self):
+        # Decoded PIL frames plus the Tk-side copies made for display
+        return self.frame_bytes * (len(self.frames) + len(self.photos))
+
+    def photo(self, index):
+        """PhotoImage for a decoded frame (Tk thread only)"""
+        photo = self.photos.get(index)
+        if photo is None:
+            from PIL import ImageTk  # Needs tkinter; the decoding side of the cache doesn't
+
+            photo = self.photos[index] = ImageTk.PhotoImage(self.frames[index])
+        return photo
+
+    def decode_first(self):
+        """Decode frame 0 now (Tk thread); skipped if the background decoder is already on it"""
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if self.started:
+                return
+            self.started = True
+            self._image = Image.open(self.path)
+            self._append(self._image)
+            if getattr(self._image, "n_frames", 1) == 1:
+                self._finish()
+        except Exception as e:
+            self._fail(e)
+        finally:
+            self._lock.release()
+
+    def decode_rest(self):
+        with self._lock:
+            if self.done:
+                return
+            self.started = True
+            try:
+                if self._image is None:
+                    self._image = Image.open(self.path)
+                for index, frame in enumerate(ImageSequence.Iterator(self._image)):
+                    if index >= len(self.frames):
+                        self._append(frame)
+                self._finish()
+            except Exception as e:
+                self._fail(e)
+
+    def _append(self, frame):
+        image = frame.convert("RGBA")
+        self.frame_bytes = image.width * image.height * 4
+        self.durations.append(frame.info.get("duration") or 50)
+        self.frames.append(image)
+
+    def _finish(self):
+        if self._image is not None:
+            self._image.close()
+            self._image = None
+        self.done = True
+
+    def _fail(self, error):
+        self.error = f"{type(error).__name__}: {error}"
+        log.warning("gif_decode", "⚠ Could not decode %s: %s", self.path, self.error)
+        self._finish()
+
+
+class GifFrameCache:
+    def __init__(self, max_bytes=128 * 1024 * 1024, background=True):
+        self.max_bytes = max_bytes
+        self.background = background  # False decodes synchronously (tests, tools without a Tk loop)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # path -> DecodedGif, least recently used first
+        self._queue = deque()  # DecodedGif waiting for the background decoder
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def get(self, path):
+        """Entry for `path` with at least its first frame decoded (unless it failed); marks it most recently used"""
+        with self._cond:
+            entry = self._entries.get(path)
+            if entry is not None:
+                self._entries.move_to_end(path)
+                self.hits += 1
+            else:
+                entry = self._entries[path] = DecodedGif(path)
+                self.misses += 1
+        if not entry.started:
+            entry.decode_first()
+        if not entry.done:
+            self._schedule(entry, urgent=True)
+        self.trim(keep=entry)
+        return entry
+
+    def preload(self, paths):
+        """Queue GIFs for background decoding without touching their recency much"""
+        for path in paths:
+            with self._cond:
+                entry = self._entries.get(path)
+                if entry is None:
+                    entry = DecodedGif(path)
+                    self._entries[path] = entry
+                    self._entries.move_to_end(path, last=False)  # A preload shouldn't push out what is on screen
+            self._schedule(entry, urgent=False)
+        self.trim()
+
+    def _schedule(self, entry, urgent):
+        if entry.done:
+            return
+        if not self.background:
+            entry.decode_rest()
+            return
+        with self._cond:
+            if entry in self._queue:
+                if not urgent:
+                    return
+                self._queue.remove(entry)
+            if urgent:
+                self._queue.appendleft(entry)
+            else:
+                self._queue.append(entry)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="gif-decode", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                entry = self._queue.popleft()
+            entry.decode_rest()
+
+    def trim(self, keep=None):
+        """Drop least recently used entries until under max_bytes (call on the Tk thread: it releases PhotoImages)"""
+        with self._cond:
+            total = sum(entry.nbytes for entry in self._entries.values())
+            for path in list(self._entries):
+                if total <= self.max_bytes:
+                    break
+                entry = self._entries[path]
+                if entry is keep or entry in self._queue or (entry.started and not entry.done):
+                    continue  # On screen, or still being decoded
+                total -= entry.nbytes
+                del self._entries[path]
+                self.evictions += 1
+
+    def stats(self):
+        with self._cond:
+            return {
+                "entries": len(self._entries),
+                "bytes": sum(entry.nbytes for entry in self._entries.values()),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "queued": len(self._queue),
+            }
@@ -1,19 +1,22 @@
 import platform
-import pyautogui
 
-try:
-    import keyboard
-    USE_KEYBOARD = True
-except ImportError:
-    USE_KEYBOARD = False
-    print("⚠ keyboard library not installed - using pyautogui (may not work in all games)")
+from .actuator import Action, emit
+from .backends import OS_BACKENDS
+from .logger import log
 
 
 class GameControl:
-    def __init__(self, hand_tracker):
+    def __init__(self, hand_tracker, dispatcher=None, backends=None):
         self.hand_tracker = hand_tracker
+        self.dispatcher = dispatcher  # ActionDispatcher for key presses, None = run inline
+        self.backends = backends if backends is not None else OS_BACKENDS  # OS input libraries, imported on first use (StubBackends in replay)
+        self.use_keyboard = None  # keyboard library installed (checked on the first key press)
         self.last_finger_position = ""  # Track last gesture to prevent repeats
 
+    def deactivate(self):
+        """Forget the last gesture so the first one after re-entering game mode fires"""
+        self.last_finger_position = ""
+
     def game_nav(self, raised_fingers):
         """
         Game controls mapped to gestures:
@@ -31,86 +34,90 @@ class GameControl:
                 return
             
             self.last_finger_position = current_position
-            print(f"\n=== GAME CONTROL ===")
-            print(f"Right hand fingers: {raised_fingers}")
-
-            if platform.system() == "Windows":
-                # Index only - Jump/Forward (↑ or W)
-                if raised_fingers == [0, 1, 0, 0, 0]:
-                    print("Action: Jump/Forward (↑)")
-                    pyautogui.press("up")
-                    print("✓ Jump command sent")
-
-                # Index + Middle - Slide/Backward (↓ or S)
-                elif raised_fingers == [0, 1, 1, 0, 0]:
-                    print("Action: Slide/Down (↓)")
-                    pyautogui.press("down")
-                    print("✓ Slide command sent")
-
-                # Thumb only - Move Left (←)
-                elif raised_fingers == [1, 0, 0, 0, 0]:
-                    print("Action: Move Left (←)")
-                    pyautogui.press("left")
-                    print("✓ Left command sent")
-
-                # Pinky only - Move Right (→)
-                elif raised_fingers == [0, 0, 0, 0, 1]:
-                    print("Action: Move Right (→)")
-                    pyautogui.press("right")
-                    print("✓ Right command sent")
-
-                # Thumb + Index - Special action (Space)
-                elif raised_fingers == [1, 1, 0, 0, 0]:
-                    print("Action: Special (Space)")
-                    if USE_KEYBOARD:
-                        keyboard.press_and_release('space')
-                    else:
-                        pyautogui.press('space')
-                    print("✓ Space command sent")
-
-                # Index + Pinky - Alternative jump (for flexibility)
-                elif raised_fingers == [0, 1, 0, 0, 1]:
-                    print("Action: Alternative Jump (W)")
-                    pyautogui.press("w")
-                    print("✓ W command sent")
-
-                # Middle + Ring - Alternative slide (for flexibility)
-                elif raised_fingers == [0, 0, 1, 1, 0]:
-                    print("Action: Alternative Slide (S)")
-                    pyautogui.press("s")
-                    print("✓ S command sent")
+            # pyautogui.press pauses after every call - keep it off the vision thread.
+            # Game input goes stale quickly, so drop it if the worker is backed up.
+            emit(self.dispatcher, Action("game_key", self._send_game_key, (list(raised_fingers),), timeout=0.3))
+
+    def _use_keyboard(self):
+        if self.use_keyboard is None:
+            self.use_keyboard = self.backends.available("keyboard")
+            if not self.use_keyboard:
+                log.warning("game", "⚠ keyboard library not installed - using pyautogui (may not work in all games)")
+        return self.use_keyboard
+
+    def _send_game_key(self, raised_fingers):
+        log.debug("game", "=== GAME CONTROL === right hand fingers: %s", raised_fingers)
+
+        if platform.system() == "Windows":
+            # Index only - Jump/Forward (↑ or W)
+            if raised_fingers == [0, 1, 0, 0, 0]:
+                log.info("game", "Action: Jump/Forward (↑)")
+                self.backends.pyautogui.press("up")
+
+            # Index + Middle - Slide/Backward (↓ or S)
+            elif raised_fingers == [0, 1, 1, 0, 0]:
+                log.info("game", "Action: Slide/Down (↓)")
+                self.backends.pyautogui.press("down")
+
+            # Thumb only - Move Left (←)
+            elif raised_fingers == [1, 0, 0, 0, 0]:
+                log.info("game", "Action: Move Left (←)")
+                self.backends.pyautogui.press("left")
+
+            # Pinky only - Move Right (→)
+            elif raised_fingers == [0, 0, 0, 0, 1]:
+                log.info("game", "Action: Move Right (→)")
+                self.backends.pyautogui.press("right")
 
+            # Thumb + Index - Special action (Space)
+            elif raised_fingers == [1, 1, 0, 0, 0]:
+                log.info("game", "Action: Special (Space)")
+                if self._use_keyboard():
+                    self.backends.keyboard.press_and_release('space')
                 else:
-                    print(f"⚠ Unknown game gesture: {raised_fingers}")
-
-            elif platform.system() == "Darwin":
-                # macOS game controls (same keys work)
-                if raised_fingers == [0, 1, 0, 0, 0]:
-                    pyautogui.press("up")
-                elif raised_fingers == [0, 1, 1, 0, 0]:
-                    pyautogui.press("down")
-                elif raised_fingers == [1, 0, 0, 0, 0]:
-                    pyautogui.press("left")
-                elif raised_fingers == [0, 0, 0, 0, 1]:
-                    pyautogui.press("right")
-                elif raised_fingers == [1, 1, 0, 0, 0]:
-                    if USE_DIRECTINPUT:
-                        pydirectinput.press('space')
-                    else:
-                        pyautogui.press('space')
+                    self.backends.pyautogui.press('space')
+
+            # Index + Pinky - Alternative jump (for flexibility)
+            elif raised_fingers == [0, 1, 0, 0, 1]:
+                log.info("game", "Action: Alternative Jump (W)")
+                self.backends.pyautogui.press("w")
+
+            # Middle + Ring - Alternative slide (for flexibility)
+            elif raised_fingers == [0, 0, 1, 1, 0]:
+                log.info("game", "Action: Alternative Slide (S)")
+                self.backends.pyautogui.press("s")
 
             else:
-                # Linux support
-                if raised_fingers == [0, 1, 0, 0, 0]:
-                    pyautogui.press("up")
-                elif raised_fingers == [0, 1, 1, 0, 0]:
-                    pyautogui.press("down")
-                elif raised_fingers == [1, 0, 0, 0, 0]:
-                    pyautogui.press("left")
-                elif raised_fingers == [0, 0, 0, 0, 1]:
-                    pyautogui.press("right")
-                elif raised_fingers == [1, 1, 0, 0, 0]:
-                    if USE_DIRECTINPUT:
-                        pydirectinput.press('space')
-                    else:
-                        pyautogui.press('space')
+                log.warning("game", "⚠ Unknown game gesture: %s", raised_fingers)
+
+        elif platform.system() == "Darwin":
+            # macOS game controls (same keys work)
+            if raised_fingers == [0, 1, 0, 0, 0]:
+                self.backends.pyautogui.press("up")
+            elif raised_fingers == [0, 1, 1, 0, 0]:
+                self.backends.pyautogui.press("down")
+            elif raised_fingers == [1, 0, 0, 0, 0]:
+                self.backends.pyautogui.press("left")
+            elif raised_fingers == [0, 0, 0, 0, 1]:
+                self.backends.pyautogui.press("right")
+            elif raised_fingers == [1, 1, 0, 0, 0]:
+                if USE_DIRECTINPUT:
+                    pydirectinput.press('space')
+                else:
+                    self.backends.pyautogui.press('space')
+
+        else:
+            # Linux support
+            if raised_fingers == [0, 1, 0, 0, 0]:
+                self.backends.pyautogui.press("up")
+            elif raised_fingers == [0, 1, 1, 0, 0]:
+                self.backends.pyautogui.press("down")
+            elif raised_fingers == [1, 0, 0, 0, 0]:
+                self.backends.pyautogui.press("left")
+            elif raised_fingers == [0, 0, 0, 0, 1]:
+                self.backends.pyautogui.press("right")
+            elif raised_fingers == [1, 1, 0, 0, 0]:
+                if USE_DIRECTINPUT:
+                    pydirectinput.press('space')
+                else:
+                    self.backends.pyautogui.press('space')
@@ -0,0 +1,169 @@
+"""
+Gesture Tables Module - Precompiled 5-bit finger-mask lookup tables
+
+A raised-fingers list such as [0, 1, 1, 0, 0] is encoded as the 5-bit
+integer 0b01100 (first list element is the most significant bit). Left-hand
+gesture names, mode specs and right-hand action labels are compiled once
+into 32-entry tables indexed by that mask, so per-frame gesture detection
+and dispatch are constant-time lookups instead of dict rebuilds and
+if/elif chains over list comparisons.
+"""
+
+NUM_MASKS = 32
+
+
+def finger_mask(raised_fingers):
+    """Encode a 5-element raised-fingers list as an int in [0, 31]"""
+    mask = 0
+    for raised in raised_fingers:
+        mask = (mask << 1) | (1 if raised else 0)
+    return mask
+
+
+def mask_to_fingers(mask):
+    """Inverse of finger_mask"""
+    return [(mask >> shift) & 1 for shift in range(4, -1, -1)]
+
+
+def compile_table(entries, default=None):
+    """Compile {raised-fingers tuple: value} into a 32-entry list indexed by finger mask"""
+    table = [default] * NUM_MASKS
+    for fingers, value in entries.items():
+        table[finger_mask(fingers)] = value
+    return table
+
+
+# Left hand gestures, in the left-hand order [little, ring, middle, index, thumb]
+GESTURE_NAMES = compile_table({
+    (0, 0, 0, 0, 1): "thumb",
+    (1, 0, 0, 0, 0): "little",
+    (0, 0, 0, 1, 1): "thumb and index",
+    (0, 0, 1, 1, 1): "thumb, index and middle",
+    (0, 1, 1, 1, 1): "thumb, index, middle and ring",
+    (0, 0, 0, 1, 0): "index",
+    (0, 0, 1, 1, 0): "index and middle",
+    (0, 1, 1, 1, 0): "index, middle and ring",
+    (1, 1, 1, 1, 0): "index, middle, ring and little",
+    (1, 0, 0, 1, 0): "index and little",  # Fixed: [little, ring, middle, index, thumb]
+    (1, 1, 1, 1, 1): "all",
+})
+# Gesture name -> left-hand finger mask (names are for config tables and display only)
+GESTURE_MASKS = {name: mask for mask, name in enumerate(GESTURE_NAMES) if name}
+
+
+class ModeSpec:
+    def __init__(self, gesture, label, default_action, invoke, action_labels=None,
+                 needs_cooldown=False, mouse_mode=False, returns_frame=False):
+        self.gesture = gesture  # Left-hand gesture name selecting this mode (display)
+        self.mask = GESTURE_MASKS[gesture]  # Left-hand finger mask selecting this mode (MODE_BY_MASK / ModeRegistry key)
+        self.label = label  # Mode text shown in the GUI
+        self.default_action = default_action  # Action text when the right hand shows no mapped gesture
+        # invoke(handler, raised_fingers, frame, observation) runs the handler for one frame
+        self.invoke = invoke
+        # 32-entry right-hand action label table, unmapped masks fall back to default_action
+        self.action_labels = compile_table(action_labels or {}, default_action)
+        self.needs_cooldown = needs_cooldown  # Discrete actions gated by the repeat cooldown
+        self.mouse_mode = mouse_mode  # Classify every frame while active (cursor tracking)
+        self.returns_frame = returns_frame  # invoke() returns the annotated frame
+
+
+MODE_SPECS = [
+    # volume control, left gesture: thumb (continuous, no cooldown)
+    ModeSpec(
+        "thumb", "Volume Control", "Pinch: Decrease | Expand: Increase",
+        lambda handler, fingers, frame, observation: handler.control_volume(observation),
+    ),
+    # brightness control, left gesture: thumb and index (continuous, no cooldown)
+    ModeSpec(
+        "thumb and index", "Brightness Control", "Pinch: Decrease | Expand: Increase",
+        lambda handler, fingers, frame, observation: handler.control_brightness(observation),
+    ),
+    # media control, left gesture: thumb, index and middle (no cooldown - needs continuous calls for buffering)
+    ModeSpec(
+        "thumb, index and middle", "Media Control", "Thumb: Previous | Little: Next | All: Play/Pause",
+        lambda handler, fingers, frame, observation: handler.control_media(fingers),
+        {
+            (1, 0, 0, 0, 0): "Previous Track",
+            (0, 0, 0, 0, 1): "Next Track",
+            (1, 1, 1, 1, 1): "Play/Pause",
+            (0, 1, 1, 1, 0): "Mute/Unmute",
+        },
+    ),
+    # app control (window switching), left gesture: index
+    ModeSpec(
+        "index", "Window Control", "Little: Next | Thumb: Previous | All: Desktop",
+        lambda handler, fingers, frame, observation: handler.window_nav(fingers),
+        {
+            (0, 0, 0, 0, 1): "Switch Window Forward",
+            (1, 0, 0, 0, 0): "Switch Window Backward",
+            (1, 1, 1, 1, 1): "Show Desktop",
+            (0, 0, 0, 1, 1): "Close Window (Alt+F4)",
+            (0, 1, 0, 0, 1): "Switch Within App",
+            (0, 1, 1, 1, 1): "Close Current Tab (Ctrl+W)",
+        },
+        needs_cooldown=True,
+    ),
+    # browser control, left gesture: index and middle
+    ModeSpec(
+        "index and middle", "Browser Control", "Thumb: Previous | Little: Next | All: Close",
+        lambda handler, fingers, frame, observation: handler.tab_nav(fingers),
+        {
+            (1, 0, 0, 0, 0): "Previous Tab",
+            (0, 0, 0, 0, 1): "Next Tab",
+            (1, 1, 1, 1, 1): "Close Tab",
+            (0, 0, 0, 1, 1): "New Tab",
+            (0, 1, 0, 0, 1): "Reopen Last Tab",
+            (0, 1, 1, 1, 1): "New Window",
+        },
+        needs_cooldown=True,
+    ),
+    # mouse control, left gesture: index, middle and ring
+    ModeSpec(
+        "index, middle and ring", "Mouse Control", "Index+Middle: Move | Index: Click",
+        lambda handler, fingers, frame, observation: handler.control_mouse(fingers, observation),
+        {
+            (0, 1, 1, 0, 0): "Moving Cursor",
+            (0, 0, 0, 1, 0): "Left Click",
+            (0, 1, 0, 0, 0): "Right Click",
+            (1, 1, 1, 1, 1): "Scroll Down",
+            (0, 1, 1, 1, 1): "Scroll Up",
+        },
+        mouse_mode=True,
+    ),
+    # game control, left gesture: index and little (instant, no cooldown like game-simulator-lite)
+    ModeSpec(
+        "index and little", "Game Control", "Index: Jump | Thumb: Left | Little: Right",
+        lambda handler, fingers, frame, observation: handler.game_nav(fingers),
+        {
+            (0, 1, 0, 0, 0): "Jump/Forward (↑)",
+            (0, 1, 1, 0, 0): "Slide/Down (↓)",
+            (1, 0, 0, 0, 0): "Move Left (←)",
+            (0, 0, 0, 0, 1): "Move Right (→)",
+            (1, 1, 0, 0, 0): "Action (Space)",
+        },
+    ),
+    # Virtual keyboard, left gesture: index, middle, ring and little
+    ModeSpec(
+        "index, middle, ring and little", "Virtual Keyboard", "Point & Pinch to Type",
+        lambda handler, fingers, frame, observation: handler.process(frame, observation),
+        returns_frame=True,
+    ),
+    # user defined controls, left gesture: all
+    ModeSpec(
+        "all", "Custom App Launch", "Index: App1 | Index+Middle: App2 | etc.",
+        lambda handler, fingers, frame, observation: handler.user_controls(fingers),
+        {
+            (0, 1, 0, 0, 0): "Launch App 1",
+            (0, 1, 1, 0, 0): "Launch App 2",
+            (0, 1, 1, 1, 0): "Launch App 3",
+            (0, 1, 1, 1, 1): "Launch App 4",
+            (1, 0, 0, 0, 0): "Launch App 5",
+        },
+        needs_cooldown=True,
+    ),
+]
+
+# Left-hand finger mask -> ModeSpec (None for gestures that select no mode)
+MODE_BY_MASK = [None] * NUM_MASKS
+for _spec in MODE_SPECS:
+    MODE_BY_MASK[_spec.mask] = _spec
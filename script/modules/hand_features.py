@@ -0,0 +1,107 @@
+"""
+Hand Features Module - Vectorized landmark features on (21, 3) float32 arrays
+
+Landmarks are converted once per hand from the MediaPipe protobuf into a
+contiguous (21, 3) float32 array of normalized (x, y, z). Raised-finger
+flags, the thumb condition and pinch distances are computed with NumPy on
+that array, and several hands can be classified together as (N, 21, 3).
+"""
+
+from operator import attrgetter
+
+import numpy as np
+
+NUM_LANDMARKS = 21
+
+WRIST = 0
+THUMB_TIP = 4
+INDEX_MCP = 5
+INDEX_TIP = 8
+MIDDLE_MCP = 9
+MIDDLE_TIP = 12
+
+THUMB_THRESHOLD = 0.06  # thumb tip must be 6% of the frame width beyond the index knuckle
+
+# Bit weights turning a [5] flag row into the finger_mask() integer
+MASK_WEIGHTS = np.array([16, 8, 4, 2, 1], dtype=np.uint8)
+
+_XYZ = attrgetter("x", "y", "z")
+
+
+def _flat(landmark, coord):
+    return landmark * 3 + coord
+
+
+# Every raised-finger flag is "flat[a] - flat[b] > limit" on the (N, 63) flattened landmarks.
+# Row 0 holds the right-hand order [thumb, index, middle, ring, little], row 1 the mirrored
+# left-hand order [little, ring, middle, index, thumb], so left hands need no reversal step.
+#   fingers: knuckle.y - tip.y > half the wrist-to-middle-knuckle span
+#   thumb:   right hand index_knuckle.x - thumb_tip.x, left hand thumb_tip.x - index_knuckle.x > THUMB_THRESHOLD
+_FLAG_A = np.array([
+    [_flat(INDEX_MCP, 0), _flat(5, 1), _flat(9, 1), _flat(13, 1), _flat(17, 1)],
+    [_flat(17, 1), _flat(13, 1), _flat(9, 1), _flat(5, 1), _flat(THUMB_TIP, 0)],
+])
+_FLAG_B = np.array([
+    [_flat(THUMB_TIP, 0), _flat(8, 1), _flat(12, 1), _flat(16, 1), _flat(20, 1)],
+    [_flat(20, 1), _flat(16, 1), _flat(12, 1), _flat(8, 1), _flat(INDEX_MCP, 0)],
+])
+_IS_THUMB = np.array([[1, 0, 0, 0, 0], [0, 0, 0, 0, 1]], dtype=np.float32)
+_THUMB_LIMIT = _IS_THUMB * THUMB_THRESHOLD
+_FINGER_SCALE = (1 - _IS_THUMB) * 0.5
+
+
+def landmarks_to_array(hand_landmarks, out=None):
+    """Convert a NormalizedLandmarkList into a (21, 3) float32 array of x, y, z"""
+    xyz = list(map(_XYZ, hand_landmarks.landmark))
+    if out is None:
+        return np.array(xyz, dtype=np.float32)
+    out[...] = xyz
+    return out
+
+
+def classify_batch(points, is_left):
+    """Raised-finger flags for a batch of hands.
+
+    Args:
+        points: (N, 21, 3) float32 landmark array
+        is_left: (N,) bool array, True for left hands
+    Returns:
+        (N, 5) uint8 flags - [thumb, index, middle, ring, little] for right hands
+        and the mirrored [little, ring, middle, index, thumb] order for left hands
+    """
+    count = len(points)
+    flat = points.reshape(count, NUM_LANDMARKS * 3)
+    side = np.asarray(is_left).astype(np.intp)
+    rows = np.arange(count)[:, None]
+    diffs = flat[rows, _FLAG_A[side]] - flat[rows, _FLAG_B[side]]
+    # wrist.y - middle_knuckle.y, scaled by 0.5 for finger columns and 0 for the thumb column
+    span = flat[:, _flat(WRIST, 1)] - flat[:, _flat(MIDDLE_MCP, 1)]
+    limits = _THUMB_LIMIT[side] + _FINGER_SCALE[side] * span[:, None]
+    return (diffs > limits).view(np.uint8)
+
+
+def classify_hand(points, hand_type):
+    """Raised-finger list for a single (21, 3) hand, same result as HandTracker.detect_raised_fingers"""
+    if hand_type not in ["left", "right"]:
+        raise ValueError(
+            "Invalid hand_type. It should be either 'left' or 'right'."
+        )
+    return classify_batch(points[None], np.array([hand_type == "left"]))[0].tolist()
+
+
+def finger_masks(flags):
+    """(N, 5) flags -> (N,) finger_mask() integers"""
+    return flags @ MASK_WEIGHTS
+
+
+def pixel_distance(points, a, b, frame_width, frame_height):
+    """Euclidean pixel distance between landmarks a and b of one hand (or (N,) for a batch)"""
+    delta = (points[..., a, :2] - points[..., b, :2]) * np.array([frame_width, frame_height], dtype=np.float32)
+    return np.hypot(delta[..., 0], delta[..., 1])
+
+
+def pinch_ratio(points, frame_width, frame_height):
+    """Squared thumb-index pinch length relative to the squared palm length (wrist to middle knuckle)"""
+    tip = pixel_distance(points, THUMB_TIP, INDEX_TIP, frame_width, frame_height)
+    palm = pixel_distance(points, WRIST, MIDDLE_MCP, frame_width, frame_height)
+    return float((tip * tip) / (palm * palm))
@@ -0,0 +1,147 @@
+"""
+Idle Power Module - Low-rate, low-resolution probing while nobody is in view
+
+With no hands in front of the camera the engine has nothing to do, yet it
+would keep running full-resolution inference at the camera rate. After
+idle_after seconds without a hand the IdlePowerManager switches to the idle
+state: frames are probed at idle_fps and inferred at idle_scale of the frame
+size. The first probe that finds a hand switches straight back to the active
+state, so the very next frame is processed at full rate and resolution.
+
+Time spent in each state, process CPU time per state and the estimated
+inference work saved are recorded for stats().
+"""
+
+import time
+
+from .logger import log
+
+ACTIVE = "active"
+IDLE = "idle"
+
+
+class IdlePolicy:
+    """Per-deployment idle settings"""
+
+    def __init__(self, enabled=True, idle_after=5.0, idle_fps=5.0, idle_scale=0.5):
+        if idle_fps <= 0:
+            raise ValueError("idle_fps must be positive")
+        if not 0 < idle_scale <= 1:
+            raise ValueError("idle_scale must be in (0, 1]")
+        self.enabled = enabled
+        self.idle_after = idle_after  # Seconds without hands before going idle
+        self.idle_fps = idle_fps  # Probe rate while idle
+        self.idle_scale = idle_scale  # Inference resolution while idle, fraction of the frame size
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a policy from a config mapping, e.g. {"idle_after": 10, "idle_fps": 2}; unknown keys are ignored"""
+        data = data or {}
+        defaults = cls()
+        return cls(
+            enabled=bool(data.get("enabled", defaults.enabled)),
+            idle_after=float(data.get("idle_after", defaults.idle_after)),
+            idle_fps=float(data.get("idle_fps", defaults.idle_fps)),
+            idle_scale=float(data.get("idle_scale", defaults.idle_scale)),
+        )
+
+    def to_dict(self):
+        return {
+            "enabled": self.enabled,
+            "idle_after": self.idle_after,
+            "idle_fps": self.idle_fps,
+            "idle_scale": self.idle_scale,
+        }
+
+
+class IdlePowerManager:
+    def __init__(self, policy=None, clock=time.monotonic, cpu_clock=time.process_time):
+        self.policy = policy if policy is not None else IdlePolicy()
+        self.clock = clock
+        self.cpu_clock = cpu_clock
+        self.state = ACTIVE
+        now = clock()
+        self._last_hand_time = now  # Start active, so the idle countdown runs from startup
+        self._last_probe_time = None
+        self._state_since = now
+        self._cpu_since = cpu_clock()
+        self.time_in_state = {ACTIVE: 0.0, IDLE: 0.0}
+        self.cpu_in_state = {ACTIVE: 0.0, IDLE: 0.0}
+        self.frames_processed = {ACTIVE: 0, IDLE: 0}
+        self.frames_skipped = 0  # Frames the idle probe rate let go by
+        self.work_done = 0.0  # Inference work in full-frame units (a frame at scale s counts s * s)
+        self.wakeups = 0
+        self.sleeps = 0
+
+    @property
+    def idle(self):
+        return self.state == IDLE
+
+    @property
+    def inference_scale(self):
+        """Resolution factor for the next inference"""
+        return self.policy.idle_scale if self.idle else 1.0
+
+    def probe_delay(self, now=None):
+        """Seconds to wait before the next frame is worth processing (0 while active)"""
+        if not self.idle or self._last_probe_time is None:
+            return 0.0
+        now = self.clock() if now is None else now
+        return max(0.0, self._last_probe_time + 1.0 / self.policy.idle_fps - now)
+
+    def skip(self, count=1):
+        """Count captured frames that were not processed because of the idle probe rate"""
+        self.frames_skipped += count
+
+    def update(self, hands_present, now=None):
+        """Record one processed frame and return the state for the next one"""
+        now = self.clock() if now is None else now
+        self.frames_processed[self.state] += 1
+        self.work_done += self.inference_scale ** 2
+        self._last_probe_time = now
+
+        if hands_present:
+            self._last_hand_time = now
+            if self.idle:
+                self.wakeups += 1
+                self._enter(ACTIVE, now)
+        elif self.policy.enabled and not self.idle and now - self._last_hand_time >= self.policy.idle_after:
+            self.sleeps += 1
+            self._enter(IDLE, now)
+        return self.state
+
+    def _enter(self, state, now):
+        cpu_now = self.cpu_clock()
+        self.time_in_state[self.state] += now - self._state_since
+        self.cpu_in_state[self.state] += cpu_now - self._cpu_since
+        self.state = state
+        self._state_since = now
+        self._cpu_since = cpu_now
+        if state == IDLE:
+            log.info("idle", "💤 No hands for %gs - probing at %g fps", self.policy.idle_after, self.policy.idle_fps)
+        else:
+            log.info("idle", "⚡ Hand detected - back to full frame rate")
+
+    def stats(self, now=None):
+        now = self.clock() if now is None else now
+        cpu_now = self.cpu_clock()
+        time_in_state = dict(self.time_in_state)
+        cpu_in_state = dict(self.cpu_in_state)
+        time_in_state[self.state] += now - self._state_since
+        cpu_in_state[self.state] += cpu_now - self._cpu_since
+        # Work the same frames would have cost at full rate and resolution
+        full_work = sum(self.frames_processed.values()) + self.frames_skipped
+        return {
+            "state": self.state,
+            "time_in_state": time_in_state,
+            "cpu_in_state": cpu_in_state,
+            "cpu_utilization": {
+                state: (cpu_in_state[state] / time_in_state[state] if time_in_state[state] > 0 else 0.0)
+                for state in (ACTIVE, IDLE)
+            },
+            "frames_processed": dict(self.frames_processed),
+            "frames_skipped": self.frames_skipped,
+            "inference_work_saved": 1.0 - self.work_done / full_work if full_work else 0.0,
+            "wakeups": self.wakeups,
+            "sleeps": self.sleeps,
+        }
@@ -0,0 +1,166 @@
+"""
+Instrumentation Module - Per-stage latency histograms and pipeline counters
+
+Each stage of the frame pipeline (capture, flip, preview, cvtColor,
+Hands.process, classification, dispatch, actuator) is timed with
+perf_counter and recorded into a histogram with fixed millisecond buckets.
+Recording a sample is a bisect and a few integer additions, and timers are
+reused, so nothing is allocated per frame. Counters track frames, drops,
+hands and actions fired per mode. snapshot() returns a plain dict that is
+safe to serialize.
+
+Writers never lock: every histogram and counter has a single writer thread
+(the actuator worker only records its own stages), and snapshot() copies
+the containers instead of locking them, so a metrics reader such as the
+exporter never stalls the frame loop. A snapshot taken mid-frame may be one
+sample behind on some stages, never torn within a histogram.
+
+A disabled PipelineMetrics hands out one shared no-op timer and ignores
+every record/count call, so instrumented code costs a method call per stage.
+"""
+
+import time
+from bisect import bisect_left
+
+# Upper bounds (ms) of the latency buckets; the last bucket is +inf
+DEFAULT_BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 33, 50, 100, 250, 1000)
+
+
+class LatencyHistogram:
+    def __init__(self, bounds_ms=DEFAULT_BUCKETS_MS):
+        self.bounds = tuple(bound / 1000.0 for bound in bounds_ms)
+        self.bounds_ms = tuple(bounds_ms)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q, counts=None):
+        """Bucket upper bound (ms) containing the q-quantile; the max for the +inf bucket"""
+        counts = self.counts if counts is None else counts
+        total = sum(counts)
+        if not total:
+            return 0.0
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if seen >= rank and count:
+                return self.bounds_ms[index] if index < len(self.bounds_ms) else self.max * 1000.0
+        return self.max * 1000.0
+
+    def snapshot(self):
+        # Count and quantiles come from one copy of the buckets, so they agree even while the writer observes
+        counts = list(self.counts)
+        count = sum(counts)
+        total_ms = self.total * 1000.0
+        return {
+            "count": count,
+            "sum_ms": total_ms,
+            "mean_ms": total_ms / count if count else 0.0,
+            "max_ms": self.max * 1000.0,
+            "p50_ms": self.quantile(0.50, counts),
+            "p95_ms": self.quantile(0.95, counts),
+            "p99_ms": self.quantile(0.99, counts),
+            "buckets_ms": list(self.bounds_ms),
+            "bucket_counts": counts,
+        }
+
+
+class _StageTimer:
+    __slots__ = ("metrics", "stage", "start")
+
+    def __init__(self, metrics, stage):
+        self.metrics = metrics
+        self.stage = stage
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = self.metrics.clock()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.record(self.stage, self.metrics.clock() - self.start)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_TIMER = _NullTimer()
+
+
+class PipelineMetrics:
+    def __init__(self, enabled=True, clock=time.perf_counter, bounds_ms=DEFAULT_BUCKETS_MS):
+        self.enabled = enabled
+        self.clock = clock
+        self.bounds_ms = bounds_ms
+        self.stages = {}  # stage name -> LatencyHistogram
+        self.counters = {}  # counter name -> int
+        self.actions_by_mode = {}  # mode label -> actions fired
+        self.started = time.monotonic()
+        self._timers = {}  # One reusable timer per stage (each stage is timed from a single thread)
+
+    def timer(self, stage):
+        """Context manager timing one stage (a shared no-op when disabled)"""
+        if not self.enabled:
+            return NULL_TIMER
+        timer = self._timers.get(stage)
+        if timer is None:
+            timer = self._timers[stage] = _StageTimer(self, stage)
+        return timer
+
+    def record(self, stage, seconds):
+        if not self.enabled:
+            return
+        histogram = self.stages.get(stage)
+        if histogram is None:
+            histogram = self.stages[stage] = LatencyHistogram(self.bounds_ms)
+        histogram.observe(seconds)
+
+    def count(self, name, value=1):
+        if not self.enabled:
+            return
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def count_actions(self, mode, value=1):
+        if not self.enabled or not value:
+            return
+        self.actions_by_mode[mode] = self.actions_by_mode.get(mode, 0) + value
+
+    def reset(self):
+        # New containers instead of clear(), so a concurrent snapshot keeps a consistent view
+        self.stages = {}
+        self.counters = {}
+        self.actions_by_mode = {}
+        self.started = time.monotonic()
+
+    def snapshot(self):
+        """Lock-free copy of every histogram and counter (safe to call from any thread)"""
+        # dict(...) / list(...items()) copy atomically under the GIL, so a writer adding a stage can't break iteration
+        stages = list(self.stages.items())
+        return {
+            "enabled": self.enabled,
+            "uptime_s": time.monotonic() - self.started,
+            "stages": {name: histogram.snapshot() for name, histogram in stages},
+            "counters": dict(self.counters),
+            "actions_by_mode": dict(self.actions_by_mode),
+        }
+
+
+# Shared disabled instance for components created without metrics
+DISABLED = PipelineMetrics(enabled=False)
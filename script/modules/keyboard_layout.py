@@ -0,0 +1,129 @@
+"""
+Keyboard Layout Module - Virtual keyboard layouts and O(1) key hit-testing
+
+Each layout is a list of Buttons in keyboard-window pixels. KeyIndex
+compiles a layout into a label map at keyboard resolution: one int16 per
+pixel, holding the index of the key under it or -1. Finding the key under
+the cursor is then one array lookup instead of a loop over every rectangle.
+
+hover() adds hysteresis. Once a key is hovered, it stays hovered until the
+cursor leaves its rectangle grown by `margin` pixels. This stops jitter at
+a key border, or in the gap between two keys, from flicking the highlight
+(and a pinch) onto the neighbour.
+
+Switch keys (Button.target) change to another layout instead of typing:
+QWERTY -> symbols -> numeric pad -> QWERTY. Suggestion keys (Button.slot)
+on the QWERTY bottom row have no fixed label: the keyboard draws the
+current word completions on them.
+"""
+
+import numpy as np
+
+# Cursor area of the keyboard window (the text strip below it isn't hit-tested)
+KEYBOARD_WIDTH = 1000
+KEYBOARD_HEIGHT = 440
+
+# Word completions shown on the QWERTY bottom row, see word_prediction.py
+SUGGESTION_SLOTS = 3
+
+
+class Button:
+    def __init__(self, pos, text, size=[70, 70], special=False, target=None, slot=None):
+        self.pos = pos
+        self.size = size
+        self.text = text
+        self.special = special  # For special keys like CAPS, SPACE, etc.
+        self.target = target  # Layout this key switches to (None = a key that types)
+        self.slot = slot  # Word suggestion index this key completes with (None = not a suggestion key)
+
+    def contains(self, x, y, margin=0):
+        """Strictly inside the key (grown by `margin` pixels on every side)"""
+        xb, yb = self.pos
+        wb, hb = self.size
+        return xb - margin < x < xb + wb + margin and yb - margin < y < yb + hb + margin
+
+
+def row(keys, x, y, size=(75, 70), step=85):
+    return [Button([x + i * step, y], key, list(size)) for i, key in enumerate(keys)]
+
+
+def qwerty_layout():
+    """Properly styled QWERTY layout"""
+    start_x = 20
+    # Number row (1-0 with even spacing), backspace (larger button at end of number row)
+    buttons = row(["1", "2", "3", "4", "5", "6", "7", "8", "9", "0"], start_x, 15)
+    buttons.append(Button([start_x + 10 * 85, 15], "DEL", [110, 70], special=True))
+    # First letter row (Q-P), caps Lock (larger button at end)
+    buttons += row(["Q", "W", "E", "R", "T", "Y", "U", "I", "O", "P"], start_x, 100)
+    buttons.append(Button([start_x + 10 * 85, 100], "CAPS", [110, 70], special=True))
+    # Second letter row (A-L) with slight offset, enter (larger button)
+    buttons += row(["A", "S", "D", "F", "G", "H", "J", "K", "L"], start_x + 40, 185)
+    buttons.append(Button([start_x + 40 + 9 * 85, 185], "ENTER", [160, 70], special=True))
+    # Third letter row (Z-M) with more offset
+    buttons += row(["Z", "X", "C", "V", "B", "N", "M"], start_x + 60, 270)
+    # Layout switch, swipe mode, space bar and the word suggestion strip (bottom row, easy to reach)
+    buttons.append(Button([start_x, 365], "?123", [110, 65], special=True, target="symbols"))
+    buttons.append(Button([start_x + 120, 365], "SWIPE", [110, 65], special=True))
+    buttons.append(Button([start_x + 240, 365], "SPACE", [180, 65], special=True))
+    for slot in range(SUGGESTION_SLOTS):
+        buttons.append(Button([start_x + 430 + slot * 180, 365], "", [170, 65], special=True, slot=slot))
+    return buttons
+
+
+def symbols_layout():
+    start_x = 20
+    buttons = row(["1", "2", "3", "4", "5", "6", "7", "8", "9", "0"], start_x, 15)
+    buttons.append(Button([start_x + 10 * 85, 15], "DEL", [110, 70], special=True))
+    buttons += row(["!", "@", "#", "$", "%", "^", "&", "*", "(", ")"], start_x, 100)
+    buttons += row(["-", "_", "=", "+", "[", "]", ";", ":", "'"], start_x + 40, 185)
+    buttons.append(Button([start_x + 40 + 9 * 85, 185], "ENTER", [160, 70], special=True))
+    buttons += row([",", ".", "/", "?", "<", ">", '"'], start_x + 60, 270)
+    buttons.append(Button([start_x, 365], "NUM", [110, 65], special=True, target="numeric"))
+    buttons.append(Button([start_x + 120, 365], "SPACE", [650, 65], special=True))
+    return buttons
+
+
+def numeric_layout():
+    """Calculator-style pad with large keys"""
+    start_x = 20
+    buttons = []
+    for i, keys in enumerate((["7", "8", "9", "+"], ["4", "5", "6", "-"], ["1", "2", "3", "*"], [".", "0", "=", "/"])):
+        buttons += row(keys, start_x, 15 + i * 85, size=(125, 75), step=135)
+    buttons.append(Button([start_x + 4 * 135 + 20, 15], "DEL", [200, 75], special=True))
+    buttons.append(Button([start_x + 4 * 135 + 20, 100], "ENTER", [200, 160], special=True))
+    buttons.append(Button([start_x, 365], "ABC", [110, 65], special=True, target="qwerty"))
+    buttons.append(Button([start_x + 120, 365], "SPACE", [650, 65], special=True))
+    return buttons
+
+
+LAYOUTS = {
+    "qwerty": qwerty_layout,
+    "symbols": symbols_layout,
+    "numeric": numeric_layout,
+}
+
+
+class KeyIndex:
+    def __init__(self, buttons, width=KEYBOARD_WIDTH, height=KEYBOARD_HEIGHT, margin=12):
+        self.buttons = buttons
+        self.margin = margin  # Hysteresis: how far the cursor may stray outside the hovered key
+        self.labels = np.full((height, width), -1, dtype=np.int16)
+        # Paint in reverse so that where keys overlap the first one wins, as the old linear scan did
+        for index in range(len(buttons) - 1, -1, -1):
+            xb, yb = buttons[index].pos
+            wb, hb = buttons[index].size
+            self.labels[max(yb + 1, 0):yb + hb, max(xb + 1, 0):xb + wb] = index
+
+    def lookup(self, x, y):
+        """Key strictly inside which (x, y) lies, or None"""
+        height, width = self.labels.shape
+        if not (0 <= x < width and 0 <= y < height):
+            return None
+        index = self.labels[y, x]
+        return self.buttons[index] if index >= 0 else None
+
+    def hover(self, x, y, current=None):
+        """Key under the cursor, keeping `current` while the cursor is within its margin"""
+        if current is not None and current.contains(x, y, self.margin):
+            return current
+        return self.lookup(x, y)
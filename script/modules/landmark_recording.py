@@ -0,0 +1,142 @@
+"""
+Landmark Recording Module - Compact binary recordings of per-frame hand landmarks
+
+GestureControl can record every frame it runs inference on: the capture
+timestamp, handedness and 21 landmarks per hand. The file is a 32-byte header
+followed by fixed-size records. Each coordinate is quantized to uint16 over
+[-1, 2] (about 0.03 px at 640x480), so one two-hand frame takes 263 bytes.
+Records are appended as they arrive. For reading, the file is opened as a
+NumPy memmap, so recordings of any length load instantly and frames are
+decoded only when they are accessed.
+
+    header: magic b"GCLM" | version u16 | frame width u16 | frame height u16 | reserved (22 bytes)
+    record: timestamp f8 | hand count u1 | is_left u1[2] | points u2[2, 21, 3]
+"""
+
+import struct
+
+import numpy as np
+
+from .hand_features import NUM_LANDMARKS
+from .observation import FrameObservation, HandObservation
+
+MAGIC = b"GCLM"
+VERSION = 1
+HEADER = struct.Struct("<4sHHH22x")
+MAX_HANDS = 2
+
+# Quantization range for normalized x, y, z (landmarks can fall slightly outside [0, 1])
+COORD_MIN = -1.0
+COORD_MAX = 2.0
+QUANT_SCALE = 65535.0 / (COORD_MAX - COORD_MIN)
+
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("num_hands", "u1"),
+    ("is_left", "u1", (MAX_HANDS,)),
+    ("points", "<u2", (MAX_HANDS, NUM_LANDMARKS, 3)),
+])
+
+
+def quantize(points):
+    """float (..., 21, 3) normalized landmarks -> uint16"""
+    scaled = (np.asarray(points, dtype=np.float64) - COORD_MIN) * QUANT_SCALE
+    return np.clip(np.rint(scaled), 0, 65535).astype(np.uint16)
+
+
+def dequantize(quantized):
+    """uint16 landmarks -> float32 normalized coordinates"""
+    return (quantized.astype(np.float32) / np.float32(QUANT_SCALE) + np.float32(COORD_MIN)).astype(np.float32)
+
+
+class LandmarkRecorder:
+    """Appends one record per processed frame to a recording file"""
+
+    def __init__(self, path, frame_width=640, frame_height=480):
+        self.path = path
+        self.frame_width = frame_width
+        self.frame_height = frame_height
+        self.frames_recorded = 0
+        self._record = np.zeros(1, dtype=RECORD_DTYPE)
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, frame_width, frame_height))
+
+    def record(self, observation, timestamp):
+        """Write one frame; hands beyond MAX_HANDS are not recorded"""
+        record = self._record
+        count = min(len(observation.hands), MAX_HANDS)
+        record["timestamp"] = timestamp
+        record["num_hands"] = count
+        record["is_left"] = 0
+        record["points"] = 0
+        if count:
+            record["is_left"][0, :count] = observation.is_left[:count]
+            record["points"][0, :count] = quantize(observation.points[:count])
+        self._file.write(record.tobytes())
+        self.frames_recorded += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class LandmarkRecording:
+    """Read-only, memory-mapped view of a recording file"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{path}: not a landmark recording (file too short)")
+        magic, version, self.frame_width, self.frame_height = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a landmark recording")
+        if version != VERSION:
+            raise ValueError(f"{path}: unsupported recording version {version}")
+
+        with open(path, "rb") as file:
+            file.seek(0, 2)
+            size = file.tell()
+        # A partially written last record (e.g. after a crash) is ignored
+        count = (size - HEADER.size) // RECORD_DTYPE.itemsize
+        if count:
+            self.frames = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+        else:
+            self.frames = np.zeros(0, dtype=RECORD_DTYPE)
+
+    def __len__(self):
+        return len(self.frames)
+
+    @property
+    def frame_shape(self):
+        return (self.frame_height, self.frame_width, 3)
+
+    @property
+    def timestamps(self):
+        return self.frames["timestamp"]
+
+    @property
+    def duration(self):
+        return float(self.timestamps[-1] - self.timestamps[0]) if len(self) > 1 else 0.0
+
+    def observation(self, index):
+        """Rebuild the FrameObservation of one recorded frame (landmarks are None - points only)"""
+        record = self.frames[index]
+        count = int(record["num_hands"])
+        points = dequantize(record["points"][:count])
+        hands = [
+            HandObservation("left" if record["is_left"][idx] else "right", None, self.frame_width, self.frame_height, points[idx])
+            for idx in range(count)
+        ]
+        return FrameObservation(self.frame_shape, hands, points)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield float(self.frames[index]["timestamp"]), self.observation(index)
@@ -0,0 +1,110 @@
+"""
+Lazy Import Module - Deferred mode imports, background preloading and import timing
+
+Importing every mode module up front pulls pyautogui, pygetwindow, pynput,
+keyboard and the win32 bindings in before the camera opens. Mode handlers
+are now imported by LazyImporter.load() the first time their mode is
+activated. A ModePreloader can also import them on a background thread once
+the engine is running. Python's per-module import locks make a mode
+activation that races the preloader wait for that one module only.
+
+Every lazy load records its cumulative time and how many modules it pulled
+in. For a per-module breakdown of startup, import_time_report() runs a
+statement under `python -X importtime` and parses the self and cumulative
+time of every module.
+"""
+
+import importlib
+import subprocess
+import sys
+import threading
+import time
+
+from .logger import log
+
+
+class LazyImporter:
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.loads = {}  # module name -> {"seconds", "new_modules", "thread"}; only imports that did work
+
+    def load(self, name):
+        """Import a module on first use (thread-safe) and record what the import cost"""
+        # Always go through import_module: a module another thread is still importing is already in
+        # sys.modules, and import_module waits for it to finish instead of returning it half-initialized
+        loaded = name in sys.modules
+        before = len(sys.modules)
+        start = self.clock()
+        module = importlib.import_module(name)
+        seconds = self.clock() - start
+        if not loaded and name not in self.loads:
+            # Approximate when two threads import at once; the first record wins
+            self.loads[name] = {
+                "seconds": seconds,
+                "new_modules": len(sys.modules) - before,
+                "thread": threading.current_thread().name,
+            }
+            log.info("lazy_import", "📦 Loaded %s in %.0f ms", name.rsplit(".", 1)[-1], seconds * 1000)
+        return module
+
+    def attribute(self, module_name, attribute):
+        return getattr(self.load(module_name), attribute)
+
+    def stats(self):
+        return {name: dict(record) for name, record in self.loads.items()}
+
+
+class ModePreloader:
+    """Imports module names one by one on a daemon thread"""
+
+    def __init__(self, importer, module_names):
+        self.importer = importer
+        self.module_names = list(module_names)
+        self.failed = {}  # module name -> error message
+        self._thread = None
+
+    @property
+    def started(self):
+        return self._thread is not None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="mode-preload", daemon=True)
+            self._thread.start()
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        for name in self.module_names:
+            try:
+                self.importer.load(name)
+            except Exception as e:
+                # A missing platform backend only breaks its own mode, and only when that mode is used
+                self.failed[name] = f"{type(e).__name__}: {e}"
+                log.warning("preload", "⚠ Could not preload %s: %s", name, e)
+
+
+def parse_importtime(stderr):
+    """Parse `python -X importtime` output into [(module, self_us, cumulative_us)] in import order"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # The header line
+        entries.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return entries
+
+
+def import_time_report(statement, cwd=None, python=sys.executable):
+    """Run statement in a fresh interpreter with -X importtime and return its per-module timings"""
+    process = subprocess.run(
+        [python, "-X", "importtime", "-c", statement],
+        cwd=cwd, capture_output=True, text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"{statement!r} failed:\n{process.stderr[-2000:]}")
+    return parse_importtime(process.stderr)
@@ -0,0 +1,166 @@
+"""
+Logger Module - Leveled, rate-limited logging off the frame loop
+
+Writing to the console from the frame loop is slow, and on Windows consoles
+with emoji especially so. Here a log call only checks the level and the rate
+limit, then appends (level, key, format, args) to a ring buffer. A daemon
+thread formats the buffered records and writes them in batches every
+flush_interval seconds.
+
+Every message has a key. A call can pass every=seconds to emit that key at
+most once per interval; the suppressed count is appended to the next line
+that gets through. Messages are %-formatted on the flush thread, so a
+disabled DEBUG call costs one comparison. Pass values that won't be mutated
+afterwards. When the buffer is full, the oldest records are dropped and the
+number dropped is reported.
+
+The level defaults to INFO and can be set with the GESTURE_LOG_LEVEL
+environment variable or with log.set_level().
+"""
+
+import atexit
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR}
+
+
+def parse_level(level):
+    """Level number from an int or a name such as "debug" """
+    if isinstance(level, int):
+        return level
+    try:
+        return LEVELS[str(level).strip().lower()]
+    except KeyError:
+        raise ValueError(f"Unknown log level: {level!r}") from None
+
+
+class Logger:
+    def __init__(self, level=INFO, capacity=1024, flush_interval=0.25, stream=None, clock=time.monotonic, background=True):
+        self.level = parse_level(level)
+        self.flush_interval = flush_interval
+        self.stream = stream  # None = whatever sys.stdout is at flush time
+        self.clock = clock
+        self.background = background  # False = write on every call (tests, short scripts)
+        self.dropped = 0  # Records lost to buffer overflow since the last flush
+        self._buffer = deque(maxlen=capacity)
+        self._limits = {}  # key -> [next allowed time, suppressed count]
+        self._write_lock = threading.Lock()  # Only taken by flush(), never by the log calls
+        self._wake = threading.Event()
+        self._thread = None
+
+    def set_level(self, level):
+        self.level = parse_level(level)
+
+    def enabled(self, level):
+        """Guard for call sites whose arguments are expensive to compute"""
+        return level >= self.level
+
+    def debug(self, key, message, *args, every=None):
+        if DEBUG >= self.level:
+            self._log(DEBUG, key, message, args, every)
+
+    def info(self, key, message, *args, every=None):
+        if INFO >= self.level:
+            self._log(INFO, key, message, args, every)
+
+    def warning(self, key, message, *args, every=None):
+        if WARNING >= self.level:
+            self._log(WARNING, key, message, args, every)
+
+    def error(self, key, message, *args, every=None):
+        if ERROR >= self.level:
+            self._log(ERROR, key, message, args, every)
+
+    def _log(self, level, key, message, args, every):
+        suppressed = 0
+        if every is not None:
+            now = self.clock()
+            limit = self._limits.get(key)
+            if limit is None:
+                self._limits[key] = [now + every, 0]
+            elif now < limit[0]:
+                limit[1] += 1
+                return
+            else:
+                suppressed = limit[1]
+                limit[0] = now + every
+                limit[1] = 0
+
+        buffer = self._buffer
+        if len(buffer) == buffer.maxlen:
+            self.dropped += 1
+        buffer.append((level, message, args, suppressed))
+        if not self.background:
+            self.flush()
+        elif self._thread is None:
+            self._start()
+
+    def _start(self):
+        self._thread = threading.Thread(target=self._run, name="log-flush", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Format and write every buffered record (safe from any thread)"""
+        with self._write_lock:
+            lines = []
+            if self.dropped:
+                lines.append(f"⚠ {self.dropped} log records dropped (buffer full)")
+                self.dropped = 0
+            buffer = self._buffer
+            while buffer:
+                try:
+                    level, message, args, suppressed = buffer.popleft()
+                except IndexError:
+                    break
+                if args:
+                    try:
+                        message = message % args
+                    except Exception as e:
+                        message = f"{message} {args!r} (format error: {e})"
+                if suppressed:
+                    message = f"{message} (+{suppressed} suppressed)"
+                lines.append(message)
+            if lines:
+                self._write("\n".join(lines) + "\n")
+
+    def _write(self, text):
+        stream = self.stream if self.stream is not None else sys.stdout
+        if stream is None:
+            return
+        try:
+            stream.write(text)
+        except UnicodeEncodeError:
+            # Legacy Windows consoles can't encode the emoji
+            encoding = getattr(stream, "encoding", None) or "ascii"
+            stream.write(text.encode(encoding, "replace").decode(encoding))
+        try:
+            stream.flush()
+        except (AttributeError, ValueError):
+            pass
+
+
+def _level_from_env():
+    try:
+        return parse_level(os.getenv("GESTURE_LOG_LEVEL", "info"))
+    except ValueError:
+        return INFO
+
+
+# Shared engine logger
+log = Logger(level=_level_from_env())
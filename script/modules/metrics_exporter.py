@@ -0,0 +1,220 @@
+"""
+Metrics Exporter Module - Localhost HTTP endpoint for the engine's metrics
+
+An opt-in HTTP server for remote visibility on kiosks. It runs on its own
+daemon thread and serves the engine's latency histograms, pipeline counters,
+capture drops, actuator queue and idle-state stats:
+
+    GET /metrics       Prometheus text exposition format (version 0.0.4)
+    GET /metrics.json  the same data as a JSON snapshot
+
+Every request calls engine.metrics_snapshot() and engine.idle_stats(). Both
+read without locks (see the instrumentation module), so scraping never
+blocks the frame loop. The server binds to 127.0.0.1 by default. Expose it
+through an SSH tunnel or a local agent, not by binding to 0.0.0.0.
+"""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 9464
+PREFIX = "gesture"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _metric_name(name):
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name).strip("_").lower()
+
+
+def _label_value(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(int(value))
+
+
+class _Writer:
+    """Collects exposition lines, writing HELP/TYPE once per metric family"""
+
+    def __init__(self):
+        self.lines = []
+        self._declared = set()
+
+    def family(self, name, kind, help_text):
+        if name not in self._declared:
+            self._declared.add(name)
+            self.lines.append(f"# HELP {name} {help_text}")
+            self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name, value, **labels):
+        if labels:
+            label_text = ",".join(f'{key}="{_label_value(val)}"' for key, val in labels.items())
+            self.lines.append(f"{name}{{{label_text}}} {_number(value)}")
+        else:
+            self.lines.append(f"{name} {_number(value)}")
+
+    def text(self):
+        return "\n".join(self.lines) + "\n"
+
+
+def prometheus_text(snapshot, idle=None):
+    """Render a GestureControl.metrics_snapshot() (and optional idle_stats()) in Prometheus text format"""
+    out = _Writer()
+
+    name = f"{PREFIX}_uptime_seconds"
+    out.family(name, "gauge", "Seconds since the metrics were started or reset")
+    out.sample(name, snapshot.get("uptime_s", 0.0))
+
+    stages = snapshot.get("stages", {})
+    if stages:
+        name = f"{PREFIX}_stage_latency_seconds"
+        out.family(name, "histogram", "Per-stage latency of the frame pipeline")
+        for stage, histogram in sorted(stages.items()):
+            cumulative = 0
+            for bound_ms, count in zip(histogram["buckets_ms"], histogram["bucket_counts"]):
+                cumulative += count
+                out.sample(f"{name}_bucket", cumulative, stage=stage, le=_number(bound_ms / 1000.0))
+            out.sample(f"{name}_bucket", histogram["count"], stage=stage, le="+Inf")
+            out.sample(f"{name}_sum", histogram["sum_ms"] / 1000.0, stage=stage)
+            out.sample(f"{name}_count", histogram["count"], stage=stage)
+
+    for counter, value in sorted(snapshot.get("counters", {}).items()):
+        name = f"{PREFIX}_{_metric_name(counter)}_total"
+        out.family(name, "counter", f"Pipeline counter '{counter}'")
+        out.sample(name, value)
+
+    actions = snapshot.get("actions_by_mode", {})
+    if actions:
+        name = f"{PREFIX}_actions_total"
+        out.family(name, "counter", "Actions fired per mode")
+        for mode, value in sorted(actions.items()):
+            out.sample(name, value, mode=mode)
+
+    for key, value in sorted(snapshot.get("capture", {}).items()):
+        name = f"{PREFIX}_capture_{_metric_name(key)}_total"
+        out.family(name, "counter", f"Capture stage: {key.replace('_', ' ')}")
+        out.sample(name, value)
+
+    actuator = snapshot.get("actuator", {})
+    for key in ("depth", "max_depth"):
+        if key in actuator:
+            name = f"{PREFIX}_actuator_queue_{key}"
+            out.family(name, "gauge", f"Actuator queue {key.replace('_', ' ')}")
+            out.sample(name, actuator[key])
+    for key in ("submitted", "executed", "coalesced", "dropped", "expired", "failed"):
+        if key in actuator:
+            name = f"{PREFIX}_actuator_{key}_total"
+            out.family(name, "counter", f"Actions {key} by the actuator")
+            out.sample(name, actuator[key])
+    if "last_latency_ms" in actuator:
+        name = f"{PREFIX}_actuator_last_latency_seconds"
+        out.family(name, "gauge", "Submit-to-execute latency of the last action")
+        out.sample(name, actuator["last_latency_ms"] / 1000.0)
+
+    if idle:
+        name = f"{PREFIX}_idle"
+        out.family(name, "gauge", "1 while the engine is in the idle (low-rate probing) state")
+        out.sample(name, 1 if idle["state"] == "idle" else 0)
+        name = f"{PREFIX}_state_seconds_total"
+        out.family(name, "counter", "Wall time spent per power state")
+        for state, seconds in sorted(idle["time_in_state"].items()):
+            out.sample(name, seconds, state=state)
+        name = f"{PREFIX}_state_cpu_seconds_total"
+        out.family(name, "counter", "Process CPU time spent per power state")
+        for state, seconds in sorted(idle["cpu_in_state"].items()):
+            out.sample(name, seconds, state=state)
+        name = f"{PREFIX}_idle_frames_skipped_total"
+        out.family(name, "counter", "Captured frames skipped by the idle probe rate")
+        out.sample(name, idle["frames_skipped"])
+        name = f"{PREFIX}_idle_wakeups_total"
+        out.family(name, "counter", "Idle to active transitions")
+        out.sample(name, idle["wakeups"])
+
+    return out.text()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    exporter = None  # Set on the per-server subclass
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        try:
+            if path == "/metrics":
+                body = self.exporter.prometheus().encode("utf-8")
+                content_type = PROMETHEUS_CONTENT_TYPE
+            elif path == "/metrics.json":
+                body = json.dumps(self.exporter.snapshot()).encode("utf-8")
+                content_type = "application/json"
+            else:
+                self.send_error(404, "Try /metrics or /metrics.json")
+                return
+        except Exception as e:
+            self.send_error(500, f"Snapshot failed: {e}")
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes every few seconds would flood the console
+
+
+class MetricsExporter:
+    """Serves an engine's metrics over HTTP; engine is anything with metrics_snapshot() (and optionally idle_stats())"""
+
+    def __init__(self, engine, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.engine = engine
+        self.host = host
+        self.port = port  # 0 picks a free port; the bound port is available after start()
+        self._server = None
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._server is not None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def snapshot(self):
+        snapshot = self.engine.metrics_snapshot()
+        idle_stats = getattr(self.engine, "idle_stats", None)
+        if idle_stats is not None:
+            snapshot["idle"] = idle_stats()
+        state = getattr(self.engine, "state", None)
+        if state is not None:
+            snapshot["state"] = state.latest.as_dict()
+        return snapshot
+
+    def prometheus(self):
+        snapshot = self.snapshot()
+        return prometheus_text(snapshot, snapshot.get("idle"))
+
+    def start(self):
+        if self._server is not None:
+            return
+        handler = type("MetricsHandler", (_Handler,), {"exporter": self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-exporter", daemon=True)
+        self._thread.start()
+        print(f"📈 Metrics available at {self.url}/metrics")
+
+    def stop(self):
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=1.0)
+        self._server = None
+        self._thread = None
@@ -0,0 +1,49 @@
+"""
+Mode Registry Module - Builds each mode handler once and switches between them
+
+GestureControl used to construct a new controller object on every frame.
+The registry builds each handler lazily on first use, keeps it for the rest
+of the session and calls optional activate()/deactivate() hooks when the
+left-hand mode changes, so per-mode state (cursor smoothing, repeat
+suppression, parsed config) survives between frames.
+"""
+
+
+class ModeRegistry:
+    def __init__(self, factories):
+        self._factories = dict(factories)  # mode name -> zero-argument callable building the handler
+        self._handlers = {}
+        self.active_mode = None
+
+    def __contains__(self, mode):
+        return mode in self._factories
+
+    def get(self, mode):
+        """Return the handler for a mode, building it on first use (None for unknown modes)"""
+        handler = self._handlers.get(mode)
+        if handler is None and mode in self._factories:
+            handler = self._factories[mode]()
+            self._handlers[mode] = handler
+        return handler
+
+    def built(self):
+        """Handlers constructed so far, keyed by mode"""
+        return dict(self._handlers)
+
+    def activate(self, mode):
+        """Make mode the active one, running deactivate/activate hooks on a change"""
+        if mode == self.active_mode:
+            return self.get(mode)
+
+        previous = self._handlers.get(self.active_mode)
+        if previous is not None and hasattr(previous, "deactivate"):
+            previous.deactivate()
+
+        self.active_mode = mode if mode in self._factories else None
+        handler = self.get(self.active_mode)
+        if handler is not None and hasattr(handler, "activate"):
+            handler.activate()
+        return handler
+
+    def deactivate_all(self):
+        self.activate(None)
@@ -5,35 +5,44 @@ Author: Rohan S.
 GitHub: https://github.com/Rohan9731
 """
 
-import math
 import platform
 import numpy as np
-import pyautogui
+
+from .actuator import Action, emit
+from .backends import OS_BACKENDS
+from .hand_features import INDEX_TIP, MIDDLE_TIP, THUMB_TIP, pixel_distance
 
 
 class MouseControl:
-    def __init__(self, hand_tracker):
+    def __init__(self, hand_tracker, dispatcher=None, backends=None):
         self.mouse = None
         self.hand_tracker = hand_tracker
+        self.dispatcher = dispatcher  # ActionDispatcher for mouse events, None = run inline
+        self.backends = backends if backends is not None else OS_BACKENDS  # OS input libraries, imported on first use (StubBackends in replay)
         self.os = platform.system()
-        self.screen_width, self.screen_height = pyautogui.size()
+        self.screen_width, self.screen_height = self.backends.pyautogui.size()
         self.w_cam, self.h_cam = 640, 480
         self.frame_r = 100
         self.p_loc_x, self.p_loc_y = 0, 0
         self.c_loc_x, self.c_loc_y = 0, 0
 
         if self.os == "Windows":
-            import mouse
-
-            self.mouse = mouse
+            self.mouse = self.backends.mouse
 
         elif self.os == "Darwin":
-            import macmouse
+            self.mouse = self.backends.macmouse
 
-            self.mouse = macmouse
+    def deactivate(self):
+        """Reset cursor smoothing when leaving mouse mode"""
+        self.p_loc_x, self.p_loc_y = 0, 0
+        self.c_loc_x, self.c_loc_y = 0, 0
 
-    def control_mouse(self, raised_fingers, frame):
-        landmarks = self.hand_tracker.find_position(frame, True)
+    def _mouse_call(self, method, *args):
+        # Resolved on the actuator worker, so handlers (and landmark replay) never touch the mouse backend
+        getattr(self.mouse, method)(*args)
+
+    def control_mouse(self, raised_fingers, observation):
+        landmarks = self.hand_tracker.find_position(observation, mouse_control=True)
         if landmarks is not None and len(landmarks) != 0:
             if raised_fingers == [0, 1, 1, 0, 0]:
                 if landmarks is not None and len(landmarks) != 0:
@@ -52,18 +61,21 @@ class MouseControl:
                     )
                     self.c_loc_x = self.p_loc_x + (x3 - self.p_loc_x) / 5
                     self.c_loc_y = self.p_loc_y + (y3 - self.p_loc_y) / 5
-                    self.mouse.move(x3, y3)
+                    # Only the newest cursor target matters - superseded moves are coalesced
+                    emit(self.dispatcher, Action(
+                        "mouse_move", self._mouse_call, ("move", x3, y3), coalesce_key="mouse_move", timeout=0.1
+                    ))
                     self.p_loc_x, self.p_loc_y = self.c_loc_x, self.c_loc_y
 
             # everything except thumb
             elif raised_fingers == [0, 1, 1, 1, 1]:
                 # scroll up
-                self.mouse.wheel(-3)
+                emit(self.dispatcher, Action("mouse_wheel", self._mouse_call, ("wheel", -3), timeout=0.3))
 
             # all fingers
             elif raised_fingers == [1, 1, 1, 1, 1]:
                 # scroll down
-                self.mouse.wheel(3)
+                emit(self.dispatcher, Action("mouse_wheel", self._mouse_call, ("wheel", 3), timeout=0.3))
 
             if (
                 landmarks is not None
@@ -74,15 +86,16 @@ class MouseControl:
                     or raised_fingers != [1, 1, 1, 1, 1]
                 )
             ):
+                # thumb-index and thumb-middle pinch lengths in one vectorized call
+                hand = observation.hand("right")
+                index_length, middle_length = pixel_distance(
+                    hand.points, THUMB_TIP, [INDEX_TIP, MIDDLE_TIP], observation.frame_width, observation.frame_height
+                )
+
                 # left click
-                x1, y1 = landmarks[4][1], landmarks[4][2]
-                x2, y2 = landmarks[8][1], landmarks[8][2]
-                length = math.hypot(x2 - x1, y2 - y1)
-                if length < 27:
-                    self.mouse.click("left")
+                if index_length < 27:
+                    emit(self.dispatcher, Action("mouse_click", self._mouse_call, ("click", "left"), timeout=0.5))
 
                 # right click
-                x2, y2 = landmarks[12][1], landmarks[12][2]
-                length = math.hypot(x2 - x1, y2 - y1)
-                if length < 27:
-                    self.mouse.click("right")
+                if middle_length < 27:
+                    emit(self.dispatcher, Action("mouse_click", self._mouse_call, ("click", "right"), timeout=0.5))
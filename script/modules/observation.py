@@ -0,0 +1,76 @@
+"""
+Frame Observation Module - Single per-frame snapshot of the MediaPipe hand results
+
+The engine runs one landmark inference per camera frame and wraps the result
+in a FrameObservation. Mode handlers read landmarks, handedness and pixel
+coordinates from it instead of calling Hands.process() a second time.
+"""
+
+import numpy as np
+
+from .hand_features import NUM_LANDMARKS, landmarks_to_array
+
+
+class HandObservation:
+    def __init__(self, handedness, landmarks, frame_width, frame_height, points=None):
+        self.handedness = handedness  # "left" or "right" (lower case)
+        self.landmarks = landmarks  # MediaPipe NormalizedLandmarkList
+        # (21, 3) float32 normalized x, y, z - converted from the protobuf once per hand
+        self.points = points if points is not None else landmarks_to_array(landmarks)
+        self.frame_width = frame_width
+        self.frame_height = frame_height
+        self._positions = None
+
+    @property
+    def positions(self):
+        """[id, cx, cy] per landmark in pixel coordinates, same layout find_position used to return.
+
+        Built on first access only; most modes work on the float points directly.
+        """
+        if self._positions is None:
+            pixels = (self.points[:, :2] * np.array([self.frame_width, self.frame_height], dtype=np.float32)).astype(int)
+            self._positions = np.column_stack((np.arange(NUM_LANDMARKS), pixels)).tolist()
+        return self._positions
+
+
+class FrameObservation:
+    def __init__(self, frame_shape, hands=None, points=None):
+        self.frame_height, self.frame_width = frame_shape[:2]
+        self.hands = hands or []
+        # (N, 21, 3) landmarks of all hands, ready for batched classification
+        if points is None:
+            points = np.stack([hand.points for hand in self.hands]) if self.hands else np.empty((0, NUM_LANDMARKS, 3), np.float32)
+        self.points = points
+        self.is_left = np.array([hand.handedness == "left" for hand in self.hands], dtype=bool)
+
+    @classmethod
+    def from_results(cls, results, frame_shape, region=None):
+        """Build an observation from a MediaPipe Hands result.
+
+        region is the RegionOfInterest the inference ran on, if it ran on a crop.
+        Points and the protobuf landmarks are both remapped to full-frame coordinates.
+        """
+        frame_height, frame_width = frame_shape[:2]
+        multi_hand_landmarks = results.multi_hand_landmarks or []
+        points = np.empty((len(multi_hand_landmarks), NUM_LANDMARKS, 3), dtype=np.float32)
+        hands = []
+        for idx, hand_landmarks in enumerate(multi_hand_landmarks):
+            handedness = results.multi_handedness[idx].classification[0].label.lower()
+            landmarks_to_array(hand_landmarks, out=points[idx])
+            if region is not None:
+                region.remap(points[idx])
+                # Keep hand.landmarks (drawing utils, legacy callers) in the same coordinate space
+                for landmark, (x, y, z) in zip(hand_landmarks.landmark, points[idx].tolist()):
+                    landmark.x, landmark.y, landmark.z = x, y, z
+            hands.append(HandObservation(handedness, hand_landmarks, frame_width, frame_height, points[idx]))
+        return cls(frame_shape, hands, points)
+
+    def __bool__(self):
+        return len(self.hands) > 0
+
+    def hand(self, hand_type):
+        """Return the first hand with the given handedness, or None"""
+        for hand in self.hands:
+            if hand.handedness == hand_type:
+                return hand
+        return None
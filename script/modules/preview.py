@@ -0,0 +1,80 @@
+"""
+Preview Module - Downscaled RGB preview frames for the GUI video panel
+
+The vision thread used to copy every full-resolution frame for the GUI,
+even with the camera feed hidden. The Tk thread then copied, resized and
+colour-converted it again. PreviewPublisher does that work once on the
+producer side, and only while a consumer is subscribed. It resizes straight
+from the frame (no intermediate copy), converts to RGB in place and
+publishes at no more than the display rate. Each preview is a fresh array
+handed over by swapping one reference, so the consumer reads the latest
+frame without locks and never sees a half-written image.
+"""
+
+import threading
+import time
+
+import cv2
+
+
+class PreviewFrame:
+    __slots__ = ("image", "seq", "timestamp")
+
+    def __init__(self, image, seq, timestamp):
+        self.image = image  # RGB uint8 array at the publisher's size
+        self.seq = seq  # 1-based, increments with every published preview
+        self.timestamp = timestamp
+
+
+class PreviewPublisher:
+    def __init__(self, size=(480, 320), fps=30, clock=time.monotonic):
+        self.size = size  # (width, height) of the preview
+        self.interval = 1.0 / fps if fps else 0
+        self.clock = clock
+        self.latest = None  # Newest PreviewFrame (None until a subscriber gets one)
+        self.published = 0
+        self.skipped = 0  # Frames offered while subscribed but ahead of the display rate
+        self._subscribers = 0
+        self._lock = threading.Lock()  # Guards the subscriber count (Tk thread); publish() never takes it
+        self._next_due = 0.0
+
+    @property
+    def active(self):
+        return self._subscribers > 0
+
+    def subscribe(self):
+        """Start producing previews; returns a function that ends this subscription (safe to call twice)"""
+        with self._lock:
+            self._subscribers += 1
+        state = {"open": True}
+
+        def unsubscribe():
+            with self._lock:
+                if state["open"]:
+                    state["open"] = False
+                    self._subscribers -= 1
+                    if self._subscribers == 0:
+                        self.latest = None  # Don't hold on to the last image while nobody is watching
+
+        return unsubscribe
+
+    def publish(self, frame):
+        """Offer a BGR frame from the vision thread; returns True if a preview was produced"""
+        if not self._subscribers:
+            return False
+        now = self.clock()
+        if now < self._next_due:
+            self.skipped += 1
+            return False
+        # Keep the cadence anchored to the schedule (camera jitter doesn't halve the rate), but don't burst after a stall
+        if now - self._next_due > self.interval:
+            self._next_due = now
+        self._next_due += self.interval
+        image = cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
+        self.published += 1
+        self.latest = PreviewFrame(image, self.published, now)
+        return True
+
+    def stats(self):
+        return {"subscribers": self._subscribers, "published": self.published, "skipped": self.skipped}
@@ -0,0 +1,166 @@
+"""
+Region Of Interest Module - Cropped landmark inference around the last known hands
+
+Once every expected hand is tracked, HandTracker runs Hands.process() on a
+padded crop around the previous frame's hands, downscaled to a small target
+size, instead of the full 640x480 frame. Landmarks from the crop are remapped
+to full-frame normalized coordinates, so the rest of the pipeline never sees
+the crop. The crop is kept fixed while the hands stay well inside it, which
+keeps MediaPipe's own frame-to-frame tracking stable. Whenever the crop does
+change, HandTracker resets that tracking, since it refers to the previous
+image. Tracking is dropped back to full-frame inference as soon as a hand is
+lost.
+
+Pure NumPy geometry - no OpenCV - so it can be unit tested without a camera.
+"""
+
+import numpy as np
+
+
+class RegionOfInterest:
+    """Pixel crop [x0, x1) x [y0, y1) of a frame and the downscale applied before inference"""
+
+    def __init__(self, x0, y0, x1, y1, frame_width, frame_height, scale=1.0):
+        self.x0, self.y0, self.x1, self.y1 = int(x0), int(y0), int(x1), int(y1)
+        self.frame_width = frame_width
+        self.frame_height = frame_height
+        self.scale = scale  # <= 1.0, crop is resized by this factor before inference
+
+    @property
+    def width(self):
+        return self.x1 - self.x0
+
+    @property
+    def height(self):
+        return self.y1 - self.y0
+
+    @property
+    def inference_size(self):
+        """(width, height) of the image handed to Hands.process"""
+        return max(1, round(self.width * self.scale)), max(1, round(self.height * self.scale))
+
+    @property
+    def area_ratio(self):
+        return (self.width * self.height) / float(self.frame_width * self.frame_height)
+
+    def crop(self, frame):
+        """View of the frame inside the region (no copy, not yet downscaled)"""
+        return frame[self.y0:self.y1, self.x0:self.x1]
+
+    def contains(self, box, margin=0.0):
+        """True if a normalized (x_min, y_min, x_max, y_max) box lies inside the region,
+        at least margin (fraction of the region size) away from every inner edge"""
+        x_min, y_min, x_max, y_max = box
+        pad_x = margin * self.width
+        pad_y = margin * self.height
+        # Edges clamped to the frame border cannot move further out, so they need no margin
+        return (
+            x_min * self.frame_width >= self.x0 + (pad_x if self.x0 > 0 else 0)
+            and y_min * self.frame_height >= self.y0 + (pad_y if self.y0 > 0 else 0)
+            and x_max * self.frame_width <= self.x1 - (pad_x if self.x1 < self.frame_width else 0)
+            and y_max * self.frame_height <= self.y1 - (pad_y if self.y1 < self.frame_height else 0)
+        )
+
+    def remap(self, points):
+        """Map (..., 21, 3) landmarks normalized to the crop back to full-frame normalized coordinates, in place.
+
+        Resizing does not change normalized coordinates, so only the crop offset and size matter.
+        z is on the same scale as x (MediaPipe normalizes it by image width).
+        """
+        x_scale = self.width / float(self.frame_width)
+        y_scale = self.height / float(self.frame_height)
+        points[..., 0] *= x_scale
+        points[..., 0] += self.x0 / float(self.frame_width)
+        points[..., 1] *= y_scale
+        points[..., 1] += self.y0 / float(self.frame_height)
+        points[..., 2] *= x_scale
+        return points
+
+    def __repr__(self):
+        return f"RegionOfInterest(({self.x0}, {self.y0})-({self.x1}, {self.y1}), scale={self.scale:.2f})"
+
+
+def bounding_box(points):
+    """Normalized (x_min, y_min, x_max, y_max) covering every landmark of an (N, 21, 3) or (21, 3) array"""
+    xy = points[..., :2].reshape(-1, 2)
+    x_min, y_min = xy.min(axis=0)
+    x_max, y_max = xy.max(axis=0)
+    return float(x_min), float(y_min), float(x_max), float(y_max)
+
+
+def padded_region(box, frame_width, frame_height, padding=0.5, min_size=96, target_size=256):
+    """Pixel region around a normalized box, padded on every side and clamped to the frame.
+
+    padding is a fraction of the box's larger side added on each side. The crop is
+    downscaled so its longer side is at most target_size (never upscaled).
+    """
+    x_min, y_min, x_max, y_max = box
+    x_min, x_max = x_min * frame_width, x_max * frame_width
+    y_min, y_max = y_min * frame_height, y_max * frame_height
+    side = max(x_max - x_min, y_max - y_min)
+    pad = padding * side
+    half_w = max((x_max - x_min) / 2 + pad, min_size / 2)
+    half_h = max((y_max - y_min) / 2 + pad, min_size / 2)
+    cx, cy = (x_min + x_max) / 2, (y_min + y_max) / 2
+
+    x0 = int(np.clip(np.floor(cx - half_w), 0, frame_width))
+    x1 = int(np.clip(np.ceil(cx + half_w), 0, frame_width))
+    y0 = int(np.clip(np.floor(cy - half_h), 0, frame_height))
+    y1 = int(np.clip(np.ceil(cy + half_h), 0, frame_height))
+    if x1 - x0 < 1 or y1 - y0 < 1:
+        return None
+    scale = min(1.0, target_size / float(max(x1 - x0, y1 - y0)))
+    return RegionOfInterest(x0, y0, x1, y1, frame_width, frame_height, scale)
+
+
+class RoiTracker:
+    """Decides per frame whether to infer on a crop or on the full frame"""
+
+    def __init__(self, min_hands=2, padding=0.5, margin=0.1, min_size=96, target_size=256, max_area_ratio=0.6):
+        self.min_hands = min_hands  # Crop only while this many hands are tracked
+        self.padding = padding  # Padding around the hands, fraction of the union box's larger side
+        self.margin = margin  # Recompute the crop when a hand gets this close (fraction of crop) to an edge
+        self.min_size = min_size  # Minimum crop side in pixels
+        self.target_size = target_size  # Longer crop side after downscaling
+        self.max_area_ratio = max_area_ratio  # Larger crops are not worth it, use the full frame
+        self.region = None  # Current RegionOfInterest, None means full-frame inference
+        self.crop_frames = 0
+        self.full_frames = 0
+        self.fallbacks = 0
+
+    def next_region(self):
+        """Region to run the next inference on (None for the full frame)"""
+        if self.region is None:
+            self.full_frames += 1
+        else:
+            self.crop_frames += 1
+        return self.region
+
+    def update(self, points, frame_width, frame_height):
+        """Feed the full-frame (N, 21, 3) landmarks of the frame that was just processed"""
+        if len(points) < self.min_hands:
+            if self.region is not None:
+                self.fallbacks += 1
+            self.region = None
+            return None
+
+        box = bounding_box(points)
+        if self.region is not None and self.region.contains(box, self.margin):
+            return self.region
+
+        region = padded_region(box, frame_width, frame_height, self.padding, self.min_size, self.target_size)
+        if region is None or region.area_ratio > self.max_area_ratio:
+            region = None
+        self.region = region
+        return region
+
+    def reset(self):
+        self.region = None
+
+    def stats(self):
+        return {
+            "crop_frames": self.crop_frames,
+            "full_frames": self.full_frames,
+            "fallbacks": self.fallbacks,
+            "region": repr(self.region) if self.region is not None else None,
+        }
@@ -0,0 +1,118 @@
+"""
+Scheduler Module - Monotonic-clock cadences, cooldowns and stability windows
+
+Classification cadence, gesture stability and action cooldowns used to be
+counted in frames, so they changed with the camera frame rate. They are now
+millisecond budgets measured on a monotonic clock. The engine calls tick()
+once per frame, and every timer created from the scheduler reads that frame
+timestamp, so all decisions made within one frame agree with each other.
+"""
+
+import time
+
+
+class Scheduler:
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.now = clock()  # Timestamp (seconds) of the current frame
+        self.frames = 0
+
+    def tick(self):
+        """Start a new frame; returns its timestamp"""
+        self.now = self.clock()
+        self.frames += 1
+        return self.now
+
+    def cadence(self, interval_ms):
+        return Cadence(self, interval_ms)
+
+    def cooldown(self, duration_ms):
+        return Cooldown(self, duration_ms)
+
+    def stability(self, hold_ms):
+        return StabilityWindow(self, hold_ms)
+
+
+class Cadence:
+    """Fires at most once per interval; every check within the firing frame agrees"""
+
+    def __init__(self, scheduler, interval_ms):
+        self.scheduler = scheduler
+        self.interval = interval_ms / 1000.0
+        self._next = None  # Time the cadence is next due (None = due now)
+        self._fired_at = None
+
+    def due(self):
+        """True if ready() would fire in the current frame (does not consume it)"""
+        now = self.scheduler.now
+        return now == self._fired_at or self._next is None or now >= self._next
+
+    def ready(self):
+        """Fire if due: True for every call in a firing frame, False otherwise"""
+        now = self.scheduler.now
+        if now == self._fired_at:
+            return True
+        if self._next is not None and now < self._next:
+            return False
+        # Measured from the firing frame, not a fixed grid: with frame jitter a grid would
+        # occasionally fire on consecutive short gaps
+        self._next = now + self.interval
+        self._fired_at = now
+        return True
+
+    def reset(self):
+        self._next = None
+        self._fired_at = None
+
+
+class Cooldown:
+    """Suppresses repeats of the same key until duration_ms has passed; a different key is allowed at once"""
+
+    def __init__(self, scheduler, duration_ms):
+        self.scheduler = scheduler
+        self.duration = duration_ms / 1000.0
+        self.key = None
+        self._until = None
+
+    def start(self, key=None):
+        self.key = key
+        self._until = self.scheduler.now + self.duration
+
+    @property
+    def active(self):
+        return self._until is not None and self.scheduler.now < self._until
+
+    def ready(self, key=None):
+        return key != self.key or not self.active
+
+    def remaining_ms(self):
+        return max(0.0, (self._until - self.scheduler.now) * 1000.0) if self._until is not None else 0.0
+
+    def reset(self):
+        self.key = None
+        self._until = None
+
+
+class StabilityWindow:
+    """Reports a value as stable once it has been observed continuously for hold_ms"""
+
+    def __init__(self, scheduler, hold_ms):
+        self.scheduler = scheduler
+        self.hold = hold_ms / 1000.0
+        self.value = None
+        self._since = None
+
+    def update(self, value):
+        """Feed this frame's value; True if it has been held for the whole window"""
+        now = self.scheduler.now
+        if self._since is None or value != self.value:
+            self.value = value
+            self._since = now
+        return now - self._since >= self.hold
+
+    def held_ms(self):
+        return (self.scheduler.now - self._since) * 1000.0 if self._since is not None else 0.0
+
+    def reset(self):
+        self.value = None
+        self._since = None
@@ -0,0 +1,110 @@
+"""
+Swipe Decoder Module - Turns a cursor path over the keyboard into a word
+
+In swipe mode the user keeps a pinch closed and slides over the letters of
+a word instead of pinching once per letter. SwipeDecoder matches the path
+against one template per dictionary word. A template is the polyline
+through the word's key centres (repeated letters collapse into one point).
+
+- Templates are resampled once, at build time, to `samples` equidistant
+  points and stacked into one float32 array per (first letter, last
+  letter) group.
+- decode(path) resamples the path the same way and prunes the dictionary
+  to the groups whose first and last keys lie near the path's start and
+  end. It then scores every remaining template in one vectorized step: the
+  mean point-to-point distance, plus a word-frequency prior.
+
+Words whose template is a single point (one distinct letter) aren't
+swipeable. They are typed with taps.
+"""
+
+import math
+
+import numpy as np
+
+
+def resample(points, samples):
+    """`samples` points spaced evenly along the polyline through `points`"""
+    points = np.asarray(points, dtype=np.float32).reshape(-1, 2)
+    steps = np.hypot(*np.diff(points, axis=0).T)
+    distance = np.concatenate(([0.0], np.cumsum(steps)))
+    if distance[-1] == 0:
+        return np.repeat(points[:1], samples, axis=0)
+    at = np.linspace(0.0, distance[-1], samples)
+    return np.stack((np.interp(at, distance, points[:, 0]), np.interp(at, distance, points[:, 1])), axis=1).astype(np.float32)
+
+
+def key_centres(buttons):
+    """letter -> (x, y) centre of every single-letter key in a layout"""
+    return {
+        button.text.lower(): (button.pos[0] + button.size[0] / 2, button.pos[1] + button.size[1] / 2)
+        for button in buttons
+        if len(button.text) == 1 and button.text.isalpha()
+    }
+
+
+class SwipeDecoder:
+    def __init__(self, words, centres, priors=None, samples=32, radius=70, prior_weight=4.0):
+        self.centres = centres
+        self.samples = samples
+        self.radius = radius  # How far from a key centre a swipe may start or end and still count for that key
+        self.prior_weight = prior_weight  # Pixels of path distance one e-fold of word frequency is worth
+        self.letters = sorted(centres)
+        self._letter_xy = np.array([centres[letter] for letter in self.letters], dtype=np.float32)
+
+        grouped = {}
+        for word in words:
+            keys = self.key_sequence(word)
+            if keys is None:
+                continue
+            frequency = priors.get(word, 1.0) if priors else 1.0
+            grouped.setdefault((keys[0], keys[-1]), []).append((word, keys, frequency))
+
+        # (first letter, last letter) -> (words, templates [n, samples, 2], prior cost [n])
+        self.groups = {}
+        top_frequency = max((f for entries in grouped.values() for _, _, f in entries), default=1.0)
+        for pair, entries in grouped.items():
+            templates = np.stack([resample([centres[key] for key in keys], samples) for _, keys, _ in entries])
+            prior = np.array([-math.log(max(f, 1e-9) / top_frequency) for _, _, f in entries], dtype=np.float32)
+            self.groups[pair] = ([word for word, _, _ in entries], templates, prior * prior_weight)
+        self.size = sum(len(group[0]) for group in self.groups.values())
+        self.last_candidates = 0  # Templates scored by the last decode (after pruning)
+
+    def key_sequence(self, word):
+        """Keys the word's path visits, repeated letters collapsed; None if not swipeable"""
+        word = word.lower()
+        if not word.isalpha() or any(letter not in self.centres for letter in word):
+            return None
+        keys = [letter for i, letter in enumerate(word) if i == 0 or letter != word[i - 1]]
+        return keys if len(keys) > 1 else None
+
+    def keys_near(self, point):
+        """Letters whose centre is within `radius` of the point (the nearest one always counts)"""
+        distances = np.hypot(*(self._letter_xy - np.asarray(point, dtype=np.float32)).T)
+        near = {self.letters[i] for i in np.flatnonzero(distances <= self.radius)}
+        near.add(self.letters[int(np.argmin(distances))])
+        return near
+
+    def decode(self, path, k=3):
+        """Best `k` words for a cursor path [(x, y), ...], best first"""
+        if len(path) < 2:
+            return []
+        gesture = resample(path, self.samples)
+        firsts, lasts = self.keys_near(path[0]), self.keys_near(path[-1])
+        words, costs = [], []
+        self.last_candidates = 0
+        for first in firsts:
+            for last in lasts:
+                group = self.groups.get((first, last))
+                if group is None:
+                    continue
+                group_words, templates, prior = group
+                distance = np.hypot(*(templates - gesture).transpose(2, 0, 1)).mean(axis=1)
+                words.extend(group_words)
+                costs.append(distance + prior)
+                self.last_candidates += len(group_words)
+        if not words:
+            return []
+        costs = np.concatenate(costs)
+        best = np.argsort(costs)[:k] if len(costs) <= k else np.argpartition(costs, k)[:k]
+        return [words[i] for i in sorted(best, key=lambda i: costs[i])]
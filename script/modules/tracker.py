@@ -7,46 +7,64 @@ GitHub: https://github.com/Rohan9731
 
 import cv2
 import mediapipe as mp
+import numpy as np
+
+from .hand_features import classify_batch, classify_hand, finger_masks, landmarks_to_array
+from .instrumentation import DISABLED
+from .logger import log
+from .observation import FrameObservation
+from .roi import RoiTracker
+from .scheduler import Scheduler
 
 
 class HandTracker:
-    def __init__(self):
+    def __init__(self, crop_inference=False, scheduler=None, load_model=True, metrics=None):
         self.mp_hands = mp.solutions.hands
+        # load_model=False skips the MediaPipe graph for landmark replay, which only classifies
         self.hands = self.mp_hands.Hands(
             max_num_hands=2,
             min_detection_confidence=0.7,
             min_tracking_confidence=0.5
-        )
+        ) if load_model else None
         self.mp_drawing = mp.solutions.drawing_utils
-        self.frame_counter = 0
-        self.cooldown_frames = 3  # Reduced to 3 for very fast detection
-        self.smooth_cooldown_frames = 1  # Reduced to 1 for instant response
+        # Frame clock shared with the engine and the mode handlers (GestureControl ticks it once per frame)
+        self.scheduler = scheduler if scheduler is not None else Scheduler()
+        # Raised-finger classification cadence: every third frame at 30 fps, independent of the camera rate
+        self.classify_cadence = self.scheduler.cadence(90)
+        self.smooth_cadence = self.scheduler.cadence(0)  # Pixel positions every frame for instant response
+        self.metrics = metrics if metrics is not None else DISABLED  # PipelineMetrics for stage timings
+        # Opt-in: infer on a downscaled crop around the last known hands while both are tracked.
+        # Off by default - on the benchmark clip it was slower and lost hands (see bench_roi_inference.py)
+        self.roi = RoiTracker() if crop_inference else None
+        if self.roi is not None and self.hands is not None and not hasattr(self.hands, "reset"):
+            log.warning("roi", "⚠ This MediaPipe version can't reset hand tracking - cropped inference disabled")
+            self.roi = None
+        self._geometry = None  # Crop (x0, y0, x1, y1) the last inference ran on, None = full frame
+        self.tracking_resets = 0
 
     def detect_raised_fingers(self, lst, hand_type, mouse_control=False):
-        if self.frame_counter % self.cooldown_frames != 0 and mouse_control == False:
+        """Raised-finger list for one hand; lst is a (21, 3) landmark array or a NormalizedLandmarkList"""
+        if mouse_control == False and not self.classify_cadence.ready():
             return None
 
-        if hand_type not in ["left", "right"]:
-            raise ValueError(
-                "Invalid hand_type. It should be either 'left' or 'right'."
-            )
-        thresh = (lst.landmark[0].y * 100 - lst.landmark[9].y * 100) / 2
-        finger_pairs = [(5, 8), (9, 12), (13, 16), (17, 20)]
-        raised_fingers = [
-            int(
-                (lst.landmark[finger_tip].y * 100 - lst.landmark[knuckle].y * 100)
-                > thresh
-            )
-            for finger_tip, knuckle in finger_pairs
-        ]
-        thumb_condition = (
-            (lst.landmark[4].x * 100 - lst.landmark[5].x * 100) > 6
-            if hand_type == "left"
-            else (lst.landmark[5].x * 100 - lst.landmark[4].x * 100) > 6
-        )
-        raised_fingers.insert(0, int(thumb_condition))
-
-        return raised_fingers[::-1] if hand_type == "left" else raised_fingers
+        points = lst if isinstance(lst, np.ndarray) else landmarks_to_array(lst)
+        return classify_hand(points, hand_type)
+
+    def classify_hands(self, observation, mouse_control=False):
+        """5-bit finger masks (see gesture_tables) for every hand in the observation,
+        classified as one (N, 21, 3) batch and encoded in the same vectorized step.
+
+        Returns a list of ints aligned with observation.hands (all None on throttled frames).
+        """
+        if mouse_control == False and not self.classify_cadence.ready():
+            return [None] * len(observation.hands)
+        if not observation.hands:
+            return []
+        return finger_masks(classify_batch(observation.points, observation.is_left)).tolist()
+
+    def classification_due(self, mouse_control=False):
+        """True if this frame's landmarks would be classified (frames in between need no inference)"""
+        return mouse_control or self.classify_cadence.due()
 
     # def detect_downwards_fingers(self, lst, hand_type):
     #     # this is not working as intended can someone fix
@@ -69,18 +87,61 @@ class HandTracker:
     #     print(downwards_fingers[::-1] if hand_type == "left" else downwards_fingers[1:])
     #     return downwards_fingers[::-1] if hand_type == "left" else downwards_fingers[1:]
 
-    def find_position(self, frame, mouse_control=False):
-        if (
-            self.frame_counter % self.smooth_cooldown_frames != 0
-            and mouse_control == False
-        ):
+    def observe(self, frame, scale=1.0):
+        """Run the single landmark inference for this frame and wrap it in a FrameObservation.
+
+        scale < 1.0 downscales the full frame before inference (idle probing); landmarks
+        are normalized, so the observation is still in full-frame coordinates.
+        """
+        region = None
+        image = frame
+        with self.metrics.timer("preprocess"):
+            if scale < 1.0:
+                height, width = frame.shape[:2]
+                image = cv2.resize(frame, (max(1, int(width * scale)), max(1, int(height * scale))), interpolation=cv2.INTER_AREA)
+            elif self.roi is not None:
+                region = self.roi.next_region()
+                if region is not None:
+                    image = region.crop(frame)
+                    if region.scale < 1.0:
+                        image = cv2.resize(image, region.inference_size, interpolation=cv2.INTER_AREA)
+            geometry = None if region is None else (region.x0, region.y0, region.x1, region.y1)
+            if geometry != self._geometry:
+                # Hands tracks each hand's rectangle from the previous image. After a crop change (or a
+                # switch between crop and full frame) that rectangle belongs to a different image,
+                # so start over with palm detection
+                self.hands.reset()
+                self.tracking_resets += 1
+                self._geometry = geometry
+        with self.metrics.timer("cvtColor"):
+            rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        with self.metrics.timer("hands_process"):
+            results = self.hands.process(rgb)
+        observation = FrameObservation.from_results(results, frame.shape, region)
+        if self.roi is not None:
+            # Landmarks are full-frame again here, so a lost hand falls back to full-frame inference next frame
+            self.roi.update(observation.points, observation.frame_width, observation.frame_height)
+        return observation
+
+    def roi_stats(self):
+        """Crop vs full-frame inference counts and tracking resets (None when cropping is disabled)"""
+        if self.roi is None:
+            return None
+        stats = self.roi.stats()
+        stats["tracking_resets"] = self.tracking_resets
+        return stats
+
+    def find_hand(self, observation, hand_type="right", mouse_control=False):
+        """HandObservation of one hand (landmark array + pixel positions), or None"""
+        if mouse_control == False and not self.smooth_cadence.ready():
+            return None
+        return observation.hand(hand_type) if observation is not None else None
+
+    def find_position(self, observation, hand_type="right", mouse_control=False):
+        """Pixel landmarks [id, cx, cy] of one hand, read from the frame's observation"""
+        if mouse_control == False and not self.smooth_cadence.ready():
             return None
-        landmarks = []
-        results = self.hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                for id, lm in enumerate(hand_landmarks.landmark):
-                    h, w, c = frame.shape
-                    cx, cy = int(lm.x * w), int(lm.y * h)
-                    landmarks.append([id, cx, cy])
-        return landmarks
+        hand = observation.hand(hand_type) if observation is not None else None
+        if hand is None:
+            return []
+        return hand.positions
@@ -1,25 +1,23 @@
-import json
 import subprocess
 import os
 import time
 import sys
 
+from .actuator import Action, emit
+from .config_service import ConfigService
+from .logger import log
+
 
 class UserDefControls:
-    def __init__(self, hand_tracker):
+    def __init__(self, hand_tracker, dispatcher=None, config=None):
         self.hand_tracker = hand_tracker
-        self.last_launched_gesture = None  # Track last launched gesture
-        self.launch_time = 0  # Track when last gesture was executed
-        self.launch_cooldown = 1.0  # Minimum seconds between same gesture launches
+        self.dispatcher = dispatcher  # ActionDispatcher for app launches, None = run inline
+        # Minimum time between launches of the same gesture, on the engine's frame clock
+        self.launch_cooldown = hand_tracker.scheduler.cooldown(1000)
 
-        # Load the JSON file
-        try:
-            with open("./script/modules/user_defined_data.json", "r") as file:
-                self.app_data = json.load(file)
-                print("[DEBUG] Loaded user_defined_data.json successfully")
-        except Exception as e:
-            print(f"[ERROR] Failed to load user_defined_data.json: {e}")
-            self.app_data = {"userDefinedControls": {}}
+        # Shared, hot-reloaded user_defined_data.json (the engine passes its own service)
+        self.config = config if config is not None else ConfigService()
+        self.config.check()
 
         self.gesture_map = {
             "[0, 1, 0, 0, 0]": "index",
@@ -35,7 +33,7 @@ class UserDefControls:
             cmd_str = str(cmd).strip()
             
             if not cmd_str or cmd_str == "null":
-                print(f"  ⚠ Empty or null command - skipping")
+                log.warning("launch", "  ⚠ Empty or null command - skipping")
                 return False
             
             # Expand environment variables like %USERNAME%
@@ -43,7 +41,7 @@ class UserDefControls:
             
             # Check if it's a Windows Settings URI (ms-settings, etc.)
             if cmd_str.startswith("ms-") or cmd_str.startswith("microsoft.") or cmd_str.startswith("mailto:"):
-                print(f"  → Launching Windows URI: {cmd_str}")
+                log.info("launch", "  → Launching Windows URI: %s", cmd_str)
                 # Use explorer to open Windows URIs reliably
                 subprocess.Popen(['explorer', cmd_str], shell=False)
                 time.sleep(0.3)
@@ -52,24 +50,24 @@ class UserDefControls:
             # Check if it's a full path to an executable
             elif ("\\" in cmd_str or ":/" in cmd_str):
                 if os.path.exists(cmd_str):
-                    print(f"  → Launching from full path: {cmd_str}")
+                    log.info("launch", "  → Launching from full path: %s", cmd_str)
                     subprocess.Popen(cmd_str)
                     time.sleep(0.3)
                     return True
                 else:
-                    print(f"  ⚠ Path does not exist: {cmd_str}, trying next option...")
+                    log.warning("launch", "  ⚠ Path does not exist: %s, trying next option...", cmd_str)
                     return False
             
             # For common Windows executables (calc.exe, notepad.exe, chrome.exe, etc.)
             else:
-                print(f"  → Launching Windows app: {cmd_str}")
+                log.info("launch", "  → Launching Windows app: %s", cmd_str)
                 # Use 'start' command which searches Windows PATH
                 subprocess.Popen(f'start "" "{cmd_str}"', shell=True)
                 time.sleep(0.3)
                 return True
                 
         except Exception as e:
-            print(f"  ✗ Error launching {cmd}: {e}")
+            log.error("launch", "  ✗ Error launching %s: %s", cmd, e)
             return False
     
     def launch_app_from_array(self, app_array):
@@ -90,7 +88,7 @@ class UserDefControls:
         # Try Windows URIs first (they're usually the "real" app)
         if windows_uris:
             app_to_launch = windows_uris[0].strip()
-            print(f"  → Selected Windows URI from array: {app_to_launch}")
+            log.debug("launch", "  → Selected Windows URI from array: %s", app_to_launch)
             if self.launch_single_app(app_to_launch):
                 return True
         
@@ -98,7 +96,7 @@ class UserDefControls:
         if executables:
             for app_path in executables:
                 app_to_launch = app_path.strip()
-                print(f"  → Trying executable: {app_to_launch}")
+                log.debug("launch", "  → Trying executable: %s", app_to_launch)
                 if self.launch_single_app(app_to_launch):
                     return True
         
@@ -109,68 +107,57 @@ class UserDefControls:
             return
             
         gesture_str = str(raised_fingers)
-        print(f"\n{'='*50}")
-        print(f"USER DEFINED CONTROL - RIGHT HAND GESTURE")
-        print(f"Fingers raised: {raised_fingers}")
-        print(f"{'='*50}")
+        log.debug("launch", "=== USER DEFINED CONTROL === right hand fingers: %s", raised_fingers)
         
         if gesture_str not in self.gesture_map:
-            print(f"✗ Unknown finger pattern: {gesture_str}")
-            print(f"{'='*50}\n")
+            log.warning("launch", "✗ Unknown finger pattern: %s", gesture_str, every=1.0)
             return
         
         gesture_name = self.gesture_map[gesture_str]
-        print(f"Gesture detected: '{gesture_name}'")
         
         # Check if this gesture has been executed recently (cooldown check)
-        current_time = time.time()
-        if (self.last_launched_gesture == gesture_name and 
-            current_time - self.launch_time < self.launch_cooldown):
-            remaining = self.launch_cooldown - (current_time - self.launch_time)
-            print(f"⚠ Cooldown active ({remaining:.2f}s remaining)")
-            print(f"{'='*50}\n")
+        if not self.launch_cooldown.ready(gesture_name):
+            log.debug("launch_cooldown", "⚠ '%s' cooldown active (%.2fs remaining)", gesture_name,
+                      self.launch_cooldown.remaining_ms() / 1000, every=0.5)
             return
         
         # Get the app configuration for this gesture
-        user_controls = self.app_data.get("userDefinedControls", {})
+        user_controls = self.config.snapshot.controls
         apps_config = user_controls.get(gesture_name)
         
-        print(f"[CONFIG] Raw config: {apps_config}")
+        log.debug("launch_config", "[CONFIG] '%s' raw config: %s", gesture_name, apps_config)
         
         if not apps_config:
-            print(f"✗ No app configured for gesture '{gesture_name}'")
-            print(f"{'='*50}\n")
+            log.warning("launch", "✗ No app configured for gesture '%s'", gesture_name)
             return
         
         # Handle both list and string formats
         if isinstance(apps_config, str):
             # Single app stored as string
             app_list = [apps_config]
-        elif isinstance(apps_config, list):
+        elif isinstance(apps_config, (list, tuple)):
             # Multiple apps stored as array
-            app_list = apps_config
+            app_list = list(apps_config)
         else:
-            print(f"✗ Invalid app configuration format: {type(apps_config)}")
-            print(f"{'='*50}\n")
+            log.warning("launch", "✗ Invalid app configuration format: %s", type(apps_config).__name__)
             return
         
         # Filter out null/empty values
         app_list = [app for app in app_list if app and app != "null"]
         
         if not app_list:
-            print(f"✗ No valid apps configured for gesture '{gesture_name}'")
-            print(f"{'='*50}\n")
+            log.warning("launch", "✗ No valid apps configured for gesture '%s'", gesture_name)
             return
         
-        print(f"[CONFIG] Filtered apps: {app_list}")
-        print(f"→ Attempting to launch from array with {len(app_list)} app(s)")
+        log.debug("launch_config", "[CONFIG] '%s' → launching from %d app(s): %s", gesture_name, len(app_list), app_list)
         
+        # Start the cooldown when the launch is queued so repeats are suppressed while it runs
+        self.launch_cooldown.start(gesture_name)
+        emit(self.dispatcher, Action("launch_app", self._launch, (gesture_name, app_list), timeout=2.0))
+
+    def _launch(self, gesture_name, app_list):
         # Use smart app selection (prioritizes Windows URIs)
         if self.launch_app_from_array(app_list):
-            self.last_launched_gesture = gesture_name
-            self.launch_time = current_time
-            print(f"✓ Successfully executed gesture '{gesture_name}'")
+            log.info("launch", "✓ Successfully executed gesture '%s'", gesture_name)
         else:
-            print(f"✗ Failed to execute gesture '{gesture_name}'")
-        
-        print(f"{'='*50}\n")
+            log.error("launch", "✗ Failed to execute gesture '%s'", gesture_name)
@@ -7,37 +7,34 @@ GitHub: https://github.com/Rohan9731
 
 import cv2
 import numpy as np
-from pynput.keyboard import Controller
 import math
+import threading
 import time
 import platform
 
-# Import Windows-specific libraries for window focusing
-if platform.system() == "Windows":
-    try:
-        import win32gui
-        import win32con
-        import win32process
-    except ImportError:
-        print("⚠ pywin32 not installed. Window focusing will not work.")
-        win32gui = None
-
-class Button:
-    def __init__(self, pos, text, size=[70, 70], special=False):
-        self.pos = pos
-        self.size = size
-        self.text = text
-        self.special = special  # For special keys like CAPS, SPACE, etc.
+from .actuator import Action, emit
+from .backends import OS_BACKENDS
+from .logger import log
+from .keyboard_layout import LAYOUTS, SUGGESTION_SLOTS, KeyIndex
+from .focus_service import FocusService
+from .word_prediction import WordPredictor
+from .swipe_decoder import SwipeDecoder, key_centres
 
 class VirtualKeyboard:
-    def __init__(self, hand_tracker, target_app_name=None):
+    def __init__(self, hand_tracker, target_app_name=None, dispatcher=None, show_window=True, focus=None, predictor=None,
+                 backends=None):
         self.hand_tracker = hand_tracker
-        self.keyboard = Controller()
+        self.dispatcher = dispatcher  # ActionDispatcher for focusing and typing, None = run inline
+        self.backends = backends if backends is not None else OS_BACKENDS  # OS input libraries, imported on first use (StubBackends in replay)
+        self.keyboard = self.backends.pynput_keyboard.Controller()
+        self.special_keys = self.backends.pynput_keyboard.Key  # pynput Key (backspace, enter)
         self.text = ""
-        self.delay = 0
+        # Minimum time between typed keys (about eight classifications at the ~100 ms cadence)
+        self.key_repeat = hand_tracker.scheduler.cooldown(750)
         self.target_app_name = target_app_name  # Store target application name
-        self.target_hwnd = None  # Store target window handle
-        self.last_focus_attempt = 0  # Track when we last tried to focus
+        # Cached target window lookup and focusing (FocusService(backend=FakeWindowSystem()) in tests)
+        self.focus = focus if focus is not None else FocusService(backend=self.backends.window_system())
+        self.focus.set_target(target_app_name)
         
         # Smoothing for better cursor control
         self.prev_kb_x = 0
@@ -47,172 +44,73 @@ class VirtualKeyboard:
         # Caps lock state
         self.caps_lock = False
         
-        # Create buttons with proper layout
-        self.buttonList = self.create_keyboard_layout()
+        # Every layout compiled into a per-pixel key index; buttonList is the active layout's keys
+        self.key_indexes = {name: KeyIndex(build()) for name, build in LAYOUTS.items()}
+        self.layout = "qwerty"
+        self.key_index = self.key_indexes[self.layout]
+        self.buttonList = self.key_index.buttons
+        self.hovered_button = None  # Key under the cursor last frame (kept within the hysteresis margin)
+        # Completions of the word being typed, shown on the suggestion keys (trie built once)
+        self.predictor = predictor if predictor is not None else WordPredictor()
+        self.suggestions = []
+        self._suggested_word = None  # Word the suggestions were computed for
+        # Swipe typing: while pinched the cursor path is recorded, on release it is decoded into a word
+        self.swipe_mode = False
+        self.swipe_path = []
+        # Built on a background thread from the predictor's vocabulary when swipe mode is turned on,
+        # then swapped in; until then a swipe counts as a tap on the key it started on
+        self.swipe_decoder = None
+        self.swipe_result = None  # (word, alternatives) of the last swipe, offered on the suggestion keys
+        self._swipe_vocabulary = None  # Predictor vocabulary size the last decoder build started from
+        self._swipe_build = None  # Thread building the next decoder
+        # Static keyboard (background, keys, text box) rendered once per layout state, see keyboard_layer()
+        self._layers = {}
+        self._canvas = np.empty((480, 1000, 3), dtype=np.uint8)  # Reused per-frame composite
         
         # Window setup
         self.window_name = "Virtual Keyboard"
         self.window_created = False
+        self.show_window = show_window  # False for headless runs (landmark replay): no OpenCV window
     
     def create_keyboard_layout(self):
         """Create a properly styled keyboard layout"""
-        buttons = []
-        
-        # Number row (1-0 with even spacing)
-        number_keys = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "0"]
-        start_x = 20
-        for i, key in enumerate(number_keys):
-            buttons.append(Button([start_x + i * 85, 15], key, [75, 70]))
-        
-        # Backspace (larger button at end of number row)
-        buttons.append(Button([start_x + 10 * 85, 15], "DEL", [110, 70], special=True))
-        
-        # First letter row (Q-P)
-        qwerty_keys = ["Q", "W", "E", "R", "T", "Y", "U", "I", "O", "P"]
-        for i, key in enumerate(qwerty_keys):
-            buttons.append(Button([start_x + i * 85, 100], key, [75, 70]))
-        
-        # Caps Lock (larger button at end)
-        buttons.append(Button([start_x + 10 * 85, 100], "CAPS", [110, 70], special=True))
-        
-        # Second letter row (A-L) with slight offset
-        asdf_keys = ["A", "S", "D", "F", "G", "H", "J", "K", "L"]
-        offset_x = 40
-        for i, key in enumerate(asdf_keys):
-            buttons.append(Button([start_x + offset_x + i * 85, 185], key, [75, 70]))
-        
-        # Enter (larger button)
-        buttons.append(Button([start_x + offset_x + 9 * 85, 185], "ENTER", [160, 70], special=True))
-        
-        # Third letter row (Z-M) with more offset
-        zxcv_keys = ["Z", "X", "C", "V", "B", "N", "M"]
-        offset_x2 = 60
-        for i, key in enumerate(zxcv_keys):
-            buttons.append(Button([start_x + offset_x2 + i * 85, 270], key, [75, 70]))
-        
-        # Space bar (large button at bottom, easy to reach)
-        buttons.append(Button([start_x + 120, 365], "SPACE", [650, 65], special=True))
-        
-        return buttons
+        return LAYOUTS["qwerty"]()
         
     def calculate_distance(self, x1, y1, x2, y2):
         """Calculate Euclidean distance between two points"""
         distance = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
         return distance
-    
+
+    def set_target_app(self, app_name):
+        """Switch the app typed into (config reload); the window is looked up again on the next key"""
+        self.target_app_name = app_name
+        self.focus.set_target(app_name)
+        if app_name:
+            log.info("keyboard_target", "✓ Keyboard will focus app: %s", app_name)
+        else:
+            log.info("keyboard_target", "⚠ No app configured for keyboard gesture")
+
     def find_and_focus_target_app(self):
-        """Find and focus the target application window"""
-        if not self.target_app_name or not win32gui or platform.system() != "Windows":
-            return False
-        
-        # Only try to focus every 0.5 seconds (reduced for better responsiveness)
-        current_time = time.time()
-        if current_time - self.last_focus_attempt < 0.5:
-            return self.target_hwnd is not None
-        
-        self.last_focus_attempt = current_time
-        
+        """Find and focus the target application window (cached; rescans only when its window went away)"""
+        return self.focus.focus_target()
+    
+    def send_key(self, key, hold=0):
+        """Queue a key press for the target app; keys are typed in order on the actuator worker"""
+        emit(self.dispatcher, Action("type_key", self._type_key, (key, hold), timeout=2.0))
+
+    def _type_key(self, key, hold=0):
+        # Focus target app before typing (if configured)
+        if self.target_app_name:
+            self.find_and_focus_target_app()
         try:
-            import psutil
-            import win32process
-            
-            # First, try to find process by name
-            target_processes = []
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    proc_name = proc.info['name'].lower()
-                    # Match process name with or without .exe
-                    if (self.target_app_name.lower() in proc_name or 
-                        f"{self.target_app_name.lower()}.exe" == proc_name):
-                        target_processes.append(proc.info['pid'])
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            if not target_processes:
-                if not hasattr(self, '_warned_process_not_found'):
-                    print(f"⚠ Process '{self.target_app_name}' not running. Please open the application first.")
-                    self._warned_process_not_found = True
-                return False
-            
-            # Now find windows belonging to these processes
-            def enum_callback(hwnd, results):
-                if win32gui.IsWindowVisible(hwnd):
-                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                    if pid in target_processes:
-                        window_title = win32gui.GetWindowText(hwnd)
-                        if window_title:  # Only consider windows with titles
-                            results.append((hwnd, window_title, pid))
-                return True
-            
-            matching_windows = []
-            win32gui.EnumWindows(enum_callback, matching_windows)
-            
-            # Log found windows (only once)
-            if not hasattr(self, '_logged_windows'):
-                self._logged_windows = True
-                if matching_windows:
-                    print(f"\n✓ Found {len(matching_windows)} windows for '{self.target_app_name}':")
-                    for hwnd, title, pid in matching_windows:
-                        print(f"  - PID {pid}: {title}")
-            
-            if matching_windows:
-                self.target_hwnd, window_title, pid = matching_windows[0]
-                
-                # Focus the window
-                try:
-                    # Get current foreground window
-                    current_hwnd = win32gui.GetForegroundWindow()
-                    current_title = win32gui.GetWindowText(current_hwnd)
-                    
-                    # Only focus if not already focused
-                    if current_hwnd != self.target_hwnd:
-                        print(f"🎯 Focusing '{window_title}' (PID: {pid})")
-                        
-                        # Get thread IDs
-                        current_thread = win32process.GetCurrentThreadId()
-                        target_thread, _ = win32process.GetWindowThreadProcessId(self.target_hwnd)
-                        
-                        # Attach to target thread
-                        if current_thread != target_thread:
-                            try:
-                                win32process.AttachThreadInput(current_thread, target_thread, True)
-                            except:
-                                pass  # May fail if already attached
-                        
-                        # Restore and focus window
-                        win32gui.ShowWindow(self.target_hwnd, win32con.SW_RESTORE)
-                        win32gui.SetForegroundWindow(self.target_hwnd)
-                        win32gui.BringWindowToTop(self.target_hwnd)
-                        
-                        # Detach
-                        if current_thread != target_thread:
-                            try:
-                                win32process.AttachThreadInput(current_thread, target_thread, False)
-                            except:
-                                pass
-                        
-                        print(f"✓ Successfully focused: {window_title}")
-                        time.sleep(0.2)  # Increased delay to ensure window is focused before typing
-                    
-                    return True
-                except Exception as e:
-                    print(f"⚠ Error focusing window: {e}")
-                    return False
-            else:
-                if not hasattr(self, '_warned_no_windows'):
-                    print(f"⚠ No visible windows found for '{self.target_app_name}'")
-                    self._warned_no_windows = True
-                return False
-                
-        except ImportError:
-            print("⚠ psutil not installed. Install with: pip install psutil")
-            return False
+            self.keyboard.press(key)
+            if hold:
+                time.sleep(hold)
+            self.keyboard.release(key)
+            log.debug("typed", "✓ Typed: %s", key)
         except Exception as e:
-            print(f"⚠ Error finding target app: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
-    
+            log.error("typed", "⚠ Error typing %s: %s", key, e)
+
     def drawAll(self, img):
         """Draw all keyboard buttons with proper styling"""
         for button in self.buttonList:
@@ -220,16 +118,24 @@ class VirtualKeyboard:
             w, h = button.size
             
             # Determine button color based on type
-            if button.text == "CAPS":
-                # Red when caps is ON, dark gray when OFF
-                bg_color = (50, 50, 200) if self.caps_lock else (80, 80, 80)
+            if button.text in ("CAPS", "SWIPE"):
+                # Red when caps / swipe mode is ON, dark gray when OFF
+                on = self.caps_lock if button.text == "CAPS" else self.swipe_mode
+                bg_color = (50, 50, 200) if on else (80, 80, 80)
+                text_color = (255, 255, 255)
+                font_size = 1.2 if button.text == "CAPS" else 1.0
+            elif button.slot is not None:
+                # Word suggestion keys - dark green, labelled per frame by render()
+                bg_color = (70, 100, 60)
                 text_color = (255, 255, 255)
-                font_size = 1.2
+                font_size = 1.0
             elif button.special:
                 # Special keys (SPACE, ENTER, DEL) - darker blue
                 bg_color = (120, 100, 60)
                 text_color = (255, 255, 255)
                 font_size = 1.2 if button.text == "SPACE" else 1.4
+                if button.target:
+                    font_size = 1.0  # Layout switch labels (?123 / NUM / ABC) are longer
             else:
                 # Regular keys - light gray
                 bg_color = (90, 90, 90)
@@ -257,6 +163,219 @@ class VirtualKeyboard:
             cv2.putText(img, display_text, (text_x, text_y),
                        cv2.FONT_HERSHEY_SIMPLEX, font_size, text_color, 2)
         return img
+
+    def current_word(self):
+        """Letters typed since the last space, digit or symbol"""
+        end = len(self.text)
+        start = end
+        while start > 0 and self.text[start - 1].isalpha():
+            start -= 1
+        return self.text[start:end]
+
+    def current_suggestions(self):
+        """Completions for the current word; the trie is only asked again when the word changed"""
+        if self.swipe_result is not None:
+            return self.swipe_result[1]
+        word = self.current_word()
+        if word != self._suggested_word:
+            self.suggestions = self.predictor.suggest(word) if word else []
+            self._suggested_word = word
+        return self.suggestions
+
+    def press(self, button):
+        """Act on a pinched key - the text strip updates here, the key itself is
+        typed by the actuator worker (focus + press)"""
+        k = button.text
+        swipe_result, self.swipe_result = self.swipe_result, None  # Swipe alternatives are only offered right after it
+        if button.target:  # Layout switch (?123 / NUM / ABC)
+            self.switch_layout(button.target)
+        elif button.slot is not None and swipe_result is not None:  # Swipe alternative: replace the swiped word
+            word, alternatives = swipe_result
+            if button.slot < len(alternatives):
+                for _ in range(len(word) + 1):
+                    self.text = self.text[:-1]
+                    self.send_key(self.special_keys.backspace)
+                self.type_word(alternatives[button.slot])
+        elif button.slot is not None:  # Word suggestion: type the rest of the word and a space
+            suggestions = self.current_suggestions()
+            if button.slot < len(suggestions):
+                word = suggestions[button.slot]
+                self.type_word(word[len(self.current_word()):], learn=word)
+        elif k == "SWIPE":
+            self.set_swipe_mode(not self.swipe_mode)
+        elif k == "CAPS":  # Caps Lock
+            self.caps_lock = not self.caps_lock
+            log.info("caps", "✓ Caps Lock: %s", "ON" if self.caps_lock else "OFF")
+        elif k == "SPACE":
+            self.learn_current_word()
+            self.text += ' '
+            self.send_key(' ')
+        elif k == "DEL":  # Backspace
+            if len(self.text) > 0:
+                self.text = self.text[:-1]
+            self.send_key(self.special_keys.backspace)
+        elif k == "ENTER":  # Enter
+            self.learn_current_word()
+            # Send enter key to focused application
+            self.send_key(self.special_keys.enter, hold=0.05)  # Small delay for key registration
+        else:
+            # Regular character - apply caps lock
+            if k.isalpha():
+                char = k.upper() if self.caps_lock else k.lower()
+            else:
+                char = k  # Numbers and symbols unchanged (and end the current word)
+                self.learn_current_word()
+            self.text += char
+            self.send_key(char)
+
+    def type_word(self, rest, learn=None):
+        """Type `rest` (caps lock applied) and a space, and rank the finished word higher"""
+        self.predictor.learn(learn or rest)
+        self._suggested_word = None  # Scores changed
+        for char in (rest.upper() if self.caps_lock else rest) + " ":
+            self.text += char
+            self.send_key(char)
+
+    def set_swipe_mode(self, on):
+        """Turn swipe typing on or off; the decoder covers the predictor's vocabulary at that moment"""
+        self.swipe_mode = on
+        self.swipe_path = []
+        if on:
+            self.build_swipe_decoder()
+        log.info("swipe", "✓ Swipe typing: %s", "ON" if on else "OFF")
+
+    def build_swipe_decoder(self):
+        """Start building a decoder for the current vocabulary off the vision thread (once, and again after new words)"""
+        building = self._swipe_build is not None and self._swipe_build.is_alive()
+        if building or self._swipe_vocabulary == len(self.predictor.scores):
+            return
+        self._swipe_vocabulary = len(self.predictor.scores)
+        # Templates for a large dictionary take seconds; the old decoder (if any) stays in use meanwhile.
+        # The vocabulary is copied here because learn() keeps changing it on this thread
+        scores = dict(self.predictor.scores)
+        centres = key_centres(self.key_indexes["qwerty"].buttons)
+        self._swipe_build = threading.Thread(target=self._build_swipe_decoder, args=(scores, centres),
+                                             name="swipe-decoder", daemon=True)
+        self._swipe_build.start()
+
+    def _build_swipe_decoder(self, scores, centres):
+        start = time.perf_counter()
+        decoder = SwipeDecoder(scores, centres, priors=scores)
+        self.swipe_decoder = decoder  # Single reference swap, read by finish_swipe on the vision thread
+        log.info("swipe", "✓ Swipe decoder ready: %d words in %.0f ms", decoder.size, (time.perf_counter() - start) * 1000)
+
+    def wait_for_swipe_decoder(self, timeout=None):
+        """Block until a pending decoder build finishes; True if a decoder is available"""
+        if self._swipe_build is not None:
+            self._swipe_build.join(timeout)
+        return self.swipe_decoder is not None
+
+    def track_swipe(self, x, y, pinched):
+        """Per frame in swipe mode: record the path while pinched, act on it at release"""
+        if pinched:
+            self.swipe_path.append((x, y))
+            return
+        if self.swipe_path:
+            path, self.swipe_path = self.swipe_path, []
+            self.finish_swipe(path)
+
+    def finish_swipe(self, path):
+        """A path that stayed on one key is a tap; otherwise type the best matching word"""
+        start = self.key_index.lookup(*path[0])
+        decoder = self.swipe_decoder
+        if decoder is None or self.layout != "qwerty" or all(self.key_index.lookup(x, y) is start for x, y in path):
+            # Also a tap while the decoder is still being built
+            if start is not None:
+                self.press(start)
+            return None
+        words = decoder.decode(path, k=SUGGESTION_SLOTS + 1)
+        if not words:
+            log.debug("swipe", "⚠ No word matches the swipe")
+            return None
+        self.type_word(words[0])
+        self.swipe_result = (words[0], words[1:])
+        log.debug("swipe", "✓ Swiped: %s (alternatives: %s)", words[0], ", ".join(words[1:]))
+        return words[0]
+
+    def learn_current_word(self):
+        """The user finished typing a word by hand: rank it higher from now on"""
+        word = self.current_word()
+        if word:
+            self.predictor.learn(word)
+            self._suggested_word = None
+
+    def layer_key(self):
+        """Everything the static keyboard image depends on"""
+        return (self.layout, self.caps_lock, self.swipe_mode)
+
+    def switch_layout(self, name):
+        """Show another layout (QWERTY, symbols, numeric pad)"""
+        self.layout = name
+        self.key_index = self.key_indexes[name]
+        self.buttonList = self.key_index.buttons
+        self.hovered_button = None
+        log.info("layout", "✓ Keyboard layout: %s", name)
+
+    def keyboard_layer(self):
+        """Static keyboard image for the current layout state, rendered on first use and cached"""
+        key = self.layer_key()
+        layer = self._layers.get(key)
+        if layer is None:
+            # Dark professional background with every button
+            layer = np.empty((480, 1000, 3), dtype=np.uint8)
+            layer[:] = (30, 30, 30)
+            self.drawAll(layer)
+            # Text display area at bottom with better styling
+            cv2.rectangle(layer, (15, 435), (985, 475), (200, 200, 200), 2)  # Border
+            cv2.rectangle(layer, (17, 437), (983, 473), (50, 50, 50), cv2.FILLED)  # Background
+            layer.setflags(write=False)
+            self._layers[key] = layer
+        return layer
+
+    def render(self, cursor=None, hovered_button=None):
+        """Composite the per-frame parts (text strip, cursor, hover highlight) over the cached static layer"""
+        keyboard_img = self._canvas
+        np.copyto(keyboard_img, self.keyboard_layer())
+
+        # Display text with scrolling if too long
+        display_text = self.text[-55:] if len(self.text) > 55 else self.text
+        cv2.putText(keyboard_img, display_text, (25, 462), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255), 2)
+        
+        # Show caps lock status with indicator
+        if self.caps_lock:
+            cv2.rectangle(keyboard_img, (920, 435), (985, 475), (50, 50, 200), cv2.FILLED)
+            cv2.putText(keyboard_img, "CAPS", (925, 462), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+
+        # Word suggestions on the suggestion keys of the current layout
+        suggestions = self.current_suggestions()
+        for button in self.buttonList:
+            if button.slot is not None and button.slot < len(suggestions):
+                word = suggestions[button.slot]
+                label = word.upper() if self.caps_lock else word
+                xb, yb = button.pos
+                wb, hb = button.size
+                (text_width, text_height), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 1.0, 2)
+                cv2.putText(keyboard_img, label, (xb + (wb - text_width) // 2, yb + (hb + text_height) // 2),
+                           cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)
+
+        # Swipe trail while the pinch is held
+        if len(self.swipe_path) > 1:
+            cv2.polylines(keyboard_img, [np.array(self.swipe_path, dtype=np.int32)], False, (255, 200, 0), 4)
+
+        if cursor is not None:
+            cv2.circle(keyboard_img, cursor, 20, (0, 255, 0), 3)
+            cv2.circle(keyboard_img, cursor, 5, (0, 255, 0), -1)
+
+        if hovered_button is not None:
+            # Highlight hovered button with bright cyan glow
+            xb, yb = hovered_button.pos
+            wb, hb = hovered_button.size
+            cv2.rectangle(keyboard_img, (xb - 3, yb - 3), 
+                        (xb + wb + 3, yb + hb + 3),
+                        (0, 255, 255), 3)
+        return keyboard_img
     
     def create_keyboard_window(self):
         """Create the keyboard window"""
@@ -266,11 +385,11 @@ class VirtualKeyboard:
             cv2.setWindowProperty(self.window_name, cv2.WND_PROP_TOPMOST, 1)
             
             # On Windows, make the window a tool window that doesn't steal focus
-            if platform.system() == "Windows" and win32gui:
+            if platform.system() == "Windows" and self.backends.available("win32gui"):
+                win32gui, win32con = self.backends.win32gui, self.backends.win32con
                 try:
-                    import time
                     time.sleep(0.1)  # Small delay to ensure window is created
-                    hwnd = win32gui.FindWindow(None, self.window_name)
+                    hwnd = self.focus.keyboard_window(self.window_name)
                     if hwnd:
                         # Set extended window style to prevent focus stealing
                         exstyle = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
@@ -292,43 +411,38 @@ class VirtualKeyboard:
                 print(f"⚠ Window already closed: {e}")
             finally:
                 self.window_created = False
+                self.focus.forget_keyboard_window()
+                self.predictor.save_history()  # Keep the words learned this session
                 self.text = ""  # Clear text when closing
                 self.caps_lock = False  # Reset caps lock
+                if self.layout != "qwerty":
+                    self.switch_layout("qwerty")
+                self.hovered_button = None
+                self.swipe_path = []
+                self.swipe_result = None
                 self.prev_kb_x = 0  # Reset smoothing
                 self.prev_kb_y = 0
     
-    def process(self, frame, results=None):
+    def deactivate(self):
+        """Close keyboard when switching away from keyboard mode"""
+        self.close_keyboard_window()
+
+    def process(self, frame, observation=None):
         """Process hand gestures and update keyboard
         Args:
             frame: Camera frame
-            results: MediaPipe results with multi_hand_landmarks and multi_handedness
+            observation: FrameObservation holding this frame's hand landmarks and handedness
         """
         # Create keyboard window if not exists
-        if not self.window_created:
+        if self.show_window and not self.window_created:
             self.create_keyboard_window()
         
         # Get frame dimensions
         h_frame, w_frame, _ = frame.shape
         
-        # Create keyboard image with dark professional background
-        keyboard_img = np.zeros((480, 1000, 3), dtype=np.uint8)
-        keyboard_img[:] = (30, 30, 30)  # Professional dark background
-        keyboard_img = self.drawAll(keyboard_img)
-        
-        # Draw text display area at bottom with better styling
-        cv2.rectangle(keyboard_img, (15, 435), (985, 475), (200, 200, 200), 2)  # Border
-        cv2.rectangle(keyboard_img, (17, 437), (983, 473), (50, 50, 50), cv2.FILLED)  # Background
-        
-        # Display text with scrolling if too long
-        display_text = self.text[-55:] if len(self.text) > 55 else self.text
-        cv2.putText(keyboard_img, display_text, (25, 462), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255), 2)
-        
-        # Show caps lock status with indicator
-        if self.caps_lock:
-            cv2.rectangle(keyboard_img, (920, 435), (985, 475), (50, 50, 200), cv2.FILLED)
-            cv2.putText(keyboard_img, "CAPS", (925, 462), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+        # Keyboard window overlays, composited over the cached static keyboard at the end
+        cursor = None
+        hovered_button = None
         
         # Add status message on camera frame
         cv2.putText(frame, "KEYBOARD MODE ACTIVE", (10, h_frame - 50), 
@@ -337,22 +451,11 @@ class VirtualKeyboard:
                    cv2.FONT_HERSHEY_PLAIN, 1.5, (255, 255, 255), 2)
         
         # Process hand landmarks - ONLY RIGHT HAND
-        right_hand_landmarks = None
-        if results and results.multi_hand_landmarks:
-            # Find the RIGHT hand
-            for idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
-                handedness = results.multi_handedness[idx].classification[0].label
-                if handedness.lower() == "right":
-                    right_hand_landmarks = hand_landmarks
-                    break
+        right_hand = observation.hand("right") if observation else None
         
-        if right_hand_landmarks:
-            landmarks = []
-            
-            # Get all landmarks from RIGHT hand
-            for id, lm in enumerate(right_hand_landmarks.landmark):
-                cx, cy = int(lm.x * w_frame), int(lm.y * h_frame)
-                landmarks.append([id, cx, cy])
+        if right_hand:
+            # Pixel landmarks of the RIGHT hand, already computed from this frame's inference
+            landmarks = right_hand.positions
             
             if len(landmarks) > 17:
                 try:
@@ -409,9 +512,8 @@ class VirtualKeyboard:
                     self.prev_kb_x = kb_x
                     self.prev_kb_y = kb_y
                     
-                    # Draw cursor on keyboard window
-                    cv2.circle(keyboard_img, (kb_x, kb_y), 20, (0, 255, 0), 3)
-                    cv2.circle(keyboard_img, (kb_x, kb_y), 5, (0, 255, 0), -1)
+                    # Cursor on keyboard window
+                    cursor = (kb_x, kb_y)
                     
                     # Show mapping info on camera frame
                     cv2.putText(frame, f"KB: ({kb_x},{kb_y})", (10, 30), 
@@ -424,77 +526,31 @@ class VirtualKeyboard:
                     cv2.putText(frame, f"Pinch: {int(dis)}", (10, 60), 
                               cv2.FONT_HERSHEY_PLAIN, 2, (255, 255, 0), 2)
                     
-                    # Check which button cursor is over
-                    hovered_button = None
-                    for button in self.buttonList:
-                        xb, yb = button.pos
-                        wb, hb = button.size
+                    # Swipe typing follows the cursor over gaps between keys too; a slightly
+                    # looser release threshold keeps one swipe in one piece
+                    if self.swipe_mode:
+                        self.track_swipe(kb_x, kb_y, dis < (45 if self.swipe_path else 35))
+                    
+                    # Check which button cursor is over (one label-map lookup, sticky near key borders)
+                    button = self.hovered_button = self.key_index.hover(kb_x, kb_y, self.hovered_button)
+                    if button is not None:
+                        hovered_button = button  # Highlighted on the keyboard window
+                        # Show which key is hovered on camera frame
+                        display_name = button.text
+                        if button.slot is not None:
+                            suggestions = self.current_suggestions()
+                            display_name = suggestions[button.slot] if button.slot < len(suggestions) else "-"
+                        cv2.putText(frame, f"Key: {display_name}", (10, 90), 
+                                  cv2.FONT_HERSHEY_PLAIN, 2.5, (0, 255, 0), 3)
                         
-                        if (xb < kb_x < xb + wb) and (yb < kb_y < yb + hb):
-                            hovered_button = button
-                            
-                            # Highlight hovered button with bright cyan glow
-                            cv2.rectangle(keyboard_img, (xb - 3, yb - 3), 
-                                        (xb + wb + 3, yb + hb + 3),
-                                        (0, 255, 255), 3)
-                            
-                            # Show which key is hovered on camera frame
-                            display_name = button.text if len(button.text) > 1 else button.text
-                            cv2.putText(frame, f"Key: {display_name}", (10, 90), 
-                                      cv2.FONT_HERSHEY_PLAIN, 2.5, (0, 255, 0), 3)
-                            
-                            # IMPORTANT: Only type when pinched AND delay expired
-                            # This prevents accidental typing from just hovering
-                            if dis < 35 and self.delay == 0:
-                                k = button.text
-                                print(f"🔵 PINCH! Dist: {int(dis)} | Key: {k}")
-                                
-                                # Focus target app before typing (if configured)
-                                if self.target_app_name:
-                                    self.find_and_focus_target_app()
-                                
-                                # Handle special keys
-                                if k == "CAPS":  # Caps Lock
-                                    self.caps_lock = not self.caps_lock
-                                    print(f"✓ Caps Lock: {'ON' if self.caps_lock else 'OFF'}")
-                                elif k == "SPACE":
-                                    self.text += ' '
-                                    self.keyboard.press(' ')
-                                    self.keyboard.release(' ')
-                                    print("✓ Typed: SPACE")
-                                elif k == "DEL":  # Backspace
-                                    if len(self.text) > 0:
-                                        self.text = self.text[:-1]
-                                    from pynput.keyboard import Key
-                                    self.keyboard.press(Key.backspace)
-                                    self.keyboard.release(Key.backspace)
-                                    print("✓ Typed: BACKSPACE")
-                                elif k == "ENTER":  # Enter
-                                    # Send enter key to focused application
-                                    from pynput.keyboard import Key
-                                    import time
-                                    try:
-                                        self.keyboard.press(Key.enter)
-                                        time.sleep(0.05)  # Small delay for key registration
-                                        self.keyboard.release(Key.enter)
-                                        print("✓ Typed: ENTER key pressed")
-                                    except Exception as e:
-                                        print(f"⚠ Error typing ENTER: {e}")
-                                else:
-                                    # Regular character - apply caps lock
-                                    if k.isalpha():
-                                        char = k.upper() if self.caps_lock else k.lower()
-                                    else:
-                                        char = k  # Numbers and symbols unchanged
-                                    
-                                    self.text += char
-                                    self.keyboard.press(char)
-                                    self.keyboard.release(char)
-                                    print(f"✓ Typed: {char}")
-                                
-                                self.delay = 1
-                            
-                            break  # Only process one button at a time
+                        # IMPORTANT: Only type when pinched AND delay expired
+                        # This prevents accidental typing from just hovering
+                        if dis < 35 and not self.swipe_mode and not self.key_repeat.active:
+                            log.debug("pinch", "🔵 PINCH! Dist: %d | Key: %s", dis, button.text)
+                            self.press(button)
+                            if button.target:  # The hovered key belonged to the old layout
+                                hovered_button = None
+                            self.key_repeat.start()
                     
                     # Show pinch status - visual feedback
                     if dis < 35:
@@ -505,30 +561,19 @@ class VirtualKeyboard:
                                   cv2.FONT_HERSHEY_PLAIN, 2, (255, 165, 0), 2)
                 
                 except Exception as e:
-                    print(f"⚠ Error processing gesture: {e}")
+                    log.error("keyboard_frame", "⚠ Error processing gesture: %s", e, every=1.0)
         else:
             # No RIGHT hand detected
             cv2.putText(frame, "Show RIGHT hand", (10, 30), 
                        cv2.FONT_HERSHEY_PLAIN, 2, (0, 0, 255), 2)
         
-        # Handle delay between keypresses - REDUCED for faster typing
-        if self.delay != 0:
-            self.delay += 1
-            if self.delay > 8:  # Increased to prevent double typing
-                self.delay = 0
-        
-        # Show keyboard window without stealing focus
-        cv2.imshow(self.window_name, keyboard_img)
+        # Show keyboard window without stealing focus (nothing is composited for headless runs)
+        if self.show_window:
+            cv2.imshow(self.window_name, self.render(cursor, hovered_button))
         
-        # Ensure target app remains focused after displaying keyboard
-        if self.target_app_name and self.target_hwnd and win32gui and platform.system() == "Windows":
-            try:
-                current_foreground = win32gui.GetForegroundWindow()
-                keyboard_hwnd = win32gui.FindWindow(None, self.window_name)
-                # If the keyboard window stole focus, give it back to the target
-                if current_foreground == keyboard_hwnd and self.target_hwnd:
-                    win32gui.SetForegroundWindow(self.target_hwnd)
-            except:
-                pass  # Silently fail if there's an issue
+        # Ensure target app remains focused after displaying keyboard: if the keyboard
+        # window stole focus, give it back to the cached target (no window lookups per frame)
+        if self.window_created:
+            self.focus.restore_focus(self.window_name)
         
         return frame
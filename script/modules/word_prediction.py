@@ -0,0 +1,123 @@
+"""
+Word Prediction Module - Prefix-trie completions for the virtual keyboard
+
+Typing with the virtual keyboard takes one pinch per character.
+WordPredictor offers the top-k completions of the word being typed, so the
+rest of a word costs a single pinch.
+
+The trie is built once from word_list.txt, which holds common English
+words, most frequent first. A word's base score follows Zipf's law
+(BASE_SCORE / rank). Every time the user finishes a word, its score goes up
+by HISTORY_BOOST, and unknown words are added. Those counts are kept in a
+small JSON history file between sessions.
+
+Each trie node caches its own top-k (score, word) list. suggest(prefix) is
+therefore a walk of len(prefix) dict lookups, with no subtree search per
+frame. Scores only ever increase, so learn() can keep the caches correct by
+updating the nodes along the word's path.
+"""
+
+import json
+import os
+
+from .logger import log
+
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+WORDS_PATH = os.path.join(MODULE_DIR, "word_list.txt")
+HISTORY_PATH = os.path.join(MODULE_DIR, "typed_history.json")
+
+BASE_SCORE = 1_000_000  # Score of the most frequent word in the list
+HISTORY_BOOST = 20_000  # Added per use: a word typed a few times outranks most of the list
+
+
+class TrieNode:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children = {}  # letter -> TrieNode
+        self.top = []  # Best (score, word) pairs below this node, highest score first
+
+
+class WordPredictor:
+    def __init__(self, words_path=WORDS_PATH, history_path=HISTORY_PATH, k=3):
+        self.k = k
+        self.history_path = history_path  # None keeps typed history in memory only
+        self.root = TrieNode()
+        self.scores = {}  # word -> current score
+        self.history = {}  # word -> times typed
+        self._dirty = False
+
+        for rank, word in enumerate(self._read_words(words_path), start=1):
+            self._set_score(word, BASE_SCORE / rank)
+        for word, count in self._read_history().items():
+            self.learn(word, count)
+        self._dirty = False
+        log.debug("word_prediction", "✓ Word predictor ready: %d words", len(self.scores))
+
+    def _read_words(self, path):
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                return [line.strip().lower() for line in file if line.strip().isalpha()]
+        except OSError as e:
+            log.warning("word_prediction", "⚠ Could not read word list %s: %s", path, e)
+            return []
+
+    def _read_history(self):
+        if not self.history_path or not os.path.exists(self.history_path):
+            return {}
+        try:
+            with open(self.history_path, "r", encoding="utf-8") as file:
+                history = json.load(file)
+            return {word: int(count) for word, count in history.items() if isinstance(word, str)}
+        except (OSError, ValueError, AttributeError, TypeError) as e:
+            log.warning("word_prediction", "⚠ Ignoring unreadable typing history %s: %s", self.history_path, e)
+            return {}
+
+    def _set_score(self, word, score):
+        """Raise a word's score and refresh the top-k cache of every node on its path"""
+        self.scores[word] = score
+        entry = (score, word)
+        node = self.root
+        for depth in range(len(word) + 1):
+            top = node.top
+            for i, (_, cached) in enumerate(top):
+                if cached == word:
+                    del top[i]
+                    break
+            if len(top) < self.k or score > top[-1][0]:
+                top.append(entry)
+                top.sort(key=lambda item: (-item[0], item[1]))
+                del top[self.k:]
+            if depth < len(word):
+                node = node.children.setdefault(word[depth], TrieNode())
+
+    def suggest(self, prefix):
+        """Up to k completions of `prefix` (case-insensitive), best first"""
+        node = self.root
+        for letter in prefix.lower():
+            node = node.children.get(letter)
+            if node is None:
+                return []
+        return [word for _, word in node.top]
+
+    def learn(self, word, count=1):
+        """Record that the user typed `word` (letters only, two or more)"""
+        word = word.lower()
+        if len(word) < 2 or not word.isalpha() or count <= 0:
+            return
+        self.history[word] = self.history.get(word, 0) + count
+        self._set_score(word, self.scores.get(word, 0) + HISTORY_BOOST * count)
+        self._dirty = True
+
+    def save_history(self):
+        """Write typed-word counts next to the module (write-then-rename); no-op if nothing new"""
+        if not self.history_path or not self._dirty:
+            return
+        temp_path = f"{self.history_path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(self.history, file, indent=2, sort_keys=True)
+            os.replace(temp_path, self.history_path)
+            self._dirty = False
+        except OSError as e:
+            log.warning("word_prediction", "⚠ Could not save typing history: %s", e)
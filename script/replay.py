@@ -0,0 +1,209 @@
+"""
+Landmark Replay - Run recorded landmark sessions through the gesture engine
+
+Recordings made with GestureControl(record_path=...) are fed through
+GestureControl.process_observation, which is the same classification and
+mode dispatch path that run() uses. The engine clock follows the recorded
+timestamps, so cadences, stability windows and cooldowns behave as they
+did live. Results are deterministic and the replay runs as fast as
+classification allows. The engine gets an empty gesture config unless a
+config file is given, so this machine's user_defined_data.json can't
+change the result. Actions go to a RecordingDispatcher, so nothing is
+pressed, moved or launched. Mode handlers get StubBackends, so pyautogui,
+pynput, keyboard and the win32 bindings are never imported either. No
+camera, desktop or MediaPipe model is needed.
+
+Usage (from the repository root):
+    python -m script.replay recordings/*.gclm
+    python -m script.replay session.gclm --actions
+    python -m script.replay session.gclm --config kiosk_gestures.json
+    python -m script.replay recordings/*.gclm --json > report.json
+    python -m script.replay session.gclm --serve-metrics 9464
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+import numpy as np
+
+from script.gesture_control import GestureControl
+from script.modules.actuator import RecordingDispatcher
+from script.modules.backends import StubBackends
+from script.modules.config_service import ConfigService
+from script.modules.landmark_recording import LandmarkRecording
+from script.modules.logger import log
+from script.modules.metrics_exporter import MetricsExporter
+from script.modules.tracker import HandTracker
+
+
+class ReplayClock:
+    """Engine clock set to each recorded frame's timestamp"""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class ReplayResult:
+    def __init__(self, path, frames, recorded_seconds, replay_seconds, actions, final_mode, engine=None, config_path=None):
+        self.path = path
+        self.config_path = config_path  # Gesture config the engine ran with (None = empty)
+        self.frames = frames
+        self.recorded_seconds = recorded_seconds
+        self.replay_seconds = replay_seconds
+        self.actions = actions  # [(seconds since the first frame, name, args)]
+        self.final_mode = final_mode
+        self.engine = engine  # The GestureControl the session ran through (metrics, idle stats)
+
+    @property
+    def frames_per_second(self):
+        return self.frames / self.replay_seconds if self.replay_seconds > 0 else 0.0
+
+    @property
+    def speedup(self):
+        """Recorded duration / replay duration (x real time)"""
+        return self.recorded_seconds / self.replay_seconds if self.replay_seconds > 0 else 0.0
+
+    def action_counts(self):
+        counts = {}
+        for _, name, _ in self.actions:
+            counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    def summary(self):
+        return {
+            "path": self.path,
+            "config": self.config_path,
+            "frames": self.frames,
+            "recorded_seconds": round(self.recorded_seconds, 3),
+            "replay_seconds": round(self.replay_seconds, 4),
+            "frames_per_second": round(self.frames_per_second, 1),
+            "speedup": round(self.speedup, 1),
+            "final_mode": self.final_mode,
+            "actions": len(self.actions),
+            "action_counts": self.action_counts(),
+        }
+
+
+def replay(recording, verbose=False, max_seconds=None, config_path=None):
+    """Replay one LandmarkRecording (or path) through a fresh engine and return a ReplayResult
+
+    With max_seconds, only the first max_seconds of recorded time are replayed.
+    config_path is a user_defined_data.json to run with; None replays with no gestures configured.
+    """
+    if not isinstance(recording, LandmarkRecording):
+        recording = LandmarkRecording(recording)
+
+    clock = ReplayClock(float(recording.timestamps[0]) if len(recording) else 0.0)
+    dispatcher = RecordingDispatcher(clock)
+    # Read once and never watched, so the gesture config is the same for the whole session
+    config = ConfigService(config_path)
+    engine = GestureControl(dispatcher=dispatcher, clock=clock, config=config, backends=StubBackends())
+    frame = np.zeros(recording.frame_shape, dtype=np.uint8)  # Blank frame for handlers that draw (keyboard)
+    origin = float(recording.timestamps[0]) if len(recording) else 0.0
+    frames = len(recording)
+    if max_seconds is not None:
+        frames = int(np.searchsorted(recording.timestamps, origin + max_seconds, side="right"))
+
+    # The engine's debug prints would dominate the replay time
+    log.flush()  # Earlier log lines must not be swallowed by the redirect
+    with open(os.devnull, "w") as devnull, redirect_stdout(sys.stdout if verbose else devnull):
+        engine.setup(
+            HandTracker(crop_inference=False, scheduler=engine.scheduler, load_model=False),
+            show_keyboard=False,
+        )
+        start = time.perf_counter()
+        for index in range(frames):
+            clock.now = float(recording.timestamps[index])
+            engine.scheduler.tick()
+            engine.process_observation(recording.observation(index), frame)
+        replay_seconds = time.perf_counter() - start
+        engine.modes.deactivate_all()
+        log.flush()  # Buffered engine log lines go to the same place as its prints
+
+    actions = [(created - origin, name, args) for created, name, args in dispatcher.actions]
+    recorded_seconds = float(recording.timestamps[frames - 1]) - origin if frames > 1 else 0.0
+    return ReplayResult(recording.path, frames, recorded_seconds, replay_seconds, actions, engine.current_mode, engine,
+                        config.path)
+
+
+def serve_metrics(engine, port):
+    """Serve a replayed engine's metrics until interrupted (for checking scrapers and dashboards)"""
+    exporter = MetricsExporter(engine, port=port)
+    exporter.start()
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        exporter.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recordings", nargs="+", help="landmark recording files")
+    parser.add_argument("--actions", action="store_true", help="list every emitted action")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--verbose", action="store_true", help="show the engine's own output")
+    parser.add_argument("--config", metavar="PATH",
+                        help="user_defined_data.json to replay with (default: no gestures configured)")
+    parser.add_argument("--serve-metrics", type=int, metavar="PORT",
+                        help="after replaying, serve the last session's metrics on localhost:PORT until Ctrl+C")
+    args = parser.parse_args(argv)
+
+    results = [replay(path, verbose=args.verbose, config_path=args.config) for path in args.recordings]
+    frames = sum(result.frames for result in results)
+    replay_seconds = sum(result.replay_seconds for result in results)
+    recorded_seconds = sum(result.recorded_seconds for result in results)
+
+    if args.json:
+        report = {
+            "recordings": [result.summary() for result in results],
+            "total": {
+                "frames": frames,
+                "recorded_seconds": round(recorded_seconds, 3),
+                "replay_seconds": round(replay_seconds, 4),
+                "frames_per_second": round(frames / replay_seconds, 1) if replay_seconds else 0.0,
+                "actions": sum(len(result.actions) for result in results),
+            },
+        }
+        if args.actions:
+            for entry, result in zip(report["recordings"], results):
+                entry["action_log"] = [[round(t, 3), name, repr(action_args)] for t, name, action_args in result.actions]
+        print(json.dumps(report, indent=2))
+        if args.serve_metrics is not None:
+            serve_metrics(results[-1].engine, args.serve_metrics)
+        return 0
+
+    for result in results:
+        summary = result.summary()
+        print(
+            f"{summary['path']}: {summary['frames']} frames | {summary['recorded_seconds']:.1f}s recorded | "
+            f"{summary['frames_per_second']:.0f} frames/s ({summary['speedup']:.0f}x real time) | "
+            f"{summary['actions']} actions {summary['action_counts']} | mode: {summary['final_mode']} | "
+            f"config: {summary['config'] or 'none'}"
+        )
+        if args.actions:
+            for t, name, action_args in result.actions:
+                print(f"    {t:8.3f}s  {name:<12} {action_args!r}")
+
+    if len(results) > 1:
+        print(
+            f"total: {frames} frames in {replay_seconds:.3f}s "
+            f"({frames / replay_seconds if replay_seconds else 0:.0f} frames/s), "
+            f"{sum(len(result.actions) for result in results)} actions"
+        )
+    if args.serve_metrics is not None:
+        serve_metrics(results[-1].engine, args.serve_metrics)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Microbenchmark: per-frame dispatch overhead of the right-hand branch.
+
+Before: GestureControl.run built a new controller object every frame
+(MouseControl calls pyautogui.size(), UserDefControls re-reads its JSON).
+After: ModeRegistry builds each handler once and every frame is a lookup.
+
+Only handler lookup/construction is timed - no OS side effects are fired.
+Run from the repository root:
+    python testing/benchmarks/bench_dispatch_overhead.py --frames 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.app_control import AppControl
+from modules.browser_control import BrowserControl
+from modules.game_control import GameControl
+from modules.media_and_brightness_control import MediaControl
+from modules.mode_registry import ModeRegistry
+from modules.mouse_control import MouseControl
+from modules.user_def_controls import UserDefControls
+
+
+FACTORIES = {
+    "thumb": lambda: MediaControl(None),
+    "index": lambda: AppControl(None),
+    "index and middle": lambda: BrowserControl(None),
+    "index, middle and ring": lambda: MouseControl(None),
+    "index and little": lambda: GameControl(None),
+    "all": lambda: UserDefControls(None),
+}
+
+
+def per_frame_us(fn, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return (time.perf_counter() - start) / frames * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=2000, help="simulated frames per mode")
+    args = parser.parse_args()
+
+    # Silence the handlers' console output so it does not dominate the timings
+    stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+    try:
+        rows = []
+        for mode, factory in FACTORIES.items():
+            registry = ModeRegistry({mode: factory})
+            registry.activate(mode)
+            constructed = per_frame_us(factory, args.frames)
+            looked_up = per_frame_us(lambda: registry.get(mode), args.frames)
+            rows.append((mode, constructed, looked_up))
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    print(f"{'mode':<26}{'per-frame build (us)':>22}{'registry lookup (us)':>22}")
+    for mode, constructed, looked_up in rows:
+        print(f"{mode:<26}{constructed:>22.2f}{looked_up:>22.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+Benchmark: per-hand raised-finger classification time.
+
+legacy      - protobuf attribute access in a Python list comprehension plus the
+              [id, cx, cy] list-of-lists find_position used to build
+vectorized  - one (21, 3) float32 conversion per hand, NumPy classification
+batched     - both hands classified together as a (2, 21, 3) array
+
+The conversion and classification steps of the batched path are also timed
+on their own. At one or two hands the NumPy path is dominated by per-call
+overhead rather than arithmetic; all of these are microseconds against the
+10-30 ms MediaPipe inference per frame.
+
+Landmarks are MediaPipe NormalizedLandmarkList protobufs when mediapipe is
+installed, otherwise plain attribute objects with the same layout.
+
+Usage:
+    python testing/benchmarks/bench_finger_classification.py --iterations 20000
+"""
+
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.hand_features import classify_batch, classify_hand, landmarks_to_array
+
+
+def make_landmark_list(points):
+    try:
+        from mediapipe.framework.formats import landmark_pb2
+
+        landmark_list = landmark_pb2.NormalizedLandmarkList()
+        for x, y, z in points:
+            landmark_list.landmark.add(x=float(x), y=float(y), z=float(z))
+        return landmark_list
+    except ImportError:
+        return SimpleNamespace(landmark=[SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in points])
+
+
+def legacy_classify(lst, hand_type, frame_width=640, frame_height=480):
+    thresh = (lst.landmark[0].y * 100 - lst.landmark[9].y * 100) / 2
+    finger_pairs = [(5, 8), (9, 12), (13, 16), (17, 20)]
+    raised_fingers = [
+        int((lst.landmark[finger_tip].y * 100 - lst.landmark[knuckle].y * 100) > thresh)
+        for finger_tip, knuckle in finger_pairs
+    ]
+    thumb_condition = (
+        (lst.landmark[4].x * 100 - lst.landmark[5].x * 100) > 6
+        if hand_type == "left"
+        else (lst.landmark[5].x * 100 - lst.landmark[4].x * 100) > 6
+    )
+    raised_fingers.insert(0, int(thumb_condition))
+    positions = [[id, int(lm.x * frame_width), int(lm.y * frame_height)] for id, lm in enumerate(lst.landmark)]
+    return (raised_fingers[::-1] if hand_type == "left" else raised_fingers), positions
+
+
+def vectorized_classify(lst, hand_type, frame_width=640, frame_height=480):
+    points = landmarks_to_array(lst)
+    positions = (points[:, :2] * np.array([frame_width, frame_height], dtype=np.float32)).astype(int)
+    return classify_hand(points, hand_type), positions
+
+
+def batched_classify(pair, is_left, frame_width=640, frame_height=480):
+    points = np.empty((2, 21, 3), dtype=np.float32)
+    for idx, lst in enumerate(pair):
+        landmarks_to_array(lst, out=points[idx])
+    positions = (points[:, :, :2] * np.array([frame_width, frame_height], dtype=np.float32)).astype(int)
+    return classify_batch(points, is_left), positions
+
+
+def per_hand_us(fn, iterations, hands_per_call=1):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / (iterations * hands_per_call) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    left, right = (make_landmark_list(points) for points in rng.random((2, 21, 3), dtype=np.float32))
+    is_left = np.array([True, False])
+
+    legacy = per_hand_us(lambda: legacy_classify(right, "right"), args.iterations)
+    vectorized = per_hand_us(lambda: vectorized_classify(right, "right"), args.iterations)
+    batched = per_hand_us(lambda: batched_classify((left, right), is_left), args.iterations, hands_per_call=2)
+    points = np.stack([landmarks_to_array(left), landmarks_to_array(right)])
+    convert = per_hand_us(lambda: landmarks_to_array(right), args.iterations)
+    classify = per_hand_us(lambda: classify_batch(points, is_left), args.iterations, hands_per_call=2)
+
+    print(f"legacy      {legacy:8.2f} us/hand")
+    print(f"vectorized  {vectorized:8.2f} us/hand  ({legacy / vectorized:.2f}x)")
+    print(f"batched x2  {batched:8.2f} us/hand  ({legacy / batched:.2f}x)")
+    print(f"  convert   {convert:8.2f} us/hand")
+    print(f"  classify  {classify:8.2f} us/hand")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
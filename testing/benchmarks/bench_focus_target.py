@@ -0,0 +1,95 @@
+"""
+Microbenchmark: focusing the keyboard's target app before each typed key.
+
+Before: every key walked all processes and all top-level windows to find the
+target, then slept 200 ms after a focus switch, and every frame called
+FindWindow for the keyboard window. After: FocusService caches the target
+window and only rescans when that handle goes invalid, and the keyboard
+window is resolved once.
+
+Runs against FakeWindowSystem (an in-memory desktop), so it works on any OS.
+The fake's scans are far cheaper than psutil / EnumWindows, so the number
+of scans is the figure that carries over to Windows. The target app is
+restarted every --restart-every keys to exercise cache invalidation.
+Run from the repository root:
+    python testing/benchmarks/bench_focus_target.py --keys 2000 --processes 300
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.focus_service import FakeWindowSystem, FocusService
+
+
+def make_desktop(processes):
+    desktop = FakeWindowSystem()
+    for pid in range(1000, 1000 + processes):
+        desktop.start_process(pid, f"background{pid}.exe", [f"Window {pid}", ""])
+    desktop.start_process(42, "notepad.exe", ["Untitled - Notepad"])
+    return desktop
+
+
+def legacy_focus(desktop, app_name):
+    """The old find_and_focus_target_app lookup (without its 0.5 s throttle and 200 ms sleep)"""
+    pids = desktop.process_ids(app_name)
+    if not pids:
+        return False
+    windows = [(hwnd, title, pid) for hwnd, pid, title in desktop.windows() if pid in pids]
+    if not windows:
+        return False
+    hwnd = windows[0][0]
+    if desktop.foreground() != hwnd:
+        desktop.focus(hwnd)
+    return True
+
+
+def run(focus, frame, desktop, keys, restart_every, frames_per_key):
+    pid = 42
+    start = time.perf_counter()
+    for i in range(keys):
+        if restart_every and i and i % restart_every == 0:
+            desktop.kill_process(pid)
+            pid += 1
+            desktop.start_process(pid, "notepad.exe", ["Untitled - Notepad"])
+        focus()
+        for _ in range(frames_per_key):
+            frame()
+    return (time.perf_counter() - start) / keys * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=2000, help="typed keys")
+    parser.add_argument("--processes", type=int, default=300, help="other processes (each with a window)")
+    parser.add_argument("--restart-every", type=int, default=500, help="restart the target app every N keys")
+    parser.add_argument("--frames-per-key", type=int, default=8, help="keyboard frames between keys")
+    args = parser.parse_args()
+
+    before_desktop = make_desktop(args.processes)
+    before_desktop.open_window(1, "Virtual Keyboard")
+    # Before: FindWindow on every frame
+    before = run(lambda: legacy_focus(before_desktop, "notepad"), lambda: before_desktop.find_window("Virtual Keyboard"),
+                 before_desktop, args.keys, args.restart_every, args.frames_per_key)
+
+    after_desktop = make_desktop(args.processes)
+    after_desktop.open_window(1, "Virtual Keyboard")
+    service = FocusService("notepad", backend=after_desktop)
+    # After: frames check the cached keyboard handle
+    after = run(service.focus_target, lambda: service.restore_focus("Virtual Keyboard"),
+                after_desktop, args.keys, args.restart_every, args.frames_per_key)
+
+    print(f"{'path':<26}{'per key (us)':>14}{'process scans':>16}{'window scans':>15}{'FindWindow':>12}")
+    for label, per_key, desktop in (("full scan (before)", before, before_desktop), ("FocusService (after)", after, after_desktop)):
+        print(f"{label:<26}{per_key:>14.1f}{desktop.process_scans:>16}{desktop.window_scans:>15}{desktop.find_window_calls:>12}")
+    print(f"200 ms post-focus sleeps avoided: {before_desktop.focus_calls} "
+          f"(~{before_desktop.focus_calls * 0.2:.1f} s of blocked typing)")
+
+
+if __name__ == "__main__":
+    main()
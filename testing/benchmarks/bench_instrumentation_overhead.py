@@ -0,0 +1,65 @@
+"""
+Benchmark: cost of the pipeline stage timers, enabled vs disabled.
+
+The engine wraps about ten stages per frame in PipelineMetrics timers and
+bumps a few counters. This measures that per-frame overhead against an
+uninstrumented loop doing the same (empty) work.
+
+Usage:
+    python testing/benchmarks/bench_instrumentation_overhead.py --frames 200000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.instrumentation import PipelineMetrics
+
+STAGES = ["capture_wait", "flip", "preview", "preprocess", "cvtColor", "hands_process", "classify", "dispatch"]
+
+
+def instrumented_frame(metrics):
+    for stage in STAGES:
+        with metrics.timer(stage):
+            pass
+    metrics.count("frames")
+    metrics.count("frames_inferred")
+    metrics.count_actions("Mouse Control", 1)
+
+
+def bare_frame(_):
+    for _stage in STAGES:
+        pass
+
+
+def per_frame_us(fn, metrics, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        fn(metrics)
+    return (time.perf_counter() - start) / frames * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=200000)
+    args = parser.parse_args()
+
+    bare = per_frame_us(bare_frame, None, args.frames)
+    disabled = per_frame_us(instrumented_frame, PipelineMetrics(enabled=False), args.frames)
+    enabled = per_frame_us(instrumented_frame, PipelineMetrics(enabled=True), args.frames)
+
+    budget_us = 1e6 / 30
+    print(f"{len(STAGES)} stages + 3 counters per frame")
+    print(f"bare      {bare:7.2f} us/frame")
+    print(f"disabled  {disabled:7.2f} us/frame  ({(disabled - bare) / budget_us * 100:.3f}% of a 33 ms frame)")
+    print(f"enabled   {enabled:7.2f} us/frame  ({(enabled - bare) / budget_us * 100:.3f}% of a 33 ms frame)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Microbenchmark: per-frame virtual keyboard render time.
+
+Before: VirtualKeyboard.process allocated a new 480x1000 image every frame
+and redrew all 40+ buttons (three rectangles, getTextSize and putText per key).
+After: the static keyboard is rendered once per layout and caps state and cached.
+Each frame copies it into a reused buffer and only draws the text strip,
+cursor and hover highlight.
+
+Both paths draw the same moving cursor, hover highlight and text, and the
+caps lock is toggled every --caps-every frames so the cache is exercised too.
+It also times hovered-key hit-testing: the old loop over every button
+rectangle against the KeyIndex label-map lookup.
+Run from the repository root:
+    python testing/benchmarks/bench_keyboard_render.py --frames 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "unit_tests")))  # fakes
+
+from modules.virtual_keyboard import VirtualKeyboard
+from fakes import FakeTracker
+
+
+def full_redraw(keyboard, cursor, hovered_button):
+    """The pre-cache render path of VirtualKeyboard.process"""
+    img = np.zeros((480, 1000, 3), dtype=np.uint8)
+    img[:] = (30, 30, 30)
+    keyboard.drawAll(img)
+    cv2.rectangle(img, (15, 435), (985, 475), (200, 200, 200), 2)
+    cv2.rectangle(img, (17, 437), (983, 473), (50, 50, 50), cv2.FILLED)
+    cv2.putText(img, keyboard.text[-55:], (25, 462), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255), 2)
+    if keyboard.caps_lock:
+        cv2.rectangle(img, (920, 435), (985, 475), (50, 50, 200), cv2.FILLED)
+        cv2.putText(img, "CAPS", (925, 462), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+    cv2.circle(img, cursor, 20, (0, 255, 0), 3)
+    cv2.circle(img, cursor, 5, (0, 255, 0), -1)
+    (x, y), (w, h) = hovered_button.pos, hovered_button.size
+    cv2.rectangle(img, (x - 3, y - 3), (x + w + 3, y + h + 3), (0, 255, 255), 3)
+    return img
+
+
+def linear_scan(buttons, x, y):
+    for button in buttons:
+        xb, yb = button.pos
+        wb, hb = button.size
+        if (xb < x < xb + wb) and (yb < y < yb + hb):
+            return button
+    return None
+
+
+def hit_test_us(lookup, points):
+    start = time.perf_counter()
+    for x, y in points:
+        lookup(x, y)
+    return (time.perf_counter() - start) / len(points) * 1e6
+
+
+def per_frame_us(keyboard, render, frames, caps_every):
+    buttons = keyboard.buttonList
+    start = time.perf_counter()
+    for i in range(frames):
+        if caps_every and i % caps_every == 0:
+            keyboard.caps_lock = not keyboard.caps_lock
+        button = buttons[i % len(buttons)]
+        cursor = (button.pos[0] + button.size[0] // 2, button.pos[1] + button.size[1] // 2)
+        render(keyboard, cursor, button)
+    return (time.perf_counter() - start) / frames * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=2000, help="rendered frames per path")
+    parser.add_argument("--caps-every", type=int, default=200, help="toggle caps lock every N frames (0 = never)")
+    args = parser.parse_args()
+
+    keyboard = VirtualKeyboard(FakeTracker(), show_window=False)
+    keyboard.text = "the quick brown fox jumps over the lazy dog "
+
+    before = per_frame_us(keyboard, full_redraw, args.frames, args.caps_every)
+    after = per_frame_us(keyboard, lambda kb, cursor, button: kb.render(cursor, button), args.frames, args.caps_every)
+
+    print(f"{'path':<30}{'per-frame render (us)':>24}")
+    print(f"{'full redraw (before)':<30}{before:>24.1f}")
+    print(f"{'cached static layer (after)':<30}{after:>24.1f}")
+    print(f"speedup: {before / after:.1f}x | cached layers: {len(keyboard._layers)}")
+
+    # Cursor positions spread over the whole keyboard, most of them past the first rows
+    rng = np.random.default_rng(0)
+    points = list(zip(rng.integers(0, 1000, args.frames).tolist(), rng.integers(0, 440, args.frames).tolist()))
+    index = keyboard.key_indexes["qwerty"]
+    scan = hit_test_us(lambda x, y: linear_scan(index.buttons, x, y), points)
+    indexed = hit_test_us(index.lookup, points)
+    print(f"\n{'hit test':<30}{'per lookup (us)':>24}")
+    print(f"{'linear scan (before)':<30}{scan:>24.2f}")
+    print(f"{'key index (after)':<30}{indexed:>24.2f}")
+
+
+if __name__ == "__main__":
+    main()
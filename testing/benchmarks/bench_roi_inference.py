@@ -0,0 +1,115 @@
+"""
+Benchmark: HandTracker.observe() latency with full-frame vs ROI-cropped inference.
+
+full  - every frame is converted and sent to Hands.process at 640x480
+crop  - while both hands are tracked, only a padded crop around them is sent,
+        downscaled to at most 256 px on its longer side
+
+Use a clip where both hands are in view and small relative to the frame;
+large hands make the crop cover most of the image and the tracker stays on
+full-frame inference.
+
+Besides latency it reports how many times MediaPipe tracking was reset (once
+per crop change), and how far the crop path's landmarks are from the
+full-frame path's, overall and on the frames right after a crop change.
+
+Cropping is off by default (HandTracker(crop_inference=False); opt in with
+GestureControl(crop_inference=True) or the headless "crop_inference"
+setting) until real-footage results show it pays off. Last measured with
+MediaPipe 0.10.14 on a synthetic 300-frame 640x480 clip of two small hands
+that drift and jump 60 px every 100 frames:
+
+    full  mean 29.3 ms | hands/frame 1.79
+    crop  mean 38.7 ms | hands/frame 1.16 | 52 tracking resets
+    crop vs full landmarks: mean 2.0 px, 14.2 px right after a crop change
+
+Usage:
+    python testing/benchmarks/bench_roi_inference.py --video clip.mp4 --frames 300
+    python testing/benchmarks/bench_roi_inference.py --camera 0
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from bench_shared_inference import load_frames
+from modules.tracker import HandTracker
+
+
+def time_observe(frames, crop_inference):
+    tracker = HandTracker(crop_inference=crop_inference)
+    timings = []
+    hands_found = 0
+    points = []  # Full-frame landmarks per frame, sorted left hand first
+    changed = []  # The inference geometry (crop / full frame) changed on this frame
+    for frame in frames:
+        resets = tracker.tracking_resets
+        start = time.perf_counter()
+        observation = tracker.observe(frame)
+        timings.append((time.perf_counter() - start) * 1000)
+        hands_found += len(observation.hands)
+        points.append(observation.points[np.argsort(~observation.is_left, kind="stable")])
+        changed.append(tracker.tracking_resets != resets)
+    return np.array(timings), hands_found / max(len(frames), 1), tracker.roi_stats(), points, changed
+
+
+def landmark_error_px(full_points, crop_points, frames):
+    """Mean landmark distance (px) between the two paths, per frame where both saw the same hands"""
+    errors = np.full(len(full_points), np.nan)
+    height, width = frames[0].shape[:2]
+    for i, (full, crop) in enumerate(zip(full_points, crop_points)):
+        if len(full) and len(full) == len(crop):
+            errors[i] = np.hypot((full[..., 0] - crop[..., 0]) * width, (full[..., 1] - crop[..., 1]) * height).mean()
+    return errors
+
+
+def report(name, timings, hands_per_frame):
+    print(
+        f"{name:<5} mean {timings.mean():6.2f} ms | p50 {np.percentile(timings, 50):6.2f} ms | "
+        f"p95 {np.percentile(timings, 95):6.2f} ms | hands/frame {hands_per_frame:.2f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="video file to read frames from (default: camera)")
+    parser.add_argument("--camera", type=int, default=0, help="camera index when no video is given")
+    parser.add_argument("--frames", type=int, default=300, help="number of frames to benchmark")
+    args = parser.parse_args()
+
+    frames = load_frames(args)
+    if not frames:
+        print("No frames captured")
+        return 1
+    print(f"HandTracker.observe over {len(frames)} frames at 640x480")
+
+    full, full_hands, _, full_points, _ = time_observe(frames, crop_inference=False)
+    crop, crop_hands, stats, crop_points, changed = time_observe(frames, crop_inference=True)
+    report("full", full, full_hands)
+    report("crop", crop, crop_hands)
+    print(
+        f"crop frames {stats['crop_frames']} | full frames {stats['full_frames']} | "
+        f"fallbacks {stats['fallbacks']} | tracking resets {stats['tracking_resets']}"
+    )
+    print(f"speedup {full.mean() / crop.mean():.2f}x")
+
+    # Landmarks should not depend on the path; the frames right after a crop change are the risky ones
+    errors = landmark_error_px(full_points, crop_points, frames)
+    changed = np.array(changed)
+    print(
+        f"crop vs full landmarks: mean {np.nanmean(errors):.2f} px | "
+        f"after a crop change {np.nanmean(errors[changed]) if np.any(~np.isnan(errors[changed])) else float('nan'):.2f} px | "
+        f"max {np.nanmax(errors):.2f} px"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Benchmark: per-frame landmark inference cost in mouse mode, before and after
+sharing one FrameObservation across the mode handlers.
+
+Before: GestureControl.run called Hands.process() once for classification and
+MouseControl then called it again through HandTracker.find_position().
+After: HandTracker.observe() runs it once and find_position() reads the result.
+
+Usage:
+    python testing/benchmarks/bench_shared_inference.py --video clip.mp4 --frames 300
+    python testing/benchmarks/bench_shared_inference.py --camera 0
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.tracker import HandTracker
+
+
+def load_frames(args):
+    cap = cv2.VideoCapture(args.video if args.video else args.camera)
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+    frames = []
+    while len(frames) < args.frames:
+        success, frame = cap.read()
+        if not success:
+            break
+        frames.append(cv2.resize(cv2.flip(frame, 1), (640, 480)))
+    cap.release()
+    return frames
+
+
+def legacy_mouse_frame(tracker, frame):
+    """The pre-observation mouse-mode path: two inferences on the same frame"""
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    results = tracker.hands.process(rgb)
+    if results.multi_hand_landmarks:
+        for idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
+            handedness = results.multi_handedness[idx].classification[0].label.lower()
+            tracker.detect_raised_fingers(hand_landmarks, handedness, True)
+    # HandTracker.find_position(frame, True) before the change
+    landmarks = []
+    results = tracker.hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    if results.multi_hand_landmarks:
+        h, w, _ = frame.shape
+        for hand_landmarks in results.multi_hand_landmarks:
+            for id, lm in enumerate(hand_landmarks.landmark):
+                landmarks.append([id, int(lm.x * w), int(lm.y * h)])
+    return landmarks
+
+
+def shared_mouse_frame(tracker, frame):
+    """The current mouse-mode path: one inference shared through the observation"""
+    observation = tracker.observe(frame)
+    for hand in observation.hands:
+        tracker.detect_raised_fingers(hand.landmarks, hand.handedness, True)
+    return tracker.find_position(observation, mouse_control=True)
+
+
+def time_path(path, frames):
+    tracker = HandTracker()
+    calls = [0]
+    process = tracker.hands.process
+
+    def counting_process(image):
+        calls[0] += 1
+        return process(image)
+
+    tracker.hands.process = counting_process
+    timings = []
+    for frame in frames:
+        start = time.perf_counter()
+        path(tracker, frame)
+        timings.append((time.perf_counter() - start) * 1000)
+    return np.array(timings), calls[0] / max(len(frames), 1)
+
+
+def report(name, timings, calls_per_frame):
+    print(
+        f"{name:<8} mean {timings.mean():6.2f} ms | p50 {np.percentile(timings, 50):6.2f} ms | "
+        f"p95 {np.percentile(timings, 95):6.2f} ms | Hands.process calls/frame {calls_per_frame:.2f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="video file to read frames from (default: camera)")
+    parser.add_argument("--camera", type=int, default=0, help="camera index when no video is given")
+    parser.add_argument("--frames", type=int, default=300, help="number of frames to benchmark")
+    args = parser.parse_args()
+
+    frames = load_frames(args)
+    if not frames:
+        print("No frames captured")
+        return 1
+    print(f"Mouse-mode inference over {len(frames)} frames at 640x480")
+
+    before, before_calls = time_path(legacy_mouse_frame, frames)
+    after, after_calls = time_path(shared_mouse_frame, frames)
+    report("before", before, before_calls)
+    report("after", after, after_calls)
+    print(f"speedup  {before.mean() / after.mean():.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Benchmark: import-time report for engine startup.
+
+Runs each statement in a fresh interpreter under `python -X importtime`. It
+prints the total import time, the slowest modules by cumulative time, and
+the self time of each top-level package. Mode modules are imported lazily,
+so importing the engine should no longer pull in pyautogui, pynput,
+keyboard or pygetwindow. With --budget-ms the script exits with status 1
+when the engine import gets slower than the budget, so it can gate
+startup regressions.
+
+Usage (from the repository root):
+    python testing/benchmarks/bench_startup_imports.py
+    python testing/benchmarks/bench_startup_imports.py --top 30 --budget-ms 1500
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(os.path.join(ROOT, "script"))
+
+from modules.lazy_import import import_time_report
+
+STATEMENTS = {
+    "engine": "import script.gesture_control",
+    "engine + every mode": "import script.gesture_control as g, importlib; "
+                           "[importlib.import_module(m) for m, _ in g.MODE_HANDLERS.values()]; "
+                           "importlib.import_module(g.VIRTUAL_KEYBOARD[0])",
+}
+
+MODE_BACKENDS = ("pyautogui", "pynput", "keyboard", "pygetwindow", "win32gui", "psutil")
+
+
+def report(label, statement, top):
+    entries = import_time_report(statement, cwd=ROOT)
+    cumulative = {name: cumulative_us for name, _, cumulative_us in entries}
+    total_us = cumulative.get(statement_root(statement), 0)
+    packages = {}
+    for name, self_us, _ in entries:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+
+    print(f"\n{label}: {statement}")
+    print(f"  modules imported: {len(entries)} | engine import: {total_us / 1000:.1f} ms")
+    print(f"  slowest modules (cumulative ms):")
+    for name, cumulative_us in sorted(cumulative.items(), key=lambda item: -item[1])[:top]:
+        print(f"    {cumulative_us / 1000:9.1f}  {name}")
+    print(f"  heaviest packages (self ms):")
+    for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+        print(f"    {self_us / 1000:9.1f}  {package}")
+    loaded_backends = [backend for backend in MODE_BACKENDS if backend in cumulative]
+    print(f"  mode backends loaded: {', '.join(loaded_backends) if loaded_backends else 'none'}")
+    return total_us / 1000
+
+
+def statement_root(statement):
+    return statement.split(";")[0].split()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, help="fail if importing the engine takes longer")
+    args = parser.parse_args()
+
+    engine_ms = None
+    for label, statement in STATEMENTS.items():
+        elapsed_ms = report(label, statement, args.top)
+        if engine_ms is None:
+            engine_ms = elapsed_ms
+
+    if args.budget_ms is not None and engine_ms > args.budget_ms:
+        print(f"\n✗ Engine import took {engine_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Microbenchmark: swipe decoding latency over a large dictionary.
+
+Before (baseline): score the swipe against every template in the
+dictionary. After: SwipeDecoder only scores the (first letter, last letter)
+groups whose keys lie near the start and end of the path. Both use the same
+precomputed, resampled templates and the same vectorized distance, so the
+difference is what the pruning buys.
+
+The bundled word list has about 1000 words. The dictionary is padded to
+--dictionary words (50k+) with pseudo-words from a letter-bigram model of
+that list, with Zipf frequencies by rank. Swipes are noisy cursor paths
+through the key centres of dictionary words, sampled by frequency.
+Run from the repository root:
+    python testing/benchmarks/bench_swipe_decoder.py --dictionary 60000 --swipes 500
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.keyboard_layout import qwerty_layout
+from modules.swipe_decoder import SwipeDecoder, key_centres, resample
+from modules.word_prediction import WORDS_PATH
+
+
+def build_dictionary(size, rng):
+    """Bundled words first, then unique bigram-model pseudo-words up to `size`"""
+    with open(WORDS_PATH, "r", encoding="utf-8") as file:
+        words = [line.strip() for line in file if line.strip().isalpha()]
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    counts = np.ones((27, 27))  # Row/column 26 marks the start/end of a word
+    for word in words:
+        indices = [26] + [letters.index(c) for c in word] + [26]
+        for a, b in zip(indices, indices[1:]):
+            counts[a, b] += 1
+    transitions = counts / counts.sum(axis=1, keepdims=True)
+    seen = set(words)
+    while len(words) < size:
+        word, state = "", 26
+        while len(word) < 12:
+            state = rng.choice(27, p=transitions[state])
+            if state == 26:
+                break
+            word += letters[state]
+        if len(word) >= 2 and word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def swipe_path(centres, word, noise, rng):
+    points = [np.array(centres[letter]) for letter in word]
+    path = []
+    for a, b in zip(points, points[1:]):
+        path += [a + (b - a) * t + rng.normal(0, noise, 2) for t in np.linspace(0, 1, 5)[:-1]]
+    path.append(points[-1] + rng.normal(0, noise, 2))
+    return [tuple(point) for point in path]
+
+
+def brute_force(decoder, k):
+    """Score every template in the dictionary (no first/last-letter pruning)"""
+    words = [word for group in decoder.groups.values() for word in group[0]]
+    templates = np.concatenate([group[1] for group in decoder.groups.values()])
+    prior = np.concatenate([group[2] for group in decoder.groups.values()])
+
+    def decode(path):
+        gesture = resample(path, decoder.samples)
+        costs = np.hypot(*(templates - gesture).transpose(2, 0, 1)).mean(axis=1) + prior
+        best = np.argpartition(costs, k)[:k]
+        return [words[i] for i in sorted(best, key=lambda i: costs[i])]
+
+    return decode
+
+
+def run(decode, swipes, k):
+    timings, top1, topk = [], 0, 0
+    for word, path in swipes:
+        start = time.perf_counter()
+        result = decode(path)
+        timings.append((time.perf_counter() - start) * 1e3)
+        top1 += bool(result) and result[0] == word
+        topk += word in result[:k]
+    return float(np.mean(timings)), float(np.percentile(timings, 99)), top1 / len(swipes), topk / len(swipes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dictionary", type=int, default=60000, help="dictionary size (words)")
+    parser.add_argument("--swipes", type=int, default=500, help="decoded swipes per path")
+    parser.add_argument("--noise", type=float, default=12.0, help="cursor jitter in keyboard pixels (std dev)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    words = build_dictionary(args.dictionary, rng)
+    priors = {word: 1.0 / rank for rank, word in enumerate(words, start=1)}
+    centres = key_centres(qwerty_layout())
+
+    start = time.perf_counter()
+    decoder = SwipeDecoder(words, centres, priors=priors)
+    build_s = time.perf_counter() - start
+
+    k = 4  # Best word plus the three alternatives shown on the suggestion keys
+    weights = np.array([priors[word] for word in words])
+    swipes = []
+    while len(swipes) < args.swipes:
+        word = words[rng.choice(len(words), p=weights / weights.sum())]
+        if decoder.key_sequence(word) is not None:
+            swipes.append((word, swipe_path(centres, word, args.noise, rng)))
+
+    candidates = []
+
+    def pruned(path):
+        result = decoder.decode(path, k)
+        candidates.append(decoder.last_candidates)
+        return result
+
+    print(f"dictionary: {len(words)} words, {decoder.size} swipeable in {len(decoder.groups)} groups | templates built in {build_s:.1f} s")
+    print(f"{'decoder':<30}{'mean (ms)':>11}{'p99 (ms)':>10}{'top-1':>8}{f'top-{k}':>8}")
+    for name, decode in (("all templates (before)", brute_force(decoder, k)), ("first/last pruned (after)", pruned)):
+        mean, p99, top1, topk = run(decode, swipes, k)
+        print(f"{name:<30}{mean:>11.2f}{p99:>10.2f}{top1:>8.1%}{topk:>8.1%}")
+    print(f"templates scored per swipe after pruning: mean {np.mean(candidates):.0f} of {decoder.size}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Simulation: virtual keyboard typing speed with and without word suggestions.
+
+Before: every character, including the space after each word, took a
+separate pinch. After: the keyboard shows the top three completions of the
+current word. Once the wanted word appears, one pinch on it types the rest
+of the word and the space.
+
+Sessions are replayed through VirtualKeyboard.press() on the QWERTY keys,
+so the real suggestion path (trie lookup, completion, learning) is used. The
+typist always picks the wanted word as soon as it is offered. By default
+the sessions are sentences sampled from the bundled word list with Zipf
+frequencies (seeded). --transcript replays a text file instead, one session
+per line. The "learned" pass replays the same sessions again after the
+predictor has learned the words typed in the first suggestion pass.
+
+Time is modelled, not measured: each pinch costs --pinch-seconds (key
+repeat cooldown plus moving to the key). Picking a suggestion also costs
+--choose-seconds for reading the strip. The lookup latency of
+WordPredictor.suggest() is measured.
+Run from the repository root:
+    python testing/benchmarks/bench_word_prediction.py --sessions 50 --words 12
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "unit_tests")))  # fakes
+
+from modules.virtual_keyboard import VirtualKeyboard
+from modules.word_prediction import WORDS_PATH, WordPredictor
+from fakes import FakeTracker
+
+
+def sampled_sessions(count, words_per_session, seed):
+    with open(WORDS_PATH, "r", encoding="utf-8") as file:
+        words = [line.strip() for line in file if line.strip()]
+    weights = 1.0 / np.arange(1, len(words) + 1)
+    rng = np.random.default_rng(seed)
+    return [
+        " ".join(words[i] for i in rng.choice(len(words), words_per_session, p=weights / weights.sum()))
+        for _ in range(count)
+    ]
+
+
+def transcript_sessions(path):
+    with open(path, "r", encoding="utf-8") as file:
+        sessions = [" ".join("".join(c for c in word if c.isalpha()) for word in line.lower().split()) for line in file]
+    return [session for session in sessions if session.strip()]
+
+
+def replay(keyboard, sessions, use_suggestions):
+    """Type every session; returns (characters, key pinches, suggestion pinches)"""
+    keys = {button.text if button.slot is None else button.slot: button for button in keyboard.key_indexes["qwerty"].buttons}
+    characters = key_pinches = suggestion_pinches = 0
+    for session in sessions:
+        keyboard.text = ""
+        for word in session.split():
+            characters += len(word) + 1
+            for typed in range(len(word) + 1):
+                if use_suggestions and typed:
+                    suggestions = keyboard.current_suggestions()
+                    if word in suggestions and typed < len(word):
+                        keyboard.press(keys[suggestions.index(word)])
+                        suggestion_pinches += 1
+                        break
+                if typed == len(word):
+                    keyboard.press(keys["SPACE"])
+                else:
+                    keyboard.press(keys[word[typed].upper()])
+                key_pinches += 1
+        assert keyboard.text == session + " ", (keyboard.text, session)
+    return characters, key_pinches, suggestion_pinches
+
+
+def suggest_latency_us(predictor, sessions):
+    prefixes = [word[:i] for session in sessions for word in session.split() for i in range(1, len(word) + 1)]
+    timings = []
+    for prefix in prefixes:
+        start = time.perf_counter()
+        predictor.suggest(prefix)
+        timings.append((time.perf_counter() - start) * 1e6)
+    return float(np.mean(timings)), float(np.percentile(timings, 99)), float(np.max(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=50, help="sampled sessions to replay")
+    parser.add_argument("--words", type=int, default=12, help="words per sampled session")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--transcript", help="text file to replay instead, one session per line")
+    parser.add_argument("--pinch-seconds", type=float, default=1.5, help="modelled time per pinch")
+    parser.add_argument("--choose-seconds", type=float, default=0.5, help="extra time to pick a suggestion")
+    args = parser.parse_args()
+
+    sessions = transcript_sessions(args.transcript) if args.transcript else sampled_sessions(args.sessions, args.words, args.seed)
+
+    start = time.perf_counter()
+    predictor = WordPredictor(history_path=None)
+    build_ms = (time.perf_counter() - start) * 1e3
+
+    print(f"{len(sessions)} sessions | trie: {len(predictor.scores)} words built in {build_ms:.1f} ms")
+    print(f"{'pass':<26}{'pinches':>10}{'saved':>9}{'WPM':>8}")
+    baseline = None
+    # Typing by hand learns words too, so the letters-only pass gets its own predictor
+    passes = (
+        ("letters only (before)", WordPredictor(history_path=None), False),
+        ("suggestions (after)", predictor, True),
+        ("suggestions, learned", predictor, True),
+    )
+    for name, pass_predictor, use_suggestions in passes:
+        keyboard = VirtualKeyboard(FakeTracker(), show_window=False, predictor=pass_predictor)
+        keyboard.send_key = lambda key, hold=0: None  # Nothing is typed into a real app
+        characters, key_pinches, suggestion_pinches = replay(keyboard, sessions, use_suggestions)
+        pinches = key_pinches + suggestion_pinches
+        seconds = pinches * args.pinch_seconds + suggestion_pinches * args.choose_seconds
+        wpm = characters / 5 / (seconds / 60)
+        baseline = baseline or pinches
+        print(f"{name:<26}{pinches:>10}{1 - pinches / baseline:>9.1%}{wpm:>8.2f}")
+
+    mean, p99, worst = suggest_latency_us(predictor, sessions)
+    print(f"\nsuggest() per lookup: mean {mean:.2f} us | p99 {p99:.2f} us | max {worst:.2f} us (budget 1000 us/frame)")
+
+
+if __name__ == "__main__":
+    main()
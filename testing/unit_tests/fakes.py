@@ -0,0 +1,29 @@
+"""
+Fakes Module - Test doubles shared by the unit tests and benchmarks
+"""
+
+import os
+import sys
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.scheduler import Scheduler
+
+
+class FakeClock:
+    """Clock that only moves when a test sets .now"""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FakeTracker:
+    """Just the part of HandTracker the mode handlers use: its scheduler"""
+
+    def __init__(self):
+        self.scheduler = Scheduler()
@@ -0,0 +1,108 @@
+import unittest
+import os
+import sys
+import threading
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.actuator import Action, ActionDispatcher, RecordingDispatcher, emit
+from fakes import FakeClock
+
+
+class TestActionDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.clock = FakeClock()
+        self.dispatcher = ActionDispatcher(maxsize=3, clock=self.clock)
+
+    def tearDown(self):
+        self.dispatcher.stop(drain=False)
+
+    def record(self, value):
+        self.calls.append(value)
+
+    def test_actions_run_in_order_on_worker(self):
+        self.dispatcher.start()
+        for i in range(3):
+            self.dispatcher.submit(Action("key", self.record, (i,)))
+        self.assertTrue(self.dispatcher.wait_idle(timeout=1.0))
+        self.assertEqual(self.calls, [0, 1, 2])
+        self.assertEqual(self.dispatcher.metrics()["executed"], 3)
+
+    def test_pending_action_with_same_key_is_coalesced(self):
+        self.dispatcher.submit(Action("move", self.record, ("first",), coalesce_key="mouse_move"))
+        self.dispatcher.submit(Action("click", self.record, ("click",)))
+        self.dispatcher.submit(Action("move", self.record, ("second",), coalesce_key="mouse_move"))
+        self.assertEqual(self.dispatcher.depth(), 2)
+
+        self.dispatcher.start()
+        self.dispatcher.wait_idle(timeout=1.0)
+        # The newer move keeps the queue position of the one it replaced
+        self.assertEqual(self.calls, ["second", "click"])
+        self.assertEqual(self.dispatcher.metrics()["coalesced"], 1)
+
+    def test_full_queue_evicts_oldest(self):
+        for i in range(5):
+            self.dispatcher.submit(Action("key", self.record, (i,)))
+        metrics = self.dispatcher.metrics()
+        self.assertEqual(metrics["depth"], 3)
+        self.assertEqual(metrics["max_depth"], 3)
+        self.assertEqual(metrics["dropped"], 2)
+
+        self.dispatcher.start()
+        self.dispatcher.wait_idle(timeout=1.0)
+        self.assertEqual(self.calls, [2, 3, 4])
+
+    def test_stale_actions_expire(self):
+        self.dispatcher.submit(Action("stale", self.record, ("stale",), timeout=0.1))
+        self.dispatcher.submit(Action("fresh", self.record, ("fresh",)))
+        self.clock.now = 1.0
+        self.dispatcher.start()
+        self.dispatcher.wait_idle(timeout=1.0)
+        self.assertEqual(self.calls, ["fresh"])
+        self.assertEqual(self.dispatcher.metrics()["expired"], 1)
+
+    def test_failing_action_does_not_stop_worker(self):
+        def boom():
+            raise RuntimeError("boom")
+
+        self.dispatcher.start()
+        self.dispatcher.submit(Action("boom", boom))
+        self.dispatcher.submit(Action("key", self.record, ("after",)))
+        self.dispatcher.wait_idle(timeout=1.0)
+        self.assertEqual(self.calls, ["after"])
+        self.assertEqual(self.dispatcher.metrics()["failed"], 1)
+
+    def test_submit_does_not_block_on_slow_action(self):
+        release = threading.Event()
+        self.dispatcher.start()
+        self.dispatcher.submit(Action("slow", release.wait, (1.0,)))
+        self.dispatcher.submit(Action("key", self.record, ("queued",)))
+        self.assertEqual(self.calls, [])
+        release.set()
+        self.dispatcher.wait_idle(timeout=1.0)
+        self.assertEqual(self.calls, ["queued"])
+
+    def test_emit_without_dispatcher_runs_inline(self):
+        emit(None, Action("key", self.record, ("inline",)))
+        self.assertEqual(self.calls, ["inline"])
+
+
+class TestRecordingDispatcher(unittest.TestCase):
+    def test_records_without_running(self):
+        clock = FakeClock()
+        dispatcher = RecordingDispatcher(clock)
+        calls = []
+        emit(dispatcher, Action("tab_nav", calls.append, ([0, 0, 0, 0, 1],)))
+        clock.now = 2.5
+        emit(dispatcher, Action("tab_nav", calls.append, ([1, 0, 0, 0, 0],)))
+        emit(dispatcher, Action("media_key", calls.append, ("playpause",)))
+        self.assertEqual(calls, [])
+        self.assertEqual(dispatcher.actions[1], (2.5, "tab_nav", ([1, 0, 0, 0, 0],)))
+        self.assertEqual(dispatcher.counts(), {"tab_nav": 2, "media_key": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
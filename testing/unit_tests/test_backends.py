@@ -0,0 +1,64 @@
+import unittest
+import os
+import sys
+import tempfile
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.backends import LazyModule, OSBackends, StubBackends
+from modules.focus_service import FakeWindowSystem
+from modules.mouse_control import MouseControl
+from modules.virtual_keyboard import VirtualKeyboard
+from fakes import FakeTracker
+
+
+class TestLazyModule(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        sys.path.insert(0, self.tmp.name)
+        with open(os.path.join(self.tmp.name, "lazy_backend_a.py"), "w") as file:
+            file.write("def size():\n    return (800, 600)\n")
+
+    def tearDown(self):
+        sys.path.remove(self.tmp.name)
+        sys.modules.pop("lazy_backend_a", None)
+        self.tmp.cleanup()
+
+    def test_imports_on_first_attribute_use(self):
+        module = LazyModule("lazy_backend_a")
+        self.assertNotIn("lazy_backend_a", sys.modules)
+        self.assertEqual(module.size(), (800, 600))
+        self.assertIn("lazy_backend_a", sys.modules)
+
+    def test_missing_backend_is_unavailable(self):
+        backends = OSBackends()
+        backends.keyboard = LazyModule("backend_that_does_not_exist")
+        self.assertFalse(backends.available("keyboard"))
+        backends.keyboard = LazyModule("lazy_backend_a")
+        self.assertTrue(backends.available("keyboard"))
+
+
+class TestStubBackends(unittest.TestCase):
+    def test_calls_are_no_ops(self):
+        backends = StubBackends(screen_size=(1280, 720))
+        self.assertEqual(backends.pyautogui.size(), (1280, 720))
+        backends.keyboard.send("ctrl+w")
+        self.assertEqual(list(backends.pygetwindow.getAllTitles()), [])
+        self.assertFalse(backends.pygetwindow.getWindowsWithTitle("Chrome").isMinimized)
+        self.assertIsInstance(backends.window_system(), FakeWindowSystem)
+
+    def test_handlers_run_on_stubs(self):
+        backends = StubBackends(screen_size=(1280, 720))
+        mouse = MouseControl(FakeTracker(), backends=backends)
+        self.assertEqual((mouse.screen_width, mouse.screen_height), (1280, 720))
+        # No dispatcher: the key is typed inline, into the stub pynput Controller
+        keyboard = VirtualKeyboard(FakeTracker(), show_window=False, backends=backends)
+        keyboard.send_key("a")
+        keyboard.send_key(keyboard.special_keys.backspace)
+        self.assertIsInstance(keyboard.focus.backend, FakeWindowSystem)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+import os
+import sys
+import threading
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.capture import FrameCapture, IterableSource
+
+
+class GatedSource:
+    """Synthetic camera that only delivers a frame when the test releases one"""
+
+    def __init__(self, count):
+        self.count = count
+        self.sent = 0
+        self.gate = threading.Semaphore(0)
+        self.released = False
+
+    def read(self):
+        if self.sent >= self.count:
+            return False, None
+        self.gate.acquire()
+        self.sent += 1
+        return True, f"frame-{self.sent}"
+
+    def release(self):
+        self.released = True
+
+
+class TestFrameCapture(unittest.TestCase):
+    def test_reads_frames_from_synthetic_generator_in_order(self):
+        capture = FrameCapture(IterableSource(f"frame-{i}" for i in range(1, 4)))
+        capture.start()
+        seen = []
+        while True:
+            captured = capture.read(timeout=1.0)
+            if captured is None:
+                break
+            seen.append(captured.seq)
+        capture.stop()
+        self.assertTrue(capture.ended)
+        self.assertEqual(seen, sorted(seen))
+        self.assertEqual(seen[-1], 3)
+        self.assertEqual(capture.frames_consumed + capture.frames_dropped, 3)
+
+    def test_slow_consumer_gets_newest_frame_and_drops_are_counted(self):
+        source = GatedSource(5)
+        capture = FrameCapture(source)
+        capture.start()
+        for _ in range(3):
+            source.gate.release()
+        # Wait until the capture thread has read all three frames
+        while capture.frames_captured < 3:
+            threading.Event().wait(0.001)
+
+        captured = capture.read(timeout=1.0)
+        self.assertEqual(captured.frame, "frame-3")
+        self.assertEqual(captured.seq, 3)
+        self.assertEqual(capture.frames_dropped, 2)
+        self.assertIsNone(capture.read(timeout=0.05))  # nothing newer yet
+
+        source.gate.release()
+        self.assertEqual(capture.read(timeout=1.0).seq, 4)
+        source.gate.release()  # let the last read() return so stop() can join
+        capture.stop()
+        self.assertTrue(source.released)
+
+    def test_timestamps_come_from_injected_clock(self):
+        ticks = iter([10.0, 20.0])
+        capture = FrameCapture(IterableSource(["a", "b"]), clock=lambda: next(ticks))
+        capture.start()
+        stamps = []
+        while True:
+            captured = capture.read(timeout=1.0)
+            if captured is None:
+                break
+            stamps.append(captured.timestamp)
+        capture.stop()
+        self.assertTrue(set(stamps) <= {10.0, 20.0})
+        self.assertIn(20.0, stamps)
+
+    def test_stop_wakes_blocked_reader(self):
+        source = GatedSource(1)
+        capture = FrameCapture(source)
+        capture.start()
+
+        def halt():
+            # Unblock the source shortly after stop() so the capture thread can exit
+            threading.Timer(0.01, source.gate.release).start()
+            capture.stop(release=False)
+
+        threading.Timer(0.05, halt).start()
+        self.assertIsNone(capture.read(timeout=2.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
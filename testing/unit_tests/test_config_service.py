@@ -0,0 +1,119 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.config_service import CONFIG_PATH, ConfigService, app_name_from_command
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestConfigService(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "user_defined_data.json")
+        self.mtime = time.time() - 100
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, controls=None, raw=None):
+        with open(self.path, "w") as file:
+            file.write(raw if raw is not None else json.dumps({"_id": "machine-1", "userDefinedControls": controls}))
+        # Step the mtime explicitly so back-to-back writes are never within the filesystem's timestamp granularity
+        self.mtime += 1
+        os.utime(self.path, (self.mtime, self.mtime))
+
+    def test_default_path_is_absolute(self):
+        self.assertTrue(os.path.isabs(CONFIG_PATH))
+        self.assertEqual(os.path.basename(CONFIG_PATH), "user_defined_data.json")
+
+    def test_no_path_is_a_fixed_empty_config(self):
+        service = ConfigService(None)
+        self.assertFalse(service.check())
+        self.assertEqual(dict(service.snapshot.controls), {})
+        self.assertIsNone(service.snapshot.keyboard_target_app)
+
+    def test_snapshot_is_parsed_once_and_immutable(self):
+        self.write({"index": ["notepad.exe", "null"], "thumb": "null"})
+        service = ConfigService(self.path)
+        self.assertTrue(service.check())
+        snapshot = service.snapshot
+        self.assertEqual(snapshot.version, 1)
+        self.assertEqual(snapshot.apps_for("index"), ("notepad.exe",))
+        self.assertEqual(snapshot.apps_for("thumb"), ())
+        with self.assertRaises(TypeError):
+            snapshot.controls["index"] = ["calc.exe"]
+        self.assertFalse(service.check())  # Unchanged file: one stat, no parse
+        self.assertIs(service.snapshot, snapshot)
+
+    def test_change_swaps_snapshot_and_notifies(self):
+        self.write({"index, middle, ring and little": ["C:\\Tools\\Notepad++.exe"]})
+        service = ConfigService(self.path)
+        service.check()
+        changes = []
+        unsubscribe = service.subscribe(lambda old, new: changes.append((old.keyboard_target_app, new.keyboard_target_app)))
+        self.write({"index, middle, ring and little": ["code.exe"]})
+        self.assertTrue(service.check())
+        self.assertEqual(changes, [("Notepad++", "code")])
+        self.assertEqual(service.snapshot.version, 2)
+        unsubscribe()
+        self.write({"index, middle, ring and little": "null"})
+        service.check()
+        self.assertEqual(len(changes), 1)
+        self.assertIsNone(service.snapshot.keyboard_target_app)
+
+    def test_touched_but_identical_file_does_not_notify(self):
+        self.write({"index": ["notepad.exe"]})
+        service = ConfigService(self.path)
+        service.check()
+        changes = []
+        service.subscribe(lambda old, new: changes.append(new))
+        self.write({"index": ["notepad.exe"]})
+        self.assertFalse(service.check())
+        self.assertEqual(changes, [])
+
+    def test_unparsable_file_keeps_previous_snapshot(self):
+        self.write({"index": ["notepad.exe"]})
+        service = ConfigService(self.path)
+        service.check()
+        self.write(raw='{"userDefinedControls": {"index": [')
+        self.assertFalse(service.check())
+        self.assertEqual(service.snapshot.apps_for("index"), ("notepad.exe",))
+        self.write({"index": ["calc.exe"]})
+        self.assertTrue(service.check())
+        self.assertEqual(service.snapshot.apps_for("index"), ("calc.exe",))
+
+    def test_missing_file_gives_empty_snapshot(self):
+        service = ConfigService(self.path)
+        self.assertFalse(service.check())
+        self.assertEqual(dict(service.snapshot.controls), {})
+
+    def test_watcher_thread_picks_up_changes(self):
+        self.write({"index": ["notepad.exe"]})
+        service = ConfigService(self.path, poll_interval=0.01).start()
+        try:
+            self.write({"index": ["calc.exe"]})
+            self.assertTrue(wait_for(lambda: service.snapshot.apps_for("index") == ("calc.exe",)))
+        finally:
+            service.stop()
+
+    def test_app_name_from_command(self):
+        self.assertEqual(app_name_from_command("notepad.exe"), "notepad")
+        self.assertEqual(app_name_from_command("C:\\Program Files\\App\\App.EXE"), "App")
+        self.assertEqual(app_name_from_command("/usr/bin/gedit"), "gedit")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.config_store import ERROR, PENDING, SYNCED, ConfigStore, default_document
+
+try:
+    import mongomock
+except ImportError:
+    mongomock = None
+
+
+class FlakyCollection:
+    """Wraps a collection and fails the first `failures` calls like an unreachable cluster"""
+
+    def __init__(self, collection, failures):
+        self.collection = collection
+        self.failures = failures
+        self.calls = []
+
+    def _call(self, name, *args):
+        self.calls.append(name)
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError("server selection timed out")
+        return getattr(self.collection, name)(*args)
+
+    def find_one(self, *args):
+        return self._call("find_one", *args)
+
+    def insert_one(self, *args):
+        return self._call("insert_one", *args)
+
+    def update_one(self, *args, **kwargs):
+        self.calls.append("update_one")
+        return self.collection.update_one(*args, **kwargs)
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+@unittest.skipIf(mongomock is None, "mongomock not installed")
+class TestConfigStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "user_defined_data.json")
+        self.collection = mongomock.MongoClient()["hci"]["user-config"]
+        self.stores = []
+
+    def tearDown(self):
+        for store in self.stores:
+            store.stop(flush=False)
+        self.tmp.cleanup()
+
+    def make_store(self, collection=None, **kwargs):
+        kwargs.setdefault("debounce", 0.05)
+        kwargs.setdefault("retry_initial", 0.01)
+        store = ConfigStore(self.path, "machine-1", name="kiosk", collection_factory=lambda: collection or self.collection, **kwargs)
+        self.stores.append(store)
+        return store
+
+    def remote(self):
+        return self.collection.find_one({"_id": "machine-1"})
+
+    def test_loads_local_file_without_contacting_mongo(self):
+        document = default_document("machine-1", "kiosk")
+        document["userDefinedControls"]["thumb"] = ["discord.exe"]
+        with open(self.path, "w") as file:
+            json.dump(document, file)
+        store = ConfigStore(self.path, "machine-1", collection_factory=lambda: self.fail("must not connect"))
+        self.assertEqual(store.load()["userDefinedControls"]["thumb"], ["discord.exe"])
+
+    def test_missing_file_gets_defaults(self):
+        store = ConfigStore(self.path, "machine-1", name="kiosk")
+        self.assertEqual(store.load(), default_document("machine-1", "kiosk"))
+        with open(self.path) as file:
+            self.assertEqual(json.load(file)["_id"], "machine-1")
+
+    def test_foreign_file_keeps_gestures_and_is_backed_up(self):
+        foreign = default_document("088fc35cc6c7-Rohan", "Rohan")
+        foreign["userDefinedControls"]["thumb"] = ["discord.exe"]
+        with open(self.path, "w") as file:
+            json.dump(foreign, file)
+        store = ConfigStore(self.path, "machine-1", name="kiosk")
+        document = store.load()
+        self.assertEqual((document["_id"], document["name"]), ("machine-1", "kiosk"))
+        self.assertEqual(document["userDefinedControls"]["thumb"], ["discord.exe"])
+        with open(self.path) as file:
+            self.assertEqual(json.load(file), document)
+        with open(f"{self.path}.088fc35cc6c7-Rohan.bak") as file:
+            self.assertEqual(json.load(file), foreign)
+
+    def test_first_sync_creates_remote_document(self):
+        store = self.make_store()
+        store.load()
+        store.start()
+        self.assertTrue(wait_for(lambda: store.status == SYNCED))
+        self.assertEqual(self.remote()["name"], "kiosk")
+
+    def test_remote_config_wins_when_nothing_was_edited_locally(self):
+        remote = default_document("machine-1", "kiosk")
+        remote["userDefinedControls"]["index"] = ["mspaint.exe"]
+        self.collection.insert_one(remote)
+        changes = []
+        store = self.make_store(on_remote_change=changes.append)
+        store.load()
+        store.start()
+        self.assertTrue(wait_for(lambda: store.remote_revision == 1))
+        self.assertEqual(store.controls["index"], ["mspaint.exe"])
+        self.assertEqual(changes[0]["userDefinedControls"]["index"], ["mspaint.exe"])
+        with open(self.path) as file:
+            self.assertEqual(json.load(file)["userDefinedControls"]["index"], ["mspaint.exe"])
+
+    def test_edits_are_debounced_into_one_delta(self):
+        self.collection.insert_one(default_document("machine-1", "kiosk"))
+        store = self.make_store(debounce=0.2)
+        store.load()
+        store.start()
+        self.assertTrue(wait_for(lambda: store.status == SYNCED))
+        store.update_controls({"index": ["a.exe"]})
+        store.update_controls({"index": ["b.exe"], "thumb": ["c.exe"]})
+        self.assertEqual(store.status, PENDING)
+        with open(self.path) as file:
+            self.assertEqual(json.load(file)["userDefinedControls"]["index"], ["b.exe"])  # Local file is written at once
+        self.assertTrue(wait_for(lambda: store.status == SYNCED and store.pushes == 1))
+        controls = self.remote()["userDefinedControls"]
+        self.assertEqual((controls["index"], controls["thumb"], controls["index and middle"]), (["b.exe"], ["c.exe"], "null"))
+
+    def test_offline_edits_survive_failures_and_win_at_reconcile(self):
+        remote = default_document("machine-1", "kiosk")
+        remote["userDefinedControls"]["thumb"] = ["remote.exe"]
+        remote["userDefinedControls"]["index"] = ["remote.exe"]
+        self.collection.insert_one(remote)
+        flaky = FlakyCollection(self.collection, failures=3)
+        store = self.make_store(collection=flaky)
+        store.load()
+        store.update_controls({"thumb": ["local.exe"]})  # Edited before the cluster was reachable
+        store.start()
+        self.assertTrue(wait_for(lambda: store.status == SYNCED))
+        self.assertEqual(store.failures, 3)
+        self.assertIsNone(store.last_error)
+        self.assertEqual(self.remote()["userDefinedControls"]["thumb"], ["local.exe"])
+        self.assertEqual(store.controls["index"], ["remote.exe"])  # Untouched gestures come from the cloud
+
+    def test_offline_edits_survive_a_restart(self):
+        remote = default_document("machine-1", "kiosk")
+        remote["userDefinedControls"]["thumb"] = ["remote.exe"]
+        remote["userDefinedControls"]["index"] = ["remote.exe"]
+        self.collection.insert_one(remote)
+
+        def unreachable():
+            raise ConnectionError("no route to host")
+
+        offline = ConfigStore(self.path, "machine-1", name="kiosk", collection_factory=unreachable)
+        offline.load()
+        offline.update_controls({"thumb": ["local.exe"]})  # Saved, then the app is closed before any sync
+
+        store = self.make_store()
+        self.assertEqual(store.load()["userDefinedControls"]["thumb"], ["local.exe"])
+        self.assertEqual(store.status, PENDING)
+        store.start()
+        self.assertTrue(wait_for(lambda: store.status == SYNCED))
+        self.assertEqual(self.remote()["userDefinedControls"]["thumb"], ["local.exe"])
+        self.assertEqual(store.controls["thumb"], ["local.exe"])
+        self.assertEqual(store.controls["index"], ["remote.exe"])  # Untouched gestures come from the cloud
+        with open(self.path) as file:
+            saved = json.load(file)
+        self.assertEqual(saved["userDefinedControls"]["thumb"], ["local.exe"])
+        self.assertNotIn("_unsynced", saved)
+        self.assertNotIn("_unsynced", self.remote())
+
+    def test_stop_flushes_pending_edits(self):
+        self.collection.insert_one(default_document("machine-1", "kiosk"))
+        store = self.make_store(debounce=60.0)
+        store.load()
+        store.start()
+        self.assertTrue(wait_for(lambda: store.status == SYNCED))
+        store.update_controls({"index": ["notepad.exe"]})
+        store.stop()
+        self.assertEqual(self.remote()["userDefinedControls"]["index"], ["notepad.exe"])
+
+    def test_unreachable_cluster_keeps_working_locally(self):
+        def unreachable():
+            raise ConnectionError("no route to host")
+
+        store = ConfigStore(self.path, "machine-1", collection_factory=unreachable, retry_initial=0.01, retry_max=0.02)
+        self.stores.append(store)
+        store.load()
+        store.start()
+        store.update_controls({"index": ["notepad.exe"]})
+        self.assertTrue(wait_for(lambda: store.failures >= 3))
+        self.assertEqual(store.status, ERROR)
+        self.assertEqual(store.controls["index"], ["notepad.exe"])
+        self.assertEqual(store.stats()["pending"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
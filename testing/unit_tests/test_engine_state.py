@@ -0,0 +1,79 @@
+import unittest
+import os
+import sys
+import threading
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.engine_state import EngineState, StatePublisher
+
+
+class TestStatePublisher(unittest.TestCase):
+    def setUp(self):
+        self.publisher = StatePublisher(clock=lambda: 12.5)
+
+    def test_initial_state(self):
+        state = self.publisher.latest
+        self.assertEqual((state.version, state.mode, state.action), (0, "Standby", "Waiting for gesture..."))
+
+    def test_state_is_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.publisher.latest.mode = "Mouse Control"
+
+    def test_version_only_changes_with_content(self):
+        first = self.publisher.publish(mode="Mouse Control", action="Move", hands_detected=True)
+        self.assertEqual(first.version, 1)
+        self.assertIsNone(self.publisher.publish(mode="Mouse Control", action="Move", hands_detected=True))
+        second = self.publisher.publish(action="Left click")
+        self.assertEqual((second.version, second.mode, second.action), (2, "Mouse Control", "Left click"))
+        self.assertTrue(second.hands_detected)  # Fields not passed are carried over
+        self.assertEqual(first.action, "Move")  # Old versions stay as they were
+        self.assertEqual(second.timestamp, 12.5)
+
+    def test_changed_since(self):
+        self.assertIs(self.publisher.changed_since(None), self.publisher.latest)
+        state = self.publisher.publish(mode="App Control")
+        self.assertIs(self.publisher.changed_since(0), state)
+        self.assertIsNone(self.publisher.changed_since(state.version))
+
+    def test_subscribers_get_each_new_version(self):
+        seen = []
+        unsubscribe = self.publisher.subscribe(lambda state: seen.append(state.version))
+        self.publisher.subscribe(lambda state: 1 / 0)  # A failing subscriber doesn't stop the others
+        self.publisher.publish(mode="A")
+        self.publisher.publish(mode="A")
+        self.publisher.publish(mode="B")
+        unsubscribe()
+        self.publisher.publish(mode="C")
+        self.assertEqual(seen, [1, 2])
+
+    def test_reader_thread_never_sees_a_torn_state(self):
+        # Writer keeps mode and action in lockstep; a reader must never see a mismatched pair
+        stop = threading.Event()
+        torn = []
+
+        def reader():
+            while not stop.is_set():
+                state = self.publisher.latest
+                if state.version and state.mode[1:] != state.action[1:]:
+                    torn.append(state)
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        for i in range(20000):
+            self.publisher.publish(mode=f"m{i}", action=f"a{i}")
+        stop.set()
+        thread.join()
+        self.assertEqual(torn, [])
+        self.assertEqual(self.publisher.version, 20000)
+
+    def test_as_dict(self):
+        state = EngineState(3, mode="Game Control", idle=True)
+        self.assertEqual(state.as_dict()["version"], 3)
+        self.assertTrue(state.as_dict()["idle"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import os
+import sys
+import threading
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.focus_service import FakeWindowSystem, FocusService
+from fakes import FakeClock
+
+
+class TestFocusService(unittest.TestCase):
+    def setUp(self):
+        self.desktop = FakeWindowSystem()
+        for pid in range(100, 160):
+            self.desktop.start_process(pid, f"service{pid}.exe", [f"Window {pid}"])
+        self.notepad = self.desktop.start_process(42, "notepad.exe", ["Untitled - Notepad"])[0]
+        self.clock = FakeClock()
+        self.focus = FocusService("notepad", backend=self.desktop, clock=self.clock)
+
+    def test_focus_scans_once_then_uses_the_cache(self):
+        for _ in range(20):
+            self.assertTrue(self.focus.focus_target())
+        self.assertEqual(self.desktop.foreground(), self.notepad)
+        self.assertEqual((self.desktop.process_scans, self.desktop.window_scans), (1, 1))
+        self.assertEqual(self.desktop.focus_calls, 1)  # Already in front afterwards
+
+    def test_rebuilds_when_the_window_goes_away(self):
+        self.focus.focus_target()
+        self.desktop.kill_process(42)
+        new_window = self.desktop.start_process(43, "notepad.exe", ["Restarted - Notepad"])[0]
+        self.assertTrue(self.focus.focus_target())
+        self.assertEqual(self.desktop.foreground(), new_window)
+        self.assertEqual(self.focus.rebuilds, 2)
+
+    def test_reused_handle_of_another_process_is_not_trusted(self):
+        self.focus.focus_target()
+        self.desktop.window_table[self.notepad][0] = 150  # Same handle, now owned by another process
+        self.desktop.processes.pop(42)
+        self.assertFalse(self.focus.focus_target())
+
+    def test_missing_app_is_rescanned_at_most_every_retry_interval(self):
+        focus = FocusService("calc", backend=self.desktop, retry_interval=0.5, clock=self.clock)
+        for _ in range(10):
+            self.assertFalse(focus.focus_target())
+        self.assertEqual(focus.rebuilds, 1)
+        self.clock.now += 0.6
+        window = self.desktop.start_process(77, "calc.exe", ["Calculator"])[0]
+        self.assertTrue(focus.focus_target())
+        self.assertEqual(self.desktop.foreground(), window)
+
+    def test_set_target_drops_the_cache(self):
+        self.focus.focus_target()
+        code = self.desktop.start_process(55, "Code.exe", ["main.py - Visual Studio Code"])[0]
+        self.focus.set_target("code")
+        self.assertTrue(self.focus.focus_target())
+        self.assertEqual(self.desktop.foreground(), code)
+
+    def test_keyboard_window_resolved_once_and_focus_handed_back(self):
+        keyboard = self.desktop.open_window(1, "Virtual Keyboard")
+        self.focus.focus_target()
+        self.desktop.set_foreground(keyboard)  # The keyboard window stole focus
+        for _ in range(30):
+            self.focus.restore_focus("Virtual Keyboard")
+        self.assertEqual(self.desktop.foreground(), self.notepad)
+        self.assertEqual(self.desktop.find_window_calls, 1)
+        self.assertEqual(self.desktop.window_scans, 1)
+
+    def test_target_is_published_as_one_pair(self):
+        # The actuator worker rebuilds while the vision thread reads the target every frame
+        code = self.desktop.start_process(55, "Code.exe", ["main.py - Visual Studio Code"])[0]
+        valid = {None, (42, self.notepad), (55, code)}
+        seen = set()
+        done = threading.Event()
+
+        def read():
+            while not done.is_set():
+                seen.add(self.focus._target)
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        for i in range(2000):
+            self.focus.set_target("code" if i % 2 else "notepad")
+            self.focus.rebuild()
+        done.set()
+        reader.join()
+        self.assertLessEqual(seen, valid)
+        self.assertEqual((self.focus.pid, self.focus.hwnd), (55, code))
+
+    def test_disabled_without_target(self):
+        self.assertFalse(FocusService(None, backend=self.desktop).focus_target())
+        self.assertEqual(self.desktop.process_scans, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+try:
+    from PIL import Image
+    from modules.frame_cache import GifFrameCache
+except ImportError:
+    Image = None
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+@unittest.skipIf(Image is None, "Pillow not installed")
+class TestGifFrameCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_gif(self, name, frames=10, size=(40, 30)):
+        path = os.path.join(self.tmp.name, name)
+        images = [Image.new("RGB", size, (i * 20 % 256, 0, 0)) for i in range(frames)]
+        images[0].save(path, save_all=True, append_images=images[1:], duration=40, loop=0)
+        return path
+
+    def test_first_frame_now_rest_in_background(self):
+        path = self.make_gif("a.gif", frames=30)
+        cache = GifFrameCache()
+        entry = cache.get(path)
+        self.assertGreaterEqual(len(entry.frames), 1)
+        self.assertTrue(wait_for(lambda: entry.done))
+        self.assertEqual(len(entry.frames), 30)
+        self.assertEqual(entry.durations[0], 40)
+        self.assertEqual(entry.frames[3].getpixel((0, 0)), (60, 0, 0, 255))
+
+    def test_repeat_get_is_a_cache_hit(self):
+        path = self.make_gif("a.gif")
+        cache = GifFrameCache(background=False)
+        first = cache.get(path)
+        self.assertIs(cache.get(path), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_preload_decodes_without_get(self):
+        paths = [self.make_gif(f"{i}.gif") for i in range(3)]
+        cache = GifFrameCache()
+        cache.preload(paths)
+        self.assertTrue(wait_for(lambda: cache.stats()["queued"] == 0 and all(cache.get(p).done for p in paths)))
+        self.assertEqual(cache.misses, 0)
+
+    def test_least_recently_used_entries_are_evicted_over_the_cap(self):
+        frame_bytes = 40 * 30 * 4
+        cache = GifFrameCache(max_bytes=frame_bytes * 25, background=False)
+        a, b, c = (self.make_gif(name) for name in ("a.gif", "b.gif", "c.gif"))
+        cache.get(a)
+        cache.get(b)
+        cache.get(a)  # b is now the least recently used
+        cache.get(c)
+        stats = cache.stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertLessEqual(stats["bytes"], stats["max_bytes"])
+        cache.get(b)
+        self.assertEqual(cache.misses, 4)  # b had to be decoded again
+
+    def test_unreadable_file_is_marked_done(self):
+        path = os.path.join(self.tmp.name, "broken.gif")
+        with open(path, "wb") as file:
+            file.write(b"not a gif")
+        entry = GifFrameCache().get(path)
+        self.assertTrue(entry.done)
+        self.assertEqual(entry.frames, [])
+        self.assertIsNotNone(entry.error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import os
+import sys
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.gesture_tables import (
+    GESTURE_MASKS,
+    GESTURE_NAMES,
+    MODE_BY_MASK,
+    MODE_SPECS,
+    NUM_MASKS,
+    finger_mask,
+    mask_to_fingers,
+)
+
+
+class TestFingerMask(unittest.TestCase):
+    def test_mask_reads_like_the_finger_list(self):
+        self.assertEqual(finger_mask([0, 1, 1, 0, 0]), 0b01100)
+        self.assertEqual(finger_mask([1, 0, 0, 0, 0]), 0b10000)
+        self.assertEqual(finger_mask([0, 0, 0, 0, 0]), 0)
+        self.assertEqual(finger_mask([1, 1, 1, 1, 1]), 31)
+
+    def test_round_trip(self):
+        for mask in range(NUM_MASKS):
+            self.assertEqual(finger_mask(mask_to_fingers(mask)), mask)
+
+
+class TestGestureTables(unittest.TestCase):
+    def test_left_hand_gesture_names(self):
+        self.assertEqual(GESTURE_NAMES[finger_mask([0, 0, 0, 0, 1])], "thumb")
+        self.assertEqual(GESTURE_NAMES[finger_mask([1, 0, 0, 1, 0])], "index and little")
+        self.assertEqual(GESTURE_NAMES[finger_mask([1, 1, 1, 1, 1])], "all")
+        self.assertIsNone(GESTURE_NAMES[finger_mask([0, 1, 0, 1, 0])])
+
+    def test_every_mode_is_reachable_by_mask(self):
+        for spec in MODE_SPECS:
+            self.assertEqual(spec.mask, GESTURE_MASKS[spec.gesture])
+            self.assertIs(MODE_BY_MASK[spec.mask], spec)
+        self.assertIs(MODE_BY_MASK[finger_mask([0, 0, 0, 0, 1])].gesture, "thumb")
+        # Gestures without a mode map to None
+        self.assertIsNone(MODE_BY_MASK[GESTURE_MASKS["little"]])
+
+    def test_action_labels_fall_back_to_default(self):
+        spec = MODE_BY_MASK[GESTURE_MASKS["index and middle"]]
+        self.assertEqual(len(spec.action_labels), NUM_MASKS)
+        self.assertEqual(spec.action_labels[finger_mask([0, 0, 0, 1, 1])], "New Tab")
+        self.assertEqual(spec.action_labels[finger_mask([0, 0, 1, 0, 0])], spec.default_action)
+        self.assertTrue(spec.needs_cooldown)
+
+    def test_invoke_calls_the_mode_handler(self):
+        calls = []
+
+        class Handler:
+            def control_mouse(self, fingers, observation):
+                calls.append(("mouse", fingers, observation))
+
+            def process(self, frame, observation):
+                return "annotated " + frame
+
+        MODE_BY_MASK[GESTURE_MASKS["index, middle and ring"]].invoke(Handler(), [0, 1, 1, 0, 0], "frame", "obs")
+        self.assertEqual(calls, [("mouse", [0, 1, 1, 0, 0], "obs")])
+        keyboard = MODE_BY_MASK[GESTURE_MASKS["index, middle, ring and little"]]
+        self.assertTrue(keyboard.returns_frame)
+        self.assertEqual(keyboard.invoke(Handler(), None, "frame", "obs"), "annotated frame")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+from types import SimpleNamespace
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.hand_features import (
+    classify_batch,
+    classify_hand,
+    finger_masks,
+    landmarks_to_array,
+    pinch_ratio,
+    pixel_distance,
+)
+
+
+def legacy_detect_raised_fingers(lst, hand_type):
+    """The protobuf attribute implementation HandTracker used before vectorization"""
+    thresh = (lst.landmark[0].y * 100 - lst.landmark[9].y * 100) / 2
+    finger_pairs = [(5, 8), (9, 12), (13, 16), (17, 20)]
+    raised_fingers = [
+        int((lst.landmark[finger_tip].y * 100 - lst.landmark[knuckle].y * 100) > thresh)
+        for finger_tip, knuckle in finger_pairs
+    ]
+    thumb_condition = (
+        (lst.landmark[4].x * 100 - lst.landmark[5].x * 100) > 6
+        if hand_type == "left"
+        else (lst.landmark[5].x * 100 - lst.landmark[4].x * 100) > 6
+    )
+    raised_fingers.insert(0, int(thumb_condition))
+    return raised_fingers[::-1] if hand_type == "left" else raised_fingers
+
+
+def as_landmark_list(points):
+    return SimpleNamespace(landmark=[SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in points])
+
+
+def open_right_hand():
+    """Upright right hand in image coordinates with every finger extended"""
+    points = np.zeros((21, 3), dtype=np.float32)
+    points[0] = (0.50, 0.90, 0)  # wrist
+    points[4] = (0.36, 0.60, 0)  # thumb tip, well left of the index knuckle
+    for knuckle, tip, x in ((5, 8, 0.45), (9, 12, 0.50), (13, 16, 0.55), (17, 20, 0.60)):
+        points[knuckle] = (x, 0.70, 0)
+        points[tip] = (x, 0.40, 0)
+    return points
+
+
+class TestHandFeatures(unittest.TestCase):
+    def test_landmarks_to_array(self):
+        points = open_right_hand()
+        converted = landmarks_to_array(as_landmark_list(points))
+        self.assertEqual(converted.shape, (21, 3))
+        self.assertEqual(converted.dtype, np.float32)
+        np.testing.assert_allclose(converted, points)
+
+    def test_open_hand(self):
+        points = open_right_hand()
+        self.assertEqual(classify_hand(points, "right"), [1, 1, 1, 1, 1])
+
+    def test_folded_finger_and_mirrored_left_order(self):
+        points = open_right_hand()
+        points[20, 1] = 0.75  # little finger tip below its knuckle
+        points[4, 0] = 0.46  # thumb tucked in
+        self.assertEqual(classify_hand(points, "right"), [0, 1, 1, 1, 0])
+
+        mirrored = points.copy()
+        mirrored[:, 0] = 1.0 - mirrored[:, 0]
+        mirrored[4, 0] = 0.70  # thumb extended away from the index knuckle on a left hand
+        self.assertEqual(classify_hand(mirrored, "left"), [0, 1, 1, 1, 1])
+
+    def test_invalid_hand_type(self):
+        with self.assertRaises(ValueError):
+            classify_hand(open_right_hand(), "up")
+
+    def test_matches_legacy_implementation_on_random_hands(self):
+        rng = np.random.default_rng(7)
+        hands = rng.random((200, 21, 3), dtype=np.float32)
+        is_left = rng.random(200) < 0.5
+        flags = classify_batch(hands, is_left)
+        for points, left, row in zip(hands, is_left, flags):
+            expected = legacy_detect_raised_fingers(as_landmark_list(points), "left" if left else "right")
+            self.assertEqual(row.tolist(), expected)
+
+    def test_finger_masks(self):
+        flags = np.array([[0, 1, 1, 0, 0], [1, 1, 1, 1, 1]], dtype=np.uint8)
+        self.assertEqual(finger_masks(flags).tolist(), [0b01100, 31])
+
+    def test_pinch_distances(self):
+        points = open_right_hand()
+        self.assertAlmostEqual(float(pixel_distance(points, 0, 9, 640, 480)), 0.2 * 480, places=3)
+        distances = pixel_distance(points, 4, [8, 12], 640, 480)
+        self.assertEqual(distances.shape, (2,))
+        ratio = pinch_ratio(points, 640, 480)
+        tip = np.hypot((0.45 - 0.36) * 640, (0.40 - 0.60) * 480)
+        self.assertAlmostEqual(ratio, tip ** 2 / (0.2 * 480) ** 2, places=4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+from contextlib import redirect_stderr
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from script.headless import DEFAULTS, load_config, main
+from test_replay import write_session
+
+
+class TestHeadless(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_config_file_then_overrides(self):
+        with open(self.path("kiosk.json"), "w") as file:
+            json.dump({"camera": 1, "metrics_port": 9000, "idle": {"idle_fps": 2}, "unknown": True}, file)
+        config = load_config(self.path("kiosk.json"), {"metrics_port": 9100, "duration": None})
+        self.assertEqual(config["camera"], 1)
+        self.assertEqual(config["metrics_port"], 9100)
+        self.assertEqual(config["idle"], {"idle_fps": 2})
+        self.assertIsNone(config["duration"])
+        self.assertNotIn("unknown", config)
+
+    def test_defaults(self):
+        self.assertEqual(load_config(), DEFAULTS)
+        self.assertFalse(DEFAULTS["crop_inference"])
+
+    def test_replay_source_with_duration_and_metrics_out(self):
+        index = [0, 1, 0, 0, 0]
+        write_session(self.path("session.gclm"), [(0.5, index, None), (1.0, index, [0, 0, 0, 0, 1]), (0.5, None, None)])
+        status = main(["--replay", self.path("session.gclm"), "--duration", "1.2", "--metrics-out", self.path("metrics.json")])
+        self.assertEqual(status, 0)
+        with open(self.path("metrics.json")) as file:
+            metrics = json.load(file)
+        self.assertEqual(metrics["replay"]["frames"], 13)  # 0.0 .. 1.2 s at 10 fps
+        self.assertEqual(metrics["actions_by_mode"], {"Window Control": 2})
+        self.assertEqual(metrics["idle"]["state"], "active")
+
+    def test_record_rejected_with_replay(self):
+        with open(os.devnull, "w") as devnull, redirect_stderr(devnull), self.assertRaises(SystemExit) as raised:
+            main(["--replay", self.path("session.gclm"), "--record", self.path("out.gclm")])
+        self.assertEqual(raised.exception.code, 2)
+
+    def test_invalid_config(self):
+        with open(self.path("bad.json"), "w") as file:
+            json.dump({"idle": {"idle_scale": 2}}, file)
+        self.assertEqual(main(["--config", self.path("bad.json"), "--replay", self.path("missing.gclm")]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
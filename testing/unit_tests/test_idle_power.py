@@ -0,0 +1,90 @@
+import unittest
+import os
+import sys
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.idle_power import ACTIVE, IDLE, IdlePolicy, IdlePowerManager
+from fakes import FakeClock
+
+
+class TestIdlePolicy(unittest.TestCase):
+    def test_from_dict_overrides_defaults(self):
+        policy = IdlePolicy.from_dict({"idle_after": "10", "idle_fps": 2, "unknown": 1})
+        self.assertEqual(policy.idle_after, 10.0)
+        self.assertEqual(policy.idle_fps, 2.0)
+        self.assertEqual(policy.idle_scale, IdlePolicy().idle_scale)
+        self.assertEqual(IdlePolicy.from_dict(None).to_dict(), IdlePolicy().to_dict())
+
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            IdlePolicy(idle_fps=0)
+        with self.assertRaises(ValueError):
+            IdlePolicy(idle_scale=1.5)
+
+
+class TestIdlePowerManager(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cpu = FakeClock()
+        policy = IdlePolicy(idle_after=5.0, idle_fps=4.0, idle_scale=0.5)
+        self.manager = IdlePowerManager(policy, clock=self.clock, cpu_clock=self.cpu)
+
+    def run_frames(self, seconds, hands_present, fps=30):
+        for _ in range(int(seconds * fps)):
+            self.clock.now += 1.0 / fps
+            self.manager.update(hands_present)
+
+    def test_goes_idle_after_timeout(self):
+        self.run_frames(4.9, hands_present=False)
+        self.assertEqual(self.manager.state, ACTIVE)
+        self.assertEqual(self.manager.inference_scale, 1.0)
+        self.run_frames(0.2, hands_present=False)
+        self.assertEqual(self.manager.state, IDLE)
+        self.assertEqual(self.manager.inference_scale, 0.5)
+
+    def test_probe_rate_while_idle(self):
+        self.run_frames(6, hands_present=False)
+        self.assertAlmostEqual(self.manager.probe_delay(), 0.25, places=6)
+        self.clock.now += 0.1
+        self.assertAlmostEqual(self.manager.probe_delay(), 0.15, places=6)
+        self.clock.now += 1.0
+        self.assertEqual(self.manager.probe_delay(), 0.0)
+
+    def test_wakes_on_first_detection(self):
+        self.run_frames(6, hands_present=False)
+        self.clock.now += 0.25
+        self.assertEqual(self.manager.update(True), ACTIVE)
+        self.assertEqual(self.manager.probe_delay(), 0.0)
+        self.assertEqual(self.manager.inference_scale, 1.0)
+        self.assertEqual(self.manager.wakeups, 1)
+
+    def test_disabled_policy_never_sleeps(self):
+        manager = IdlePowerManager(IdlePolicy(enabled=False), clock=self.clock, cpu_clock=self.cpu)
+        for _ in range(100):
+            self.clock.now += 1.0
+            manager.update(False)
+        self.assertEqual(manager.state, ACTIVE)
+
+    def test_stats_time_cpu_and_work_saved(self):
+        self.clock.now = 5.0
+        self.cpu.now = 1.0
+        self.manager.update(False)  # last active frame, goes idle
+        self.clock.now = 15.0
+        self.manager.skip(6)
+        self.manager.update(False)  # one idle probe at half resolution
+        self.cpu.now = 1.5
+        stats = self.manager.stats()
+        self.assertEqual(stats["state"], IDLE)
+        self.assertAlmostEqual(stats["time_in_state"][ACTIVE], 5.0)
+        self.assertAlmostEqual(stats["time_in_state"][IDLE], 10.0)
+        self.assertAlmostEqual(stats["cpu_utilization"][ACTIVE], 0.2)
+        self.assertAlmostEqual(stats["cpu_utilization"][IDLE], 0.05)
+        self.assertEqual(stats["frames_processed"], {ACTIVE: 1, IDLE: 1})
+        # one full frame + one quarter-cost frame, out of 8 frames at full rate
+        self.assertAlmostEqual(stats["inference_work_saved"], 1 - 1.25 / 8)
+
+if __name__ == "__main__":
+    unittest.main()
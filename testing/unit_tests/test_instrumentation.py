@@ -0,0 +1,85 @@
+import unittest
+import os
+import sys
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.instrumentation import NULL_TIMER, LatencyHistogram, PipelineMetrics
+from fakes import FakeClock
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_buckets_and_quantiles(self):
+        histogram = LatencyHistogram((1, 10, 100))
+        for ms in [0.5] * 50 + [5] * 45 + [50] * 4 + [500]:
+            histogram.observe(ms / 1000)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["bucket_counts"], [50, 45, 4, 1])
+        self.assertEqual(snapshot["count"], 100)
+        self.assertEqual(snapshot["p50_ms"], 1)
+        self.assertEqual(snapshot["p95_ms"], 10)
+        self.assertEqual(snapshot["p99_ms"], 100)
+        self.assertAlmostEqual(snapshot["max_ms"], 500)
+        self.assertAlmostEqual(histogram.quantile(1.0), 500)
+
+    def test_bucket_edges_are_inclusive(self):
+        histogram = LatencyHistogram((1, 10))
+        histogram.observe(0.001)
+        self.assertEqual(histogram.counts, [1, 0, 0])
+
+    def test_empty(self):
+        self.assertEqual(LatencyHistogram().snapshot()["p95_ms"], 0.0)
+
+
+class TestPipelineMetrics(unittest.TestCase):
+    def test_stage_timer_and_counters(self):
+        clock = FakeClock()
+        metrics = PipelineMetrics(clock=clock)
+        for _ in range(3):
+            with metrics.timer("hands_process"):
+                clock.now += 0.012
+        metrics.count("frames")
+        metrics.count("hands_detected", 2)
+        metrics.count_actions("Browser Control")
+        metrics.count_actions("Browser Control", 0)
+        snapshot = metrics.snapshot()
+        stage = snapshot["stages"]["hands_process"]
+        self.assertEqual(stage["count"], 3)
+        self.assertAlmostEqual(stage["mean_ms"], 12)
+        self.assertEqual(stage["p50_ms"], 16)
+        self.assertEqual(snapshot["counters"], {"frames": 1, "hands_detected": 2})
+        self.assertEqual(snapshot["actions_by_mode"], {"Browser Control": 1})
+
+    def test_timer_is_reused(self):
+        metrics = PipelineMetrics()
+        self.assertIs(metrics.timer("flip"), metrics.timer("flip"))
+
+    def test_disabled_records_nothing(self):
+        metrics = PipelineMetrics(enabled=False)
+        self.assertIs(metrics.timer("flip"), NULL_TIMER)
+        with metrics.timer("flip"):
+            pass
+        metrics.record("flip", 1.0)
+        metrics.count("frames")
+        metrics.count_actions("Mouse Control")
+        snapshot = metrics.snapshot()
+        self.assertEqual((snapshot["stages"], snapshot["counters"], snapshot["actions_by_mode"]), ({}, {}, {}))
+
+    def test_timer_records_when_stage_raises(self):
+        metrics = PipelineMetrics()
+        with self.assertRaises(RuntimeError):
+            with metrics.timer("actuator"):
+                raise RuntimeError("key press failed")
+        self.assertEqual(metrics.snapshot()["stages"]["actuator"]["count"], 1)
+
+    def test_reset(self):
+        metrics = PipelineMetrics()
+        metrics.count("frames")
+        metrics.reset()
+        self.assertEqual(metrics.snapshot()["counters"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
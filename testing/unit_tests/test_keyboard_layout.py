@@ -0,0 +1,63 @@
+import unittest
+import os
+import sys
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.keyboard_layout import LAYOUTS, Button, KeyIndex
+
+
+def linear_scan(buttons, x, y):
+    """The per-frame rectangle loop the index replaces"""
+    for button in buttons:
+        xb, yb = button.pos
+        wb, hb = button.size
+        if (xb < x < xb + wb) and (yb < y < yb + hb):
+            return button
+    return None
+
+
+class TestKeyIndex(unittest.TestCase):
+    def test_lookup_matches_linear_scan_on_every_layout(self):
+        for name, build in LAYOUTS.items():
+            index = KeyIndex(build())
+            for y in range(0, 440, 3):
+                for x in range(0, 1000, 3):
+                    self.assertIs(index.lookup(x, y), linear_scan(index.buttons, x, y), (name, x, y))
+
+    def test_key_borders_are_exclusive_like_the_scan(self):
+        index = KeyIndex([Button([10, 10], "A", [20, 20])], width=50, height=50)
+        self.assertIsNone(index.lookup(10, 15))
+        self.assertEqual(index.lookup(11, 11).text, "A")
+        self.assertEqual(index.lookup(29, 29).text, "A")
+        self.assertIsNone(index.lookup(30, 15))
+
+    def test_out_of_bounds(self):
+        index = KeyIndex(LAYOUTS["qwerty"]())
+        self.assertIsNone(index.lookup(-1, 50))
+        self.assertIsNone(index.lookup(1000, 50))
+        self.assertIsNone(index.lookup(50, 440))
+
+    def test_hover_hysteresis_near_borders(self):
+        a = Button([0, 0], "A", [75, 70])
+        b = Button([85, 0], "B", [75, 70])
+        index = KeyIndex([a, b], width=200, height=100, margin=12)
+        hovered = index.hover(70, 30)
+        self.assertIs(hovered, a)
+        hovered = index.hover(80, 30, hovered)  # In the gap: still A instead of nothing
+        self.assertIs(hovered, a)
+        hovered = index.hover(86, 30, hovered)  # Just over B's border: still A
+        self.assertIs(hovered, a)
+        hovered = index.hover(90, 30, hovered)  # Past the margin: B
+        self.assertIs(hovered, b)
+        self.assertIs(index.hover(80, 30, hovered), b)  # And B is just as sticky on the way back
+
+    def test_every_layout_can_switch_to_the_next(self):
+        targets = {name: [b.target for b in build() if b.target] for name, build in LAYOUTS.items()}
+        self.assertEqual(targets, {"qwerty": ["symbols"], "symbols": ["numeric"], "numeric": ["qwerty"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
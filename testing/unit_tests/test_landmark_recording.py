@@ -0,0 +1,76 @@
+import unittest
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.landmark_recording import RECORD_DTYPE, LandmarkRecorder, LandmarkRecording, dequantize, quantize
+from modules.observation import FrameObservation, HandObservation
+
+
+def make_observation(rng, handedness):
+    points = rng.random((len(handedness), 21, 3), dtype=np.float32)
+    points[..., 2] -= 0.5  # z is signed
+    hands = [HandObservation(side, None, 640, 480, points[idx]) for idx, side in enumerate(handedness)]
+    return FrameObservation((480, 640, 3), hands, points)
+
+
+class TestLandmarkRecording(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "session.gclm")
+        self.rng = np.random.default_rng(0)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_quantization_error_is_sub_pixel(self):
+        points = self.rng.uniform(-0.2, 1.2, (1000, 3)).astype(np.float32)
+        error = np.abs(dequantize(quantize(points)) - points).max()
+        self.assertLess(error * 640, 0.05)
+
+    def test_round_trip(self):
+        frames = [
+            make_observation(self.rng, ["left", "right"]),
+            make_observation(self.rng, []),
+            make_observation(self.rng, ["right"]),
+        ]
+        with LandmarkRecorder(self.path, 640, 480) as recorder:
+            for idx, observation in enumerate(frames):
+                recorder.record(observation, 10.0 + idx / 30)
+
+        recording = LandmarkRecording(self.path)
+        self.assertEqual(len(recording), 3)
+        self.assertEqual(recording.frame_shape, (480, 640, 3))
+        self.assertAlmostEqual(recording.duration, 2 / 30)
+        self.assertEqual(os.path.getsize(self.path), 32 + 3 * RECORD_DTYPE.itemsize)
+
+        for (timestamp, replayed), original in zip(recording, frames):
+            self.assertEqual([hand.handedness for hand in replayed.hands], [hand.handedness for hand in original.hands])
+            np.testing.assert_array_equal(replayed.is_left, original.is_left)
+            np.testing.assert_allclose(replayed.points, original.points, atol=1e-4)
+        self.assertFalse(recording.observation(1))
+        self.assertEqual(recording.observation(2).hand("right").positions[0][0], 0)
+
+    def test_truncated_record_is_ignored(self):
+        with LandmarkRecorder(self.path) as recorder:
+            recorder.record(make_observation(self.rng, ["left"]), 1.0)
+            recorder.record(make_observation(self.rng, ["left"]), 2.0)
+        with open(self.path, "r+b") as file:
+            file.truncate(os.path.getsize(self.path) - 10)
+        self.assertEqual(len(LandmarkRecording(self.path)), 1)
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a recording" * 4)
+        with self.assertRaises(ValueError):
+            LandmarkRecording(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.lazy_import import LazyImporter, ModePreloader, parse_importtime
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       310 |        450 |     numpy._core
+import time:      1200 |       1650 |   numpy
+"""
+
+
+class TestLazyImporter(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        sys.path.insert(0, self.tmp.name)
+        self.names = []
+
+    def tearDown(self):
+        sys.path.remove(self.tmp.name)
+        for name in self.names:
+            sys.modules.pop(name, None)
+        self.tmp.cleanup()
+
+    def make_module(self, name, body="VALUE = 42\n"):
+        with open(os.path.join(self.tmp.name, name + ".py"), "w") as file:
+            file.write(body)
+        self.names.append(name)
+        return name
+
+    def test_load_records_first_import_only(self):
+        name = self.make_module("lazy_mode_a")
+        importer = LazyImporter()
+        self.assertEqual(importer.attribute(name, "VALUE"), 42)
+        importer.load(name)
+        stats = importer.stats()
+        self.assertEqual(list(stats), [name])
+        self.assertGreaterEqual(stats[name]["new_modules"], 1)
+        self.assertEqual(stats[name]["thread"], "MainThread")
+
+    def test_preloader_imports_in_background_and_keeps_going_after_failures(self):
+        good = self.make_module("lazy_mode_b")
+        broken = self.make_module("lazy_mode_broken", "import module_that_does_not_exist\n")
+        importer = LazyImporter()
+        preloader = ModePreloader(importer, [broken, good])
+        preloader.start()
+        preloader.join(5.0)
+        self.assertIn(good, sys.modules)
+        self.assertEqual(importer.stats()[good]["thread"], "mode-preload")
+        self.assertIn("ModuleNotFoundError", preloader.failed[broken])
+
+    def test_parse_importtime(self):
+        self.assertEqual(
+            parse_importtime(IMPORTTIME_OUTPUT),
+            [("_io", 120, 120), ("numpy._core", 310, 450), ("numpy", 1200, 1650)],
+        )
+
+
+class TestEngineImports(unittest.TestCase):
+    def test_engine_import_does_not_load_mode_modules(self):
+        code = (
+            "import sys, script.gesture_control as g\n"
+            "modules = [m for m, _ in g.MODE_HANDLERS.values()] + [g.VIRTUAL_KEYBOARD[0]]\n"
+            "print(sorted(m for m in modules if m in sys.modules))\n"
+        )
+        process = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+        self.assertEqual(process.returncode, 0, process.stderr)
+        self.assertEqual(process.stdout.strip().splitlines()[-1], "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import io
+import os
+import sys
+import time
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.logger import DEBUG, INFO, WARNING, Logger, parse_level
+from fakes import FakeClock
+
+
+class CountingStr:
+    """Counts how often it is formatted"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "value"
+
+
+class TestLogger(unittest.TestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.clock = FakeClock()
+        self.log = Logger(level=INFO, stream=self.stream, clock=self.clock, background=False)
+
+    def lines(self):
+        return self.stream.getvalue().splitlines()
+
+    def test_levels(self):
+        self.log.debug("a", "hidden")
+        self.log.info("b", "shown %s", 1)
+        self.log.set_level("warning")
+        self.log.info("c", "hidden")
+        self.log.warning("d", "⚠ shown")
+        self.assertEqual(self.lines(), ["shown 1", "⚠ shown"])
+        self.assertTrue(self.log.enabled(WARNING))
+        self.assertFalse(self.log.enabled(DEBUG))
+
+    def test_disabled_debug_is_never_formatted(self):
+        value = CountingStr()
+        for _ in range(100):
+            self.log.debug("detect", "[DETECT] %s", value)
+        self.assertEqual(value.calls, 0)
+        self.assertEqual(self.stream.getvalue(), "")
+
+    def test_rate_limit_per_key(self):
+        for step in range(10):
+            self.clock.now = step * 0.1
+            self.log.info("detect", "tick %d", step, every=0.5)
+            self.log.info("other", "other %d", step, every=5.0)
+        self.assertEqual(self.lines(), ["tick 0", "other 0", "tick 5 (+4 suppressed)"])
+
+    def test_formatting_happens_at_flush(self):
+        value = CountingStr()
+        log = Logger(stream=self.stream, flush_interval=60.0)  # Only the explicit flush() below writes
+        log.info("key", "%s", value)
+        self.assertEqual(value.calls, 0)
+        log.flush()
+        self.assertEqual((value.calls, self.lines()), (1, ["value"]))
+
+    def test_ring_buffer_drops_oldest(self):
+        log = Logger(capacity=3, stream=self.stream, flush_interval=60.0)
+        for index in range(5):
+            log.info("key", "line %d", index)
+        log.flush()
+        self.assertEqual(self.lines(), ["⚠ 2 log records dropped (buffer full)", "line 2", "line 3", "line 4"])
+
+    def test_background_flush(self):
+        log = Logger(stream=self.stream, flush_interval=0.01)
+        log.info("key", "from the frame loop")
+        deadline = time.monotonic() + 2.0
+        while not self.stream.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.lines(), ["from the frame loop"])
+
+    def test_bad_format_is_reported_not_raised(self):
+        self.log.info("key", "%d frames", "many")
+        self.assertIn("format error", self.stream.getvalue())
+
+    def test_parse_level(self):
+        self.assertEqual(parse_level("DEBUG"), DEBUG)
+        self.assertEqual(parse_level(25), 25)
+        with self.assertRaises(ValueError):
+            parse_level("verbose")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+import urllib.error
+import urllib.request
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.instrumentation import PipelineMetrics
+from modules.metrics_exporter import MetricsExporter, prometheus_text
+from script.replay import replay
+from test_replay import write_session
+
+
+def parse_samples(text):
+    """{'name{labels}': value} for every sample line of a Prometheus text exposition"""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            key, value = line.rsplit(" ", 1)
+            samples[key] = float(value)
+    return samples
+
+
+class TestPrometheusText(unittest.TestCase):
+    def test_histogram_buckets_are_cumulative(self):
+        metrics = PipelineMetrics(bounds_ms=(1, 10))
+        for seconds in (0.0005, 0.005, 0.005, 0.5):
+            metrics.record("flip", seconds)
+        metrics.count("frames", 4)
+        metrics.count_actions('Media "Control"')
+        samples = parse_samples(prometheus_text(metrics.snapshot()))
+        self.assertEqual(samples['gesture_stage_latency_seconds_bucket{stage="flip",le="0.001"}'], 1)
+        self.assertEqual(samples['gesture_stage_latency_seconds_bucket{stage="flip",le="0.01"}'], 3)
+        self.assertEqual(samples['gesture_stage_latency_seconds_bucket{stage="flip",le="+Inf"}'], 4)
+        self.assertEqual(samples['gesture_stage_latency_seconds_count{stage="flip"}'], 4)
+        self.assertAlmostEqual(samples['gesture_stage_latency_seconds_sum{stage="flip"}'], 0.5105)
+        self.assertEqual(samples["gesture_frames_total"], 4)
+        self.assertEqual(samples['gesture_actions_total{mode="Media \\"Control\\""}'], 1)
+
+
+class TestMetricsExporter(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmp.name, "session.gclm")
+        index = [0, 1, 0, 0, 0]
+        write_session(path, [(0.5, index, None), (1.0, index, [0, 0, 0, 0, 1]), (0.5, None, None)])
+        self.result = replay(path)
+        self.exporter = MetricsExporter(self.result.engine, port=0)
+        self.exporter.start()
+
+    def tearDown(self):
+        self.exporter.stop()
+        self.tmp.cleanup()
+
+    def get(self, path):
+        with urllib.request.urlopen(self.exporter.url + path, timeout=5) as response:
+            return response.headers["Content-Type"], response.read().decode("utf-8")
+
+    def test_prometheus_endpoint(self):
+        content_type, text = self.get("/metrics")
+        self.assertTrue(content_type.startswith("text/plain; version=0.0.4"))
+        samples = parse_samples(text)
+        self.assertEqual(samples["gesture_frames_with_hands_total"], 15)
+        self.assertEqual(samples['gesture_actions_total{mode="Window Control"}'], 2)
+        self.assertEqual(samples["gesture_actuator_submitted_total"], 2)
+        self.assertEqual(samples['gesture_stage_latency_seconds_count{stage="classify"}'], 15)
+        self.assertEqual(samples["gesture_idle"], 0)
+        self.assertIn("# TYPE gesture_stage_latency_seconds histogram", text)
+
+    def test_json_endpoint(self):
+        content_type, body = self.get("/metrics.json")
+        self.assertEqual(content_type, "application/json")
+        snapshot = json.loads(body)
+        self.assertEqual(snapshot["actions_by_mode"], {"Window Control": 2})
+        self.assertEqual(snapshot["counters"]["hands_detected"], 25)
+        self.assertEqual(snapshot["idle"]["state"], "active")
+
+    def test_unknown_path(self):
+        with self.assertRaises(urllib.error.HTTPError) as error:
+            self.get("/")
+        self.assertEqual(error.exception.code, 404)
+
+    def test_binds_to_localhost(self):
+        self.assertEqual(self.exporter.host, "127.0.0.1")
+        self.assertNotEqual(self.exporter.port, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import os
+import sys
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.mode_registry import ModeRegistry
+
+
+class RecordingHandler:
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+        log.append(("build", name))
+
+    def activate(self):
+        self.log.append(("activate", self.name))
+
+    def deactivate(self):
+        self.log.append(("deactivate", self.name))
+
+
+class TestModeRegistry(unittest.TestCase):
+    def setUp(self):
+        self.log = []
+        self.registry = ModeRegistry({
+            "index": lambda: RecordingHandler("index", self.log),
+            "all": lambda: RecordingHandler("all", self.log),
+            "plain": lambda: object(),  # handlers without hooks are allowed
+        })
+
+    def test_handler_is_built_once(self):
+        first = self.registry.get("index")
+        for _ in range(10):
+            self.assertIs(self.registry.get("index"), first)
+        self.assertEqual(self.log, [("build", "index")])
+
+    def test_hooks_run_only_on_mode_change(self):
+        self.registry.activate("index")
+        self.registry.activate("index")
+        self.registry.activate("all")
+        self.assertEqual(self.log, [
+            ("build", "index"), ("activate", "index"),
+            ("deactivate", "index"), ("build", "all"), ("activate", "all"),
+        ])
+
+    def test_unknown_mode_deactivates_current(self):
+        self.registry.activate("index")
+        self.assertIsNone(self.registry.activate("little"))
+        self.assertIsNone(self.registry.active_mode)
+        self.assertEqual(self.log[-1], ("deactivate", "index"))
+        self.assertIsNone(self.registry.get("little"))
+
+    def test_handler_without_hooks(self):
+        self.registry.activate("plain")
+        self.registry.deactivate_all()
+        self.assertIsNone(self.registry.active_mode)
+
+
+if __name__ == "__main__":
+    unittest.main()
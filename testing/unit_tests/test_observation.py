@@ -0,0 +1,50 @@
+import unittest
+from types import SimpleNamespace
+import os
+import sys
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.observation import FrameObservation
+
+
+def make_hand(x, y):
+    return SimpleNamespace(landmark=[SimpleNamespace(x=x, y=y, z=0.0) for _ in range(21)])
+
+
+def make_results(*hands):
+    """Mimic the multi_hand_landmarks / multi_handedness layout of a MediaPipe result"""
+    return SimpleNamespace(
+        multi_hand_landmarks=[make_hand(x, y) for _, x, y in hands] or None,
+        multi_handedness=[
+            SimpleNamespace(classification=[SimpleNamespace(label=label)])
+            for label, _, _ in hands
+        ],
+    )
+
+
+class TestFrameObservation(unittest.TestCase):
+    def test_from_results_builds_pixel_positions(self):
+        observation = FrameObservation.from_results(make_results(("Right", 0.5, 0.25)), (480, 640, 3))
+        right = observation.hand("right")
+        self.assertIsNotNone(right)
+        self.assertEqual(len(right.positions), 21)
+        self.assertEqual(right.positions[8], [8, 320, 120])
+
+    def test_hand_lookup_by_handedness(self):
+        observation = FrameObservation.from_results(
+            make_results(("Left", 0.1, 0.1), ("Right", 0.9, 0.9)), (480, 640, 3)
+        )
+        self.assertEqual(observation.hand("left").positions[0], [0, 64, 48])
+        self.assertEqual(observation.hand("right").positions[0], [0, 576, 432])
+
+    def test_empty_results_is_falsy(self):
+        observation = FrameObservation.from_results(make_results(), (480, 640, 3))
+        self.assertFalse(observation)
+        self.assertIsNone(observation.hand("right"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.preview import PreviewPublisher
+from fakes import FakeClock
+
+
+def bgr_frame(blue=255, red=0):
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    frame[:, :, 0] = blue
+    frame[:, :, 2] = red
+    return frame
+
+
+class TestPreviewPublisher(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(now=100.0)
+        self.publisher = PreviewPublisher(size=(480, 320), fps=30, clock=self.clock)
+
+    def test_nothing_is_produced_without_subscribers(self):
+        self.assertFalse(self.publisher.publish(bgr_frame()))
+        self.assertIsNone(self.publisher.latest)
+        self.assertEqual(self.publisher.stats(), {"subscribers": 0, "published": 0, "skipped": 0})
+
+    def test_preview_is_downscaled_rgb_copy(self):
+        self.publisher.subscribe()
+        frame = bgr_frame(blue=255)
+        self.assertTrue(self.publisher.publish(frame))
+        preview = self.publisher.latest
+        self.assertEqual(preview.image.shape, (320, 480, 3))
+        self.assertEqual(tuple(preview.image[0, 0]), (0, 0, 255))  # Blue in BGR is the last channel in RGB
+        frame[:] = 0  # The engine keeps drawing on its frame; the preview must not change
+        self.assertEqual(tuple(preview.image[0, 0]), (0, 0, 255))
+        self.assertEqual(preview.seq, 1)
+
+    def test_publishes_at_display_rate(self):
+        self.publisher.subscribe()
+        results = []
+        for _ in range(12):  # 120 fps camera for 0.1 s
+            results.append(self.publisher.publish(bgr_frame()))
+            self.clock.now += 1 / 120
+        self.assertEqual(sum(results), 3)
+        self.assertEqual(self.publisher.skipped, 9)
+
+    def test_no_burst_after_a_stall(self):
+        self.publisher.subscribe()
+        self.publisher.publish(bgr_frame())
+        self.clock.now += 5.0
+        self.assertTrue(self.publisher.publish(bgr_frame()))
+        self.clock.now += 0.001
+        self.assertFalse(self.publisher.publish(bgr_frame()))
+
+    def test_last_unsubscribe_stops_production(self):
+        first = self.publisher.subscribe()
+        second = self.publisher.subscribe()
+        first()
+        first()  # Idempotent
+        self.assertTrue(self.publisher.active)
+        second()
+        self.assertFalse(self.publisher.active)
+        self.assertIsNone(self.publisher.latest)
+        self.assertFalse(self.publisher.publish(bgr_frame()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+# script.replay imports the engine as script.gesture_control, so the repository root is needed too
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(ROOT)
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.landmark_recording import LandmarkRecorder
+from modules.observation import FrameObservation, HandObservation
+from script.replay import replay
+
+
+def synthetic_hand(raised_fingers, hand_type):
+    """(21, 3) landmarks that classify as raised_fingers ([thumb, index, middle, ring, little] order)"""
+    points = np.zeros((21, 3), dtype=np.float32)
+    points[:, 0] = 0.5
+    points[0, 1] = 0.9  # wrist
+    points[[5, 9, 13, 17], 1] = 0.7  # knuckles: threshold = (0.9 - 0.7) / 2
+    for finger, tip in enumerate([8, 12, 16, 20], start=1):
+        points[tip, 1] = 0.5 if raised_fingers[finger] else 0.75
+    thumb_offset = 0.1 if raised_fingers[0] else 0.0
+    points[4, 0] = 0.5 + thumb_offset if hand_type == "left" else 0.5 - thumb_offset
+    return points
+
+
+def write_session(path, segments, fps=10):
+    """segments: [(seconds, left fingers or None, right fingers or None)]"""
+    with LandmarkRecorder(path) as recorder:
+        t = 0.0
+        for seconds, left, right in segments:
+            for _ in range(int(seconds * fps)):
+                hands = [(side, fingers) for side, fingers in (("left", left), ("right", right)) if fingers]
+                points = np.stack([synthetic_hand(fingers, side) for side, fingers in hands]) if hands else np.empty((0, 21, 3), np.float32)
+                observation = FrameObservation(
+                    (480, 640, 3),
+                    [HandObservation(side, None, 640, 480, points[idx]) for idx, (side, _) in enumerate(hands)],
+                    points,
+                )
+                recorder.record(observation, t)
+                t += 1.0 / fps
+
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "session.gclm")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_window_control_session(self):
+        index = [0, 1, 0, 0, 0]
+        little = [0, 0, 0, 0, 1]
+        write_session(self.path, [
+            (0.5, index, None),  # select window control
+            (1.0, index, little),  # hold "next window" for one second
+            (0.5, None, None),  # hands gone
+        ])
+        result = replay(self.path)
+        self.assertEqual(result.frames, 20)
+        self.assertEqual(result.final_mode, "Window Control")
+        # held for 1 s with a 650 ms repeat cooldown -> fired twice
+        self.assertEqual([name for _, name, _ in result.actions], ["window_nav", "window_nav"])
+        self.assertEqual(result.actions[0][2], (little,))
+
+    def test_replay_is_deterministic(self):
+        write_session(self.path, [(0.3, [0, 1, 1, 0, 0], None), (1.0, [0, 1, 1, 0, 0], [1, 0, 0, 0, 0])])
+        first = replay(self.path)
+        second = replay(self.path)
+        self.assertEqual(first.actions, second.actions)
+        self.assertEqual(first.action_counts(), {"tab_nav": 2})
+
+    def test_replay_ignores_the_machine_config(self):
+        write_session(self.path, [(0.3, [0, 1, 1, 0, 0], None)])
+        result = replay(self.path)
+        self.assertEqual(dict(result.engine.config.snapshot.controls), {})
+        self.assertIsNone(result.summary()["config"])
+
+        config_path = os.path.join(self.tmp.name, "gestures.json")
+        with open(config_path, "w") as file:
+            json.dump({"userDefinedControls": {"index": ["notepad.exe"]}}, file)
+        result = replay(self.path, config_path=config_path)
+        self.assertEqual(result.engine.config.snapshot.apps_for("index"), ("notepad.exe",))
+        self.assertEqual(result.summary()["config"], config_path)
+
+    def test_replay_never_imports_os_backends(self):
+        # Every handler is built, including mouse (screen size) and the keyboard (pynput Controller)
+        write_session(self.path, [
+            (0.3, [0, 1, 1, 1, 0], None), (0.3, [0, 1, 1, 1, 0], [0, 1, 1, 0, 0]),
+            (0.3, [0, 1, 1, 1, 1], None), (0.3, [0, 1, 1, 1, 1], [0, 1, 0, 0, 0]),
+            (0.3, [0, 1, 0, 0, 0], None), (0.3, [0, 1, 0, 0, 0], [0, 0, 0, 0, 1]),
+            (0.3, [0, 1, 1, 0, 0], None), (0.3, [0, 1, 1, 0, 0], [1, 0, 0, 0, 0]),
+            (0.3, [0, 1, 0, 0, 1], None), (0.3, [0, 1, 0, 0, 1], [0, 1, 0, 0, 0]),
+        ])
+        code = (
+            "import sys\n"
+            "from script.replay import replay\n"
+            f"result = replay({self.path!r})\n"
+            "print(sorted(result.action_counts()))\n"
+            "backends = ('pyautogui', 'pygetwindow', 'keyboard', 'pynput', 'mouse', 'win32gui')\n"
+            "print(sorted(m for m in backends if m in sys.modules))\n"
+        )
+        process = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+        self.assertEqual(process.returncode, 0, process.stderr)
+        actions, imported = process.stdout.strip().splitlines()[-2:]
+        self.assertEqual(actions, "['game_key', 'mouse_move', 'tab_nav', 'window_nav']")
+        self.assertEqual(imported, "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.roi import RegionOfInterest, RoiTracker, bounding_box, padded_region
+
+WIDTH, HEIGHT = 640, 480
+
+
+def make_hand(x_min, y_min, x_max, y_max):
+    """(21, 3) landmarks spread between two normalized corners"""
+    points = np.zeros((21, 3), dtype=np.float32)
+    points[:, 0] = np.linspace(x_min, x_max, 21)
+    points[:, 1] = np.linspace(y_min, y_max, 21)
+    return points
+
+
+class TestRegionOfInterest(unittest.TestCase):
+    def test_remap_round_trip(self):
+        region = RegionOfInterest(160, 120, 480, 360, WIDTH, HEIGHT, scale=0.5)
+        full = make_hand(0.3, 0.3, 0.7, 0.7)
+        full[:, 2] = 0.05
+        # what MediaPipe would report for the same hand inside the crop
+        in_crop = full.copy()
+        in_crop[:, 0] = (full[:, 0] * WIDTH - 160) / region.width
+        in_crop[:, 1] = (full[:, 1] * HEIGHT - 120) / region.height
+        in_crop[:, 2] = full[:, 2] * WIDTH / region.width
+        np.testing.assert_allclose(region.remap(in_crop), full, atol=1e-6)
+
+    def test_crop_is_a_view_and_inference_size_is_scaled(self):
+        frame = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+        region = RegionOfInterest(100, 50, 300, 250, WIDTH, HEIGHT, scale=0.5)
+        crop = region.crop(frame)
+        self.assertEqual(crop.shape, (200, 200, 3))
+        self.assertTrue(np.shares_memory(crop, frame))
+        self.assertEqual(region.inference_size, (100, 100))
+
+    def test_padded_region_is_clamped_and_downscaled(self):
+        region = padded_region((0.0, 0.0, 0.5, 0.5), WIDTH, HEIGHT, padding=0.5, target_size=256)
+        self.assertEqual((region.x0, region.y0), (0, 0))
+        self.assertLessEqual(region.x1, WIDTH)
+        self.assertLessEqual(region.y1, HEIGHT)
+        self.assertAlmostEqual(max(region.inference_size), 256, delta=1)
+
+    def test_bounding_box_covers_all_hands(self):
+        points = np.stack([make_hand(0.1, 0.2, 0.3, 0.4), make_hand(0.5, 0.1, 0.6, 0.3)])
+        np.testing.assert_allclose(bounding_box(points), (0.1, 0.1, 0.6, 0.4), atol=1e-6)
+
+
+class TestRoiTracker(unittest.TestCase):
+    def setUp(self):
+        self.tracker = RoiTracker(min_hands=2)
+        self.small_hands = np.stack([make_hand(0.40, 0.40, 0.45, 0.50), make_hand(0.55, 0.40, 0.60, 0.50)])
+
+    def test_full_frame_until_both_hands_tracked(self):
+        self.assertIsNone(self.tracker.next_region())
+        self.tracker.update(self.small_hands[:1], WIDTH, HEIGHT)
+        self.assertIsNone(self.tracker.next_region())
+        self.tracker.update(self.small_hands, WIDTH, HEIGHT)
+        self.assertIsNotNone(self.tracker.next_region())
+
+    def test_region_is_kept_while_hands_stay_inside(self):
+        first = self.tracker.update(self.small_hands, WIDTH, HEIGHT)
+        moved = self.small_hands.copy()
+        moved[..., 0] += 0.005
+        self.assertIs(self.tracker.update(moved, WIDTH, HEIGHT), first)
+
+    def test_region_follows_hands_that_leave_it(self):
+        first = self.tracker.update(self.small_hands, WIDTH, HEIGHT)
+        moved = self.small_hands.copy()
+        moved[..., 0] -= 0.25
+        second = self.tracker.update(moved, WIDTH, HEIGHT)
+        self.assertIsNot(second, first)
+        self.assertTrue(second.contains(bounding_box(moved)))
+
+    def test_lost_hand_falls_back_to_full_frame(self):
+        self.tracker.update(self.small_hands, WIDTH, HEIGHT)
+        self.tracker.update(self.small_hands[:1], WIDTH, HEIGHT)
+        self.assertIsNone(self.tracker.next_region())
+        self.assertEqual(self.tracker.fallbacks, 1)
+
+    def test_large_hands_use_full_frame(self):
+        big = np.stack([make_hand(0.05, 0.1, 0.45, 0.9), make_hand(0.55, 0.1, 0.95, 0.9)])
+        self.assertIsNone(self.tracker.update(big, WIDTH, HEIGHT))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import os
+import sys
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.scheduler import Scheduler
+from fakes import FakeClock
+
+
+class TestScheduler(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = Scheduler(self.clock)
+
+    def advance(self, ms):
+        self.clock.now += ms / 1000.0
+        self.scheduler.tick()
+
+    def fire_times(self, cadence, fps, seconds=1.0):
+        times = []
+        for frame in range(int(seconds * fps)):
+            self.clock.now = frame / fps
+            self.scheduler.tick()
+            if cadence.ready():
+                times.append(round(self.clock.now * 1000))
+        return times
+
+    def test_cadence_rate_is_independent_of_fps(self):
+        for fps in (15, 30, 60):
+            cadence = self.scheduler.cadence(90)
+            times = self.fire_times(cadence, fps)
+            gaps = [b - a for a, b in zip(times, times[1:])]
+            self.assertTrue(all(90 <= gap < 90 + 1000 / fps + 1 for gap in gaps), (fps, gaps))
+
+    def test_cadence_agrees_within_a_frame(self):
+        cadence = self.scheduler.cadence(100)
+        self.assertTrue(cadence.ready())
+        self.assertTrue(cadence.ready())  # second hand in the same frame
+        self.advance(50)
+        self.assertFalse(cadence.due())
+        self.assertFalse(cadence.ready())
+        self.advance(50)
+        self.assertTrue(cadence.due())
+        self.assertTrue(cadence.ready())
+
+    def test_zero_interval_fires_every_frame(self):
+        cadence = self.scheduler.cadence(0)
+        for _ in range(5):
+            self.advance(1)
+            self.assertTrue(cadence.ready())
+
+    def test_cooldown_blocks_same_key_only(self):
+        cooldown = self.scheduler.cooldown(650)
+        self.assertTrue(cooldown.ready("a"))
+        cooldown.start("a")
+        self.advance(300)
+        self.assertFalse(cooldown.ready("a"))
+        self.assertTrue(cooldown.ready("b"))
+        self.assertAlmostEqual(cooldown.remaining_ms(), 350)
+        self.advance(351)
+        self.assertTrue(cooldown.ready("a"))
+        cooldown.start("a")
+        cooldown.reset()
+        self.assertTrue(cooldown.ready("a"))
+
+    def test_stability_window(self):
+        window = self.scheduler.stability(80)
+        self.assertFalse(window.update("index"))
+        self.advance(50)
+        self.assertFalse(window.update("index"))
+        self.advance(50)
+        self.assertTrue(window.update("index"))
+        self.assertFalse(window.update("thumb"))  # a change restarts the window
+        self.advance(100)
+        self.assertTrue(window.update("thumb"))
+
+    def test_stability_takes_same_time_at_any_fps(self):
+        for fps in (15, 30, 60):
+            scheduler = Scheduler(self.clock)
+            window = scheduler.stability(150)
+            frame = 0
+            while True:
+                self.clock.now = frame / fps
+                scheduler.tick()
+                if window.update("all"):
+                    break
+                frame += 1
+            self.assertGreaterEqual(frame / fps, 0.15)
+            self.assertLess(frame / fps, 0.15 + 1.0 / fps)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.keyboard_layout import qwerty_layout
+from modules.swipe_decoder import SwipeDecoder, key_centres, resample
+
+
+def swipe(centres, word, noise=0.0, seed=0):
+    """Cursor path through the word's keys, a few points per key-to-key segment"""
+    rng = np.random.default_rng(seed)
+    points = [np.array(centres[letter]) for letter in word]
+    path = []
+    for a, b in zip(points, points[1:]):
+        path += [tuple(a + (b - a) * t + rng.normal(0, noise, 2)) for t in np.linspace(0, 1, 5)[:-1]]
+    path.append(tuple(points[-1] + rng.normal(0, noise, 2)))
+    return path
+
+
+class TestSwipeDecoder(unittest.TestCase):
+    def setUp(self):
+        self.centres = key_centres(qwerty_layout())
+        self.words = ["hello", "help", "world", "would", "word", "keyboard", "the", "there", "a"]
+        self.decoder = SwipeDecoder(self.words, self.centres)
+
+    def test_resample_spaces_points_evenly(self):
+        points = resample([(0, 0), (10, 0), (10, 10)], 5)
+        np.testing.assert_allclose(points, [(0, 0), (5, 0), (10, 0), (10, 5), (10, 10)])
+        self.assertEqual(resample([(3, 4)], 4).shape, (4, 2))
+
+    def test_clean_and_noisy_paths_decode_to_the_word(self):
+        for word in ("hello", "world", "keyboard", "there"):
+            self.assertEqual(self.decoder.decode(swipe(self.centres, word))[0], word)
+            self.assertEqual(self.decoder.decode(swipe(self.centres, word, noise=10, seed=len(word)))[0], word)
+
+    def test_first_and_last_keys_prune_the_dictionary(self):
+        self.decoder.decode(swipe(self.centres, "world"))
+        self.assertLess(self.decoder.last_candidates, self.decoder.size)
+        self.assertNotIn("a", [word for group in self.decoder.groups.values() for word in group[0]])
+
+    def test_frequency_prior_breaks_ties(self):
+        decoder = SwipeDecoder(["word", "wird"], self.centres, priors={"word": 1000, "wird": 1})
+        path = [self.centres["w"], ((self.centres["o"][0] + self.centres["i"][0]) / 2, self.centres["o"][1]),
+                self.centres["r"], self.centres["d"]]
+        self.assertEqual(decoder.decode(path), ["word", "wird"])
+
+
+if __name__ == "__main__":
+    unittest.main()
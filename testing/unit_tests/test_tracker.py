@@ -2,13 +2,18 @@ import unittest
 from unittest.mock import patch
 import os
 import sys
+from types import SimpleNamespace
 import cv2
 import mediapipe as mp
+import numpy as np
 
 sys.path.append(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
 )
 
+from modules.gesture_tables import finger_mask
+from modules.hand_features import classify_hand
+from modules.observation import FrameObservation, HandObservation
 from modules.tracker import HandTracker
 
 
@@ -27,11 +32,101 @@ class TestHandTracker(unittest.TestCase):
         self.assertEqual(raised_fingers, [1, 1, 1, 1, 1])
 
     def test_find_position(self):
-        frame = cv2.imread("frame.jpg")
-        landmarks = self.hand_tracker.find_position(frame)
-        self.assertIsNotNone(landmarks)
+        # find_position reads the frame's shared observation instead of running inference itself
+        points = np.zeros((21, 3), dtype=np.float32)
+        points[:, 0] = np.linspace(0.1, 0.9, 21)
+        points[:, 1] = 0.5
+        observation = FrameObservation((480, 640, 3), [HandObservation("right", None, 640, 480, points)])
+        landmarks = self.hand_tracker.find_position(observation, "right")
         self.assertIsInstance(landmarks, list)
-        self.assertGreater(len(landmarks), 0)
+        self.assertEqual(len(landmarks), 21)
+        self.assertEqual(landmarks[0], [0, 64, 240])
+        self.assertEqual(landmarks[20], [20, 576, 240])
+        self.assertEqual(self.hand_tracker.find_position(observation, "left"), [])
+
+    def test_classify_hands_returns_finger_masks(self):
+        rng = np.random.default_rng(0)
+        hands = [HandObservation(side, None, 640, 480, rng.random((21, 3), dtype=np.float32)) for side in ("left", "right") * 4]
+        observation = FrameObservation((480, 640, 3), hands)
+        masks = self.hand_tracker.classify_hands(observation, mouse_control=True)
+        self.assertEqual(masks, [finger_mask(classify_hand(hand.points, hand.handedness)) for hand in hands])
+        self.assertTrue(all(isinstance(mask, int) for mask in masks))
+
+
+class FakeHands:
+    """Stands in for mp.solutions.hands.Hands: reports fixed full-frame hands relative to the image it is given"""
+
+    def __init__(self, tracker, hands):
+        self.tracker = tracker
+        self.hands = hands  # [(handedness, (21, 3) full-frame points)]
+        self.resets = 0
+
+    def reset(self):
+        self.resets += 1
+
+    def process(self, rgb):
+        x0, y0, x1, y1 = self.tracker._geometry or (0, 0, 640, 480)
+        multi_hand_landmarks, multi_handedness = [], []
+        for handedness, points in self.hands:
+            landmark = [
+                SimpleNamespace(x=(x * 640 - x0) / (x1 - x0), y=(y * 480 - y0) / (y1 - y0), z=0.0)
+                for x, y, _ in points.tolist()
+            ]
+            multi_hand_landmarks.append(SimpleNamespace(landmark=landmark))
+            multi_handedness.append(SimpleNamespace(classification=[SimpleNamespace(label=handedness)]))
+        return SimpleNamespace(multi_hand_landmarks=multi_hand_landmarks, multi_handedness=multi_handedness)
+
+
+def make_hand(x_min, y_min, x_max, y_max):
+    points = np.zeros((21, 3), dtype=np.float32)
+    points[:, 0] = np.linspace(x_min, x_max, 21)
+    points[:, 1] = np.linspace(y_min, y_max, 21)
+    return points
+
+
+class TestCropInference(unittest.TestCase):
+    def setUp(self):
+        self.tracker = HandTracker(crop_inference=True, load_model=False)
+        self.hands = FakeHands(self.tracker, [
+            ("Left", make_hand(0.40, 0.40, 0.45, 0.50)),
+            ("Right", make_hand(0.55, 0.40, 0.60, 0.50)),
+        ])
+        self.tracker.hands = self.hands
+        self.frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+    def test_tracking_is_reset_only_when_the_crop_changes(self):
+        self.tracker.observe(self.frame)  # Full frame, fresh graph
+        self.assertEqual(self.hands.resets, 0)
+        self.tracker.observe(self.frame)  # Full frame -> crop around both hands
+        self.assertIsNotNone(self.tracker._geometry)
+        self.assertEqual(self.hands.resets, 1)
+        self.tracker.observe(self.frame)  # Same crop, MediaPipe keeps tracking
+        self.assertEqual(self.hands.resets, 1)
+
+        # The hands move out of the crop; the next frame runs on a new crop
+        self.hands.hands = [(label, points - [0.25, 0.0, 0.0]) for label, points in self.hands.hands]
+        crop = self.tracker._geometry
+        self.tracker.observe(self.frame)
+        self.tracker.observe(self.frame)
+        self.assertNotEqual(self.tracker._geometry, crop)
+        self.assertEqual(self.hands.resets, 2)
+        self.assertEqual(self.tracker.roi_stats()["tracking_resets"], 2)
+
+        # Losing a hand goes back to full frame, which is a geometry change too
+        self.hands.hands = self.hands.hands[:1]
+        self.tracker.observe(self.frame)
+        self.tracker.observe(self.frame)
+        self.assertIsNone(self.tracker._geometry)
+        self.assertEqual(self.hands.resets, 3)
+
+    def test_crop_landmarks_are_full_frame(self):
+        self.tracker.observe(self.frame)
+        observation = self.tracker.observe(self.frame)
+        self.assertIsNotNone(self.tracker._geometry)
+        for hand, (_, expected) in zip(observation.hands, self.hands.hands):
+            np.testing.assert_allclose(hand.points[:, :2], expected[:, :2], atol=1e-5)
+            protobuf = np.array([(lm.x, lm.y, lm.z) for lm in hand.landmarks.landmark], dtype=np.float32)
+            np.testing.assert_allclose(protobuf, hand.points, atol=1e-6)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,198 @@
+import unittest
+import os
+import sys
+import threading
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.focus_service import FakeWindowSystem, FocusService
+from modules.virtual_keyboard import VirtualKeyboard
+from modules.word_prediction import WordPredictor
+from fakes import FakeTracker
+
+
+def full_redraw(keyboard, cursor=None, hovered_button=None):
+    """The keyboard image as process() used to draw it from scratch every frame"""
+    img = np.zeros((480, 1000, 3), dtype=np.uint8)
+    img[:] = (30, 30, 30)
+    keyboard.drawAll(img)
+    cv2.rectangle(img, (15, 435), (985, 475), (200, 200, 200), 2)
+    cv2.rectangle(img, (17, 437), (983, 473), (50, 50, 50), cv2.FILLED)
+    cv2.putText(img, keyboard.text[-55:], (25, 462), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255), 2)
+    if keyboard.caps_lock:
+        cv2.rectangle(img, (920, 435), (985, 475), (50, 50, 200), cv2.FILLED)
+        cv2.putText(img, "CAPS", (925, 462), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+    if cursor is not None:
+        cv2.circle(img, cursor, 20, (0, 255, 0), 3)
+        cv2.circle(img, cursor, 5, (0, 255, 0), -1)
+    if hovered_button is not None:
+        (x, y), (w, h) = hovered_button.pos, hovered_button.size
+        cv2.rectangle(img, (x - 3, y - 3), (x + w + 3, y + h + 3), (0, 255, 255), 3)
+    return img
+
+
+class TestKeyboardRendering(unittest.TestCase):
+    def setUp(self):
+        self.keyboard = VirtualKeyboard(FakeTracker(), show_window=False)
+
+    def test_static_layer_is_cached_per_caps_state(self):
+        layer = self.keyboard.keyboard_layer()
+        self.assertIs(self.keyboard.keyboard_layer(), layer)
+        self.assertFalse(layer.flags.writeable)
+        self.keyboard.caps_lock = True
+        caps_layer = self.keyboard.keyboard_layer()
+        self.assertIsNot(caps_layer, layer)
+        self.keyboard.caps_lock = False
+        self.assertIs(self.keyboard.keyboard_layer(), layer)
+
+    def test_switch_layout_changes_keys_and_static_layer(self):
+        qwerty_layer = self.keyboard.keyboard_layer()
+        self.keyboard.hovered_button = self.keyboard.buttonList[0]
+        self.keyboard.switch_layout("numeric")
+        self.assertIsNone(self.keyboard.hovered_button)
+        self.assertIn("=", [button.text for button in self.keyboard.buttonList])
+        self.assertIsNot(self.keyboard.keyboard_layer(), qwerty_layer)
+        self.assertEqual(self.keyboard.key_index.lookup(80, 50).text, "7")
+
+    def test_render_reuses_one_buffer(self):
+        first = self.keyboard.render()
+        self.assertIs(self.keyboard.render((100, 100)), first)
+
+    def test_render_matches_full_redraw(self):
+        button = self.keyboard.buttonList[15]
+        self.keyboard.text = "hello world " * 6
+        for caps in (False, True):
+            self.keyboard.caps_lock = caps
+            for cursor, hovered in ((None, None), ((500, 200), button)):
+                expected = full_redraw(self.keyboard, cursor, hovered)
+                np.testing.assert_array_equal(self.keyboard.render(cursor, hovered), expected)
+
+
+class TestKeyboardSuggestions(unittest.TestCase):
+    def setUp(self):
+        self.keyboard = VirtualKeyboard(FakeTracker(), show_window=False, predictor=WordPredictor(history_path=None))
+        self.sent = []
+        self.keyboard.send_key = lambda key, hold=0: self.sent.append(key)
+
+    def key(self, text):
+        return next(button for button in self.keyboard.buttonList if button.text == text)
+
+    def slot(self, index):
+        return next(button for button in self.keyboard.buttonList if button.slot == index)
+
+    def test_pinching_a_suggestion_types_the_rest_of_the_word(self):
+        for letter in "WORL":
+            self.keyboard.press(self.key(letter))
+        self.assertEqual(self.keyboard.current_suggestions()[0], "world")
+        self.keyboard.press(self.slot(0))
+        self.assertEqual(self.keyboard.text, "world ")
+        self.assertEqual("".join(self.sent), "world ")
+        self.assertEqual(self.keyboard.current_suggestions(), [])
+
+    def test_suggestions_follow_caps_and_empty_slots_do_nothing(self):
+        self.keyboard.press(self.key("CAPS"))
+        self.keyboard.press(self.key("Q"))
+        completions = self.keyboard.current_suggestions()
+        self.keyboard.press(self.slot(0))
+        self.assertEqual(self.keyboard.text, completions[0].upper() + " ")
+        self.keyboard.press(self.slot(0))  # Nothing typed yet for the next word
+        self.assertEqual(self.keyboard.text, completions[0].upper() + " ")
+
+    def test_words_typed_by_hand_are_learned(self):
+        for letter in "ZYX":
+            self.keyboard.press(self.key(letter))
+        self.keyboard.press(self.key("SPACE"))
+        self.keyboard.press(self.key("Z"))
+        self.assertIn("zyx", self.keyboard.current_suggestions())
+
+    def test_render_draws_suggestions_only_while_a_word_is_typed(self):
+        self.keyboard.text = "hello "
+        np.testing.assert_array_equal(self.keyboard.render(), full_redraw(self.keyboard))
+        self.keyboard.text = "hello wor"
+        self.assertFalse(np.array_equal(self.keyboard.render(), full_redraw(self.keyboard)))
+
+
+class TestKeyboardSwipe(unittest.TestCase):
+    def setUp(self):
+        self.keyboard = VirtualKeyboard(FakeTracker(), show_window=False, predictor=WordPredictor(history_path=None))
+        self.sent = []
+        self.keyboard.send_key = lambda key, hold=0: self.sent.append(key)
+        self.keys = {button.text: button for button in self.keyboard.buttonList}
+        self.keyboard.press(self.keys["SWIPE"])
+        self.assertTrue(self.keyboard.wait_for_swipe_decoder(10.0))
+
+    def centre(self, text):
+        (x, y), (w, h) = self.keys[text].pos, self.keys[text].size
+        return (x + w // 2, y + h // 2)
+
+    def swipe(self, *keys):
+        for key in keys:
+            self.keyboard.track_swipe(*self.centre(key), pinched=True)
+        self.keyboard.track_swipe(*self.centre(keys[-1]), pinched=False)
+
+    def test_swipe_types_the_decoded_word_on_release(self):
+        self.assertTrue(self.keyboard.swipe_mode)
+        self.swipe(*"WORLD")
+        self.assertEqual(self.keyboard.text, "world ")
+        self.assertEqual(self.keyboard.swipe_path, [])
+
+    def test_suggestion_key_replaces_the_swiped_word(self):
+        self.swipe(*"WORD")
+        swiped, alternatives = self.keyboard.swipe_result
+        self.assertEqual(self.keyboard.current_suggestions(), alternatives)
+        self.keyboard.press(next(button for button in self.keyboard.buttonList if button.slot == 0))
+        self.assertEqual(self.keyboard.text, alternatives[0] + " ")
+        self.assertIsNone(self.keyboard.swipe_result)
+
+    def test_pinch_on_one_key_is_a_tap(self):
+        self.swipe("Q")
+        self.swipe("SPACE")
+        self.assertEqual(self.keyboard.text, "q ")
+        self.swipe("SWIPE")
+        self.assertFalse(self.keyboard.swipe_mode)
+
+    def test_decoder_is_built_off_the_calling_thread_and_only_once(self):
+        decoder = self.keyboard.swipe_decoder
+        self.keyboard.press(self.keys["SWIPE"])
+        self.keyboard.press(self.keys["SWIPE"])
+        self.assertTrue(self.keyboard.wait_for_swipe_decoder(10.0))
+        self.assertIs(self.keyboard.swipe_decoder, decoder)  # Same vocabulary, no rebuild
+
+        self.keyboard.predictor.learn("zyxw")
+        built_on = []
+        with patch("modules.virtual_keyboard.SwipeDecoder", side_effect=lambda *args, **kwargs: built_on.append(
+                threading.current_thread().name) or decoder):
+            self.keyboard.press(self.keys["SWIPE"])
+            self.keyboard.press(self.keys["SWIPE"])
+            self.keyboard.wait_for_swipe_decoder(10.0)
+        self.assertEqual(built_on, ["swipe-decoder"])
+
+    def test_swipe_is_a_tap_until_the_decoder_is_ready(self):
+        self.keyboard.swipe_decoder = None
+        self.swipe(*"WORLD")
+        self.assertEqual(self.keyboard.text, "w")
+
+
+class TestKeyboardFocus(unittest.TestCase):
+    def test_typing_scans_for_the_target_once_and_follows_config_changes(self):
+        desktop = FakeWindowSystem()
+        notepad = desktop.start_process(42, "notepad.exe", ["Untitled - Notepad"])[0]
+        code = desktop.start_process(43, "Code.exe", ["Visual Studio Code"])[0]
+        keyboard = VirtualKeyboard(FakeTracker(), "notepad", show_window=False, focus=FocusService(backend=desktop))
+        for key in "hello":
+            keyboard._type_key(key)
+        self.assertEqual(desktop.foreground(), notepad)
+        self.assertEqual(desktop.process_scans, 1)
+        keyboard.set_target_app("code")
+        keyboard._type_key("x")
+        self.assertEqual(desktop.foreground(), code)
+
+
+if __name__ == "__main__":
+    unittest.main()
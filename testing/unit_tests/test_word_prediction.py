@@ -0,0 +1,62 @@
+import unittest
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "script"))
+)
+
+from modules.word_prediction import WordPredictor
+
+
+class TestWordPredictor(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.words_path = os.path.join(self.tmp.name, "words.txt")
+        with open(self.words_path, "w") as file:
+            file.write("the\nthat\nthis\nthey\nthere\nhello\nhelp\n")
+        self.history_path = os.path.join(self.tmp.name, "history.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def predictor(self, **kwargs):
+        return WordPredictor(self.words_path, self.history_path, **kwargs)
+
+    def test_completions_are_ranked_by_frequency(self):
+        predictor = self.predictor()
+        self.assertEqual(predictor.suggest("th"), ["the", "that", "this"])
+        self.assertEqual(predictor.suggest("HEL"), ["hello", "help"])
+        self.assertEqual(predictor.suggest("xyz"), [])
+
+    def test_typed_words_are_boosted_and_added(self):
+        predictor = self.predictor()
+        for _ in range(3):
+            predictor.learn("there")
+        predictor.learn("theatre")
+        self.assertEqual(predictor.suggest("the"), ["the", "there", "they"])
+        self.assertIn("theatre", predictor.suggest("thea"))
+        predictor.learn("a")  # Too short to be worth completing
+        self.assertNotIn("a", predictor.scores)
+
+    def test_history_survives_a_restart(self):
+        predictor = self.predictor()
+        for _ in range(5):
+            predictor.learn("help")
+        predictor.save_history()
+        self.assertEqual(self.predictor().suggest("hel"), ["help", "hello"])
+
+    def test_bundled_list_lookup_is_fast(self):
+        predictor = WordPredictor(history_path=None)
+        self.assertGreater(len(predictor.scores), 500)
+        prefixes = ["t", "th", "wor", "keyb", "q", "zz"] * 500
+        start = time.perf_counter()
+        for prefix in prefixes:
+            predictor.suggest(prefix)
+        self.assertLess((time.perf_counter() - start) / len(prefixes), 0.001)
+
+
+if __name__ == "__main__":
+    unittest.main()